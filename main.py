@@ -22,114 +22,345 @@
 """
 
 import os
+import signal
+import sys
+import threading
+from dataclasses import asdict
 from datetime import datetime
+from typing import List
 from dotenv import load_dotenv
-from src.application.use_cases.fetch_news_use_case import FetchNewsUseCase
-from src.infrastructure.clients.news_api_client import NewsAPIClient
-from src.infrastructure.repositories.excel_news_repository import ExcelNewsRepository
-from src.domain.services.news_analyzer import NewsAnalyzer
-from src.infrastructure.logging.logger import logger
+from src.infrastructure.logging.logger import logger, setup_logger
+from src.infrastructure.metrics.metrics import metrics
+
+# Os modulos de I/O (requests, tenacity, openpyxl...) sao importados dentro de process()
+# e process_batch(): o --check-config e as execucoes que falham na validacao nao pagam esse custo
+
+INT_VARS = ['MONTHS_TO_SEARCH', 'BATCH_WORKERS', 'MAX_CONCURRENT_REQUESTS', 'API_RATE_BURST', 'ANALYSIS_PROCESSES',
+            'HEALTH_PORT', 'DAEMON_MAX_CYCLES', 'EXCEL_SHARD_ROWS', 'EXCEL_SHARD_PROCESSES']
+
+def validate_config() -> List[str]:
+    """Valida as variaveis do .env (ja carregado) sem abrir conexoes nem arquivos de saida."""
+    from src.infrastructure.repositories.repository_factory import (EXCEL_SHARD_LAYOUTS, EXCEL_SHARD_MODES,
+                                                                    parse_output_formats)
+
+    errors = []
+    # No modo batch a busca vem do arquivo de jobs
+    if os.getenv('JOBS_FILE'):
+        required_vars = ['API_KEY', 'API_URL']
+    else:
+        required_vars = ['API_KEY', 'API_URL', 'SEARCH_PHRASE', 'CATEGORIES']
+    missing_vars = [var for var in required_vars if not os.getenv(var)]
+    if missing_vars:
+        errors.append(f"Variaveis de ambiente ausentes: {', '.join(missing_vars)}")
+    for var in INT_VARS:
+        value = os.getenv(var)
+        if value and not value.strip().lstrip('-').isdigit():
+            errors.append(f"{var} deve ser um numero inteiro: {value}")
+    try:
+        parse_output_formats(os.getenv('OUTPUT_FORMATS'))
+    except ValueError as e:
+        errors.append(str(e))
+    shard_by = os.getenv('EXCEL_SHARD_BY', '').strip().lower()
+    if shard_by not in ('', 'none') + EXCEL_SHARD_MODES:
+        errors.append(f"EXCEL_SHARD_BY invalido: {shard_by} (use {', '.join(EXCEL_SHARD_MODES)})")
+    shard_layout = os.getenv('EXCEL_SHARD_LAYOUT', 'workbooks').strip().lower()
+    if shard_layout not in EXCEL_SHARD_LAYOUTS:
+        errors.append(f"EXCEL_SHARD_LAYOUT invalido: {shard_layout} (use {', '.join(EXCEL_SHARD_LAYOUTS)})")
+    if os.getenv('JOBS_FILE'):
+        errors.extend(_validate_jobs_file(os.getenv('JOBS_FILE')))
+    return errors
+
+def _validate_jobs_file(path: str) -> List[str]:
+    from src.application.use_cases.batch_fetch_news_use_case import load_jobs
+    from src.infrastructure.repositories.repository_factory import parse_output_formats
+
+    try:
+        jobs = load_jobs(path)
+        for job in jobs:
+            parse_output_formats(job.output_formats)
+    except (OSError, ValueError, TypeError, AttributeError) as e:
+        return [f"JOBS_FILE invalido ({path}): {str(e)}"]
+    return []
+
+def check_config() -> int:
+    """Modo --check-config: valida o .env e sai (0 = ok, 1 = erros), sem executar a extracao."""
+    load_dotenv()
+    errors = validate_config()
+    for error in errors:
+        print(f"ERRO: {error}", file=sys.stderr)
+    if not errors:
+        print("Configuracao valida")
+    return 1 if errors else 0
 
 class NewsExtractorFramework:
-    def __init__(self):
+    def __init__(self, daemon: bool = False):
         self.logger = logger
+        # Modo servico (--daemon ou DAEMON_MODE): o processo fica de pe repetindo as buscas
+        self.daemon = daemon
         self.state = {
             'start_time': None,
             'end_time': None,
             'news_count': 0,
+            'jobs': [],
             'errors': []
         }
+        # Erros anteriores aos ciclos do modo servico, mantidos no relatorio de cada ciclo
+        self._startup_errors: List[str] = []
 
     def initialize(self):
         """Fase de inicializacao do framework."""
         try:
+            self.state['start_time'] = datetime.now()
+            
+            # Carrega variaveis de ambiente (antes do logger, que le LOG_DIR e LOG_LEVEL)
+            load_dotenv()
+            setup_logger()
+            
             self.logger.info("DESAFIO TECNICO - Extrator de Noticias")
             self.logger.info("Desenvolvido por: Bruno Cosmo\n")
             
             self.logger.info("Iniciando extracao de noticias...")
-            self.state['start_time'] = datetime.now()
-            
-            # Carrega variaveis de ambiente
-            load_dotenv()
             
             # Loga as configuracoes carregadas (exceto a API key por seguranca)
             self.logger.info("Configuracoes carregadas:")
-            self.logger.info(f"API_URL: {os.getenv('API_URL')}")
-            self.logger.info(f"IMAGE_BASE_URL: {os.getenv('IMAGE_BASE_URL')}")
-            self.logger.info(f"EXCEL_PATH: {os.getenv('EXCEL_PATH')}")
-            self.logger.info(f"IMAGES_DIR: {os.getenv('IMAGES_DIR')}")
-            self.logger.info(f"LOG_DIR: {os.getenv('LOG_DIR')}")
-            self.logger.info(f"SEARCH_PHRASE: {os.getenv('SEARCH_PHRASE')}")
-            self.logger.info(f"CATEGORIES: {os.getenv('CATEGORIES')}")
-            self.logger.info(f"MONTHS_TO_SEARCH: {os.getenv('MONTHS_TO_SEARCH')}")
+            self.logger.info("API_URL: %s", os.getenv('API_URL'))
+            self.logger.info("IMAGE_BASE_URL: %s", os.getenv('IMAGE_BASE_URL'))
+            self.logger.info("EXCEL_PATH: %s", os.getenv('EXCEL_PATH'))
+            self.logger.info("OUTPUT_FORMATS: %s", os.getenv('OUTPUT_FORMATS', 'excel'))
+            self.logger.info("IMAGES_DIR: %s", os.getenv('IMAGES_DIR'))
+            self.logger.info("LOG_DIR: %s", os.getenv('LOG_DIR'))
+            self.logger.info("SEARCH_PHRASE: %s", os.getenv('SEARCH_PHRASE'))
+            self.logger.info("CATEGORIES: %s", os.getenv('CATEGORIES'))
+            self.logger.info("MONTHS_TO_SEARCH: %s", os.getenv('MONTHS_TO_SEARCH'))
+            self.logger.info("EXTRA_PHRASES: %s", os.getenv('EXTRA_PHRASES', ''))
+            self.logger.info("INCREMENTAL: %s", os.getenv('INCREMENTAL', 'false'))
+            self.logger.info("JOBS_FILE: %s", os.getenv('JOBS_FILE', ''))
             
             # Valida configuracoes necessarias
-            required_vars = ['API_KEY', 'API_URL', 'SEARCH_PHRASE', 'CATEGORIES']
-            missing_vars = [var for var in required_vars if not os.getenv(var)]
-            
-            if missing_vars:
-                raise ValueError(f"Variaveis de ambiente ausentes: {', '.join(missing_vars)}")
+            errors = validate_config()
+            if errors:
+                raise ValueError('; '.join(errors))
             
             self.logger.info("Configuracoes carregadas com sucesso")
             
         except Exception as e:
-            self.logger.error(f"Erro na inicializacao: {str(e)}")
+            self.logger.error("Erro na inicializacao: %s", e)
             self.state['errors'].append(f"Inicializacao: {str(e)}")
             raise
 
     def process(self):
         """Fase de processamento principal."""
+        if self.daemon or os.getenv('DAEMON_MODE', 'false').lower() in ('1', 'true', 'yes', 'sim'):
+            self.process_daemon()
+            return
+        if os.getenv('JOBS_FILE'):
+            self.process_batch()
+            return
+        from src.application.use_cases.fetch_news_use_case import FetchNewsUseCase
+        from src.infrastructure.cache.image_cache import ImageCache
+        from src.infrastructure.checkpoints.checkpoint_store import CheckpointStore
+        from src.infrastructure.clients.image_downloader import ImageDownloader
+        from src.infrastructure.repositories.repository_factory import create_news_repository, parse_output_formats
+
+        image_downloader = None
         try:
             # Configura dependencias
             search_phrase = os.getenv('SEARCH_PHRASE', '')
             categories = os.getenv('CATEGORIES', '').split(',') if os.getenv('CATEGORIES') else []
             months_to_search = int(os.getenv('MONTHS_TO_SEARCH', '2'))
+            incremental = os.getenv('INCREMENTAL', 'false').lower() in ('1', 'true', 'yes', 'sim')
+            extra_phrases = [phrase.strip() for phrase in os.getenv('EXTRA_PHRASES', '').split(',') if phrase.strip()]
             
-            api_client = NewsAPIClient(
-                search_phrase=search_phrase,
-                categories=categories,
-                months_to_search=months_to_search
-            )
             excel_path = os.getenv('EXCEL_PATH', 'news_results.xlsx')
             images_dir = os.getenv('IMAGES_DIR', 'images')
-            repository = ExcelNewsRepository(
+            # Criado aqui para ser fechado no fim (pool de threads, sessao HTTP e indice do cache de imagens)
+            image_downloader = ImageDownloader(images_dir, image_cache=ImageCache.from_env())
+            repository = create_news_repository(
+                output_formats=parse_output_formats(os.getenv('OUTPUT_FORMATS')),
                 excel_path=excel_path,
-                images_dir=images_dir
+                images_dir=images_dir,
+                image_downloader=image_downloader,
+                phrase_columns=extra_phrases
             )
-            analyzer = NewsAnalyzer()
+            checkpoint_store = CheckpointStore(os.getenv('CHECKPOINT_PATH', os.path.join('.cache', 'checkpoints.json')))
             
             # Cria e executa o caso de uso
-            use_case = FetchNewsUseCase(repository)
-            news_list = use_case.execute(
+            use_case = FetchNewsUseCase(repository, checkpoint_store)
+            news_count = use_case.execute(
                 search_phrase=search_phrase,
                 categories=categories,
-                months_to_search=months_to_search
+                months_to_search=months_to_search,
+                incremental=incremental,
+                extra_phrases=extra_phrases
             )
             
-            # Se news_list for None, evita erro de len
-            if news_list is not None:
-                self.state['news_count'] = len(news_list)
-                self.logger.info(f"Processamento concluido. {len(news_list)} noticias extraidas")
+            self.state['news_count'] = news_count
+            if news_count:
+                self.logger.info("Processamento concluido. %s noticias extraidas", news_count)
             else:
-                self.state['news_count'] = 0
                 self.logger.info("Processamento concluido. Nenhuma noticia extraida")
             
         except Exception as e:
-            self.logger.error(f"Erro no processamento: {str(e)}")
+            self.logger.error("Erro no processamento: %s", e)
             self.state['errors'].append(f"Processamento: {str(e)}")
             raise
+        finally:
+            if image_downloader:
+                image_downloader.close()
+
+    def process_batch(self):
+        """Modo batch: varias buscas do JOBS_FILE num unico processo, com sessao, limitador e caches compartilhados."""
+        from src.application.use_cases.batch_fetch_news_use_case import load_jobs
+        from src.infrastructure.clients.shared_clients import SharedClients
+
+        shared = None
+        try:
+            jobs = self._load_jobs_file(load_jobs)
+            parallel_jobs = max(1, int(os.getenv('BATCH_WORKERS', '2')))
+            images_dir = os.getenv('IMAGES_DIR', 'images')
+            self.logger.info("Modo batch: %s job(s), %s em paralelo", len(jobs), parallel_jobs)
+            
+            shared = SharedClients.from_env(images_dir, parallel_jobs)
+            use_case = self._batch_use_case(shared, images_dir, parallel_jobs)
+            results = use_case.execute(jobs)
+            
+            self.state['jobs'] = results
+            self.state['news_count'] = sum(result.news_count for result in results)
+            for result in results:
+                if result.error:
+                    self.state['errors'].append(f"Job {result.name}: {result.error}")
+            self.logger.info("Processamento concluido. %s noticias extraidas em %s job(s)",
+                             self.state['news_count'], len(results))
+            
+        except Exception as e:
+            self.logger.error("Erro no processamento: %s", e)
+            self.state['errors'].append(f"Processamento: {str(e)}")
+            raise
+        finally:
+            if shared:
+                shared.close()
+
+    def process_daemon(self):
+        """Modo servico: repete as buscas a cada POLL_INTERVAL_SECONDS no mesmo processo, com /health local."""
+        from src.application.use_cases.batch_fetch_news_use_case import BatchJob, load_jobs
+        from src.application.use_cases.poll_news_use_case import PollNewsUseCase
+        from src.infrastructure.clients.shared_clients import SharedClients
+        from src.infrastructure.health.health_server import HealthServer
+
+        shared = None
+        health = None
+        try:
+            interval = float(os.getenv('POLL_INTERVAL_SECONDS', '900'))
+            if os.getenv('JOBS_FILE'):
+                jobs = self._load_jobs_file(load_jobs)
+            else:
+                jobs = [BatchJob(
+                    name='default',
+                    search_phrase=os.getenv('SEARCH_PHRASE', ''),
+                    categories=os.getenv('CATEGORIES', '').split(',') if os.getenv('CATEGORIES') else [],
+                    months_to_search=int(os.getenv('MONTHS_TO_SEARCH', '2')),
+                    output=os.getenv('EXCEL_PATH', 'news_results.xlsx'),
+                    output_formats=os.getenv('OUTPUT_FORMATS'),
+                    extra_phrases=[phrase.strip() for phrase in os.getenv('EXTRA_PHRASES', '').split(',') if phrase.strip()]
+                )]
+            # Cada ciclo busca so o delta desde o checkpoint e mescla com a saida anterior
+            for job in jobs:
+                job.incremental = True
+            parallel_jobs = max(1, int(os.getenv('BATCH_WORKERS', '2')))
+            images_dir = os.getenv('IMAGES_DIR', 'images')
+            self.logger.info("Modo servico: %s job(s) a cada %.0fs", len(jobs), interval)
+            
+            # Sessao, rate limiter e caches vivem enquanto o processo estiver de pe
+            shared = SharedClients.from_env(images_dir, parallel_jobs)
+            if shared.response_cache:
+                # Paginas do periodo em aberto nao podem ficar em cache alem de um ciclo
+                shared.response_cache.ttl_seconds = min(shared.response_cache.ttl_seconds, interval)
+            self._startup_errors = list(self.state['errors'])
+            service = PollNewsUseCase(jobs, self._batch_use_case(shared, images_dir, parallel_jobs), interval,
+                                      on_cycle=self._on_cycle)
+            
+            health_port = os.getenv('HEALTH_PORT', '8081')
+            if health_port:
+                health = HealthServer(service.status, os.getenv('HEALTH_HOST', '127.0.0.1'), int(health_port)).start()
+                self.logger.info("Health check em %s/health", health.url)
+            self._stop_on_signals(service)
+            service.run(max_cycles=int(os.getenv('DAEMON_MAX_CYCLES', '0')) or None)
+            self.logger.info("Modo servico encerrado apos %s ciclo(s)", service.status()['cycles'])
+            
+        except Exception as e:
+            self.logger.error("Erro no processamento: %s", e)
+            self.state['errors'].append(f"Processamento: {str(e)}")
+            raise
+        finally:
+            if health:
+                health.stop()
+            if shared:
+                shared.close()
+
+    def _on_cycle(self, cycle):
+        """Atualiza o estado e exporta as metricas ao fim de cada ciclo do modo servico."""
+        self.state['jobs'] = cycle.jobs
+        self.state['news_count'] += cycle.news_count
+        # Copia: a lista do ciclo nao e compartilhada com o estado
+        self.state['errors'] = self._startup_errors + list(cycle.errors)
+        self.state['end_time'] = datetime.now()
+        self.export_metrics(self.state['end_time'] - self.state['start_time'])
+
+    @staticmethod
+    def _stop_on_signals(service):
+        # SIGTERM (docker stop) e Ctrl+C terminam o ciclo em andamento e encerram o servico
+        if threading.current_thread() is not threading.main_thread():
+            return
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, lambda *_: service.stop())
+
+    @staticmethod
+    def _load_jobs_file(load_jobs):
+        return load_jobs(os.getenv('JOBS_FILE'), defaults={
+            'categories': os.getenv('CATEGORIES', ''),
+            'months_to_search': int(os.getenv('MONTHS_TO_SEARCH', '2')),
+            'output_formats': os.getenv('OUTPUT_FORMATS'),
+            'incremental': os.getenv('INCREMENTAL', 'false').lower() in ('1', 'true', 'yes', 'sim')
+        })
+
+    @staticmethod
+    def _batch_use_case(shared, images_dir, parallel_jobs):
+        """Caso de uso de varias buscas usando os recursos compartilhados."""
+        from src.application.use_cases.batch_fetch_news_use_case import BatchFetchNewsUseCase
+        from src.infrastructure.checkpoints.checkpoint_store import CheckpointStore
+        from src.infrastructure.repositories.repository_factory import (create_news_repository, parse_output_formats,
+                                                                        path_variables_set)
+
+        # Com JOBS_FILE cada job deriva os caminhos dos outros formatos da propria saida
+        env_paths = not os.getenv('JOBS_FILE')
+        if not env_paths and path_variables_set():
+            logger.warning("%s ignorado(s) no modo batch: os caminhos vem do 'output' de cada job",
+                           ', '.join(path_variables_set()))
+        return BatchFetchNewsUseCase(
+            repository_factory=lambda job: create_news_repository(
+                output_formats=parse_output_formats(job.output_formats),
+                excel_path=job.output,
+                images_dir=images_dir,
+                image_downloader=shared.image_downloader,
+                phrase_columns=job.extra_phrases,
+                env_paths=env_paths
+            ),
+            checkpoint_store=CheckpointStore(os.getenv('CHECKPOINT_PATH', os.path.join('.cache', 'checkpoints.json'))),
+            client_options=shared.client_options(),
+            max_workers=parallel_jobs
+        )
 
     def handle_exception(self, exception):
         """Tratamento de excecoes."""
         try:
-            self.logger.error(f"Excecao capturada: {str(exception)}")
+            self.logger.error("Excecao capturada: %s", exception)
             self.state['errors'].append(f"Excecao: {str(exception)}")
             
             # Aqui voce pode implementar logicas de recuperacao
             # Por exemplo, tentar novamente com configuracoes diferentes
             
         except Exception as e:
-            self.logger.error(f"Erro no tratamento de excecao: {str(e)}")
+            self.logger.error("Erro no tratamento de excecao: %s", e)
             self.state['errors'].append(f"Tratamento de excecao: {str(e)}")
 
     def finalize(self):
@@ -140,18 +371,54 @@ class NewsExtractorFramework:
             
             # Gera relatorio de execucao
             self.logger.info("=== Relatorio de Execucao ===")
-            self.logger.info(f"Duracao: {duration}")
-            self.logger.info(f"Noticias processadas: {self.state['news_count']}")
+            self.logger.info("Duracao: %s", duration)
+            self.logger.info("Noticias processadas: %s", self.state['news_count'])
+            for job in self.state['jobs']:
+                status = f"erro: {job.error}" if job.error else "ok"
+                self.logger.info("Job %s: %s noticias em %.1fs (%s)",
+                                 job.name, job.news_count, job.duration_seconds, status)
+            
+            for stage, seconds in metrics.snapshot()['stage_seconds'].items():
+                self.logger.info("Etapa %s: %.2fs", stage, seconds)
             
             if self.state['errors']:
                 self.logger.warning("=== Erros Encontrados ===")
                 for error in self.state['errors']:
-                    self.logger.warning(f"- {error}")
+                    self.logger.warning("- %s", error)
+            
+            self.export_metrics(duration)
             
             self.logger.info("Extracao de noticias finalizada")
             
         except Exception as e:
-            self.logger.error(f"Erro na finalizacao: {str(e)}")
+            self.logger.error("Erro na finalizacao: %s", e)
+
+    def export_metrics(self, duration):
+        """Exporta as metricas da execucao (textfile do Prometheus e relatorio JSON) ao lado da saida."""
+        output_base = os.path.splitext(os.getenv('EXCEL_PATH', 'news_results.xlsx'))[0]
+        json_path = os.getenv('METRICS_JSON_PATH', f"{output_base}.metrics.json")
+        prom_path = os.getenv('METRICS_PROM_PATH', f"{output_base}.prom")
+        try:
+            if json_path:
+                metrics.write_json(json_path, {
+                    'start_time': self.state['start_time'],
+                    'end_time': self.state['end_time'],
+                    'duration_seconds': duration.total_seconds(),
+                    'news_count': self.state['news_count'],
+                    'jobs': [asdict(job) for job in self.state['jobs']],
+                    'errors': self.state['errors']
+                })
+                self.logger.info("Relatorio de metricas salvo em: %s", json_path)
+            if prom_path:
+                metrics.write_prometheus(prom_path, {
+                    'run_duration_seconds': duration.total_seconds(),
+                    'run_news_count': self.state['news_count'],
+                    'run_errors': len(self.state['errors']),
+                    'run_end_timestamp_seconds': self.state['end_time'].timestamp(),
+                    'run_success': 0 if self.state['errors'] else 1
+                })
+        except Exception as e:
+            self.logger.error("Erro ao exportar metricas: %s", e)
 
     def run(self):
         """Método principal que executa o fluxo completo."""
@@ -164,5 +431,7 @@ class NewsExtractorFramework:
             self.finalize()
 
 if __name__ == "__main__":
-    framework = NewsExtractorFramework()
+    if '--check-config' in sys.argv[1:]:
+        sys.exit(check_config())
+    framework = NewsExtractorFramework(daemon='--daemon' in sys.argv[1:])
     framework.run() 
\ No newline at end of file
@@ -0,0 +1,132 @@
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, List, Optional
+from src.domain.repositories.news_repository import NewsRepository
+from src.infrastructure.checkpoints.checkpoint_store import CheckpointStore
+from src.infrastructure.logging.logger import logger
+from src.infrastructure.metrics.metrics import metrics, submit_in_context
+
+@dataclass
+class BatchJob:
+    name: str
+    search_phrase: str
+    categories: List[str]
+    months_to_search: int
+    output: str
+    output_formats: Optional[str] = None
+    extra_phrases: List[str] = field(default_factory=list)
+    incremental: bool = False
+
+    @classmethod
+    def from_dict(cls, entry: Dict, index: int, defaults: Dict) -> 'BatchJob':
+        if not entry.get('search_phrase'):
+            raise ValueError(f"Job {index}: 'search_phrase' e obrigatorio")
+        name = entry.get('name') or f"job-{index}"
+        return cls(
+            name=name,
+            search_phrase=entry['search_phrase'],
+            categories=_as_list(entry.get('categories', defaults.get('categories', []))),
+            months_to_search=int(entry.get('months_to_search', defaults.get('months_to_search', 2))),
+            output=entry.get('output') or f"{name}.xlsx",
+            output_formats=entry.get('output_formats', defaults.get('output_formats')),
+            extra_phrases=_as_list(entry.get('extra_phrases', [])),
+            incremental=bool(entry.get('incremental', defaults.get('incremental', False)))
+        )
+
+
+@dataclass
+class JobResult:
+    name: str
+    output: str
+    news_count: int = 0
+    duration_seconds: float = 0.0
+    error: Optional[str] = None
+    metrics: Dict = field(default_factory=dict)  # contadores e tempos por etapa so deste job
+
+
+def _as_list(value) -> List[str]:
+    """Aceita lista ou texto separado por virgulas."""
+    if isinstance(value, str):
+        value = value.split(',')
+    return [item.strip() for item in value or [] if item.strip()]
+
+def load_jobs(path: str, defaults: Optional[Dict] = None) -> List[BatchJob]:
+    """Le o arquivo de jobs: lista JSON ou objeto com a chave 'jobs'."""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    entries = data.get('jobs', []) if isinstance(data, dict) else data
+    jobs = [BatchJob.from_dict(entry, index, defaults or {}) for index, entry in enumerate(entries, start=1)]
+    names = [job.name for job in jobs]
+    duplicated = sorted({name for name in names if names.count(name) > 1})
+    if duplicated:
+        raise ValueError(f"Jobs com nome repetido: {', '.join(duplicated)}")
+    return jobs
+
+def report_path_for(job: 'BatchJob') -> str:
+    """Relatorio na pasta da saida do job, nomeado pelo job (nomes sao unicos)."""
+    return os.path.join(os.path.dirname(job.output), f"{job.name}.report.json")
+
+
+class BatchFetchNewsUseCase:
+    """Executa varias buscas no mesmo processo, em paralelo, com sessao, rate limiter e caches compartilhados."""
+
+    def __init__(self, repository_factory: Callable[[BatchJob], NewsRepository],
+                 checkpoint_store: Optional[CheckpointStore] = None, client_options: Optional[Dict] = None,
+                 max_workers: int = 1):
+        self.repository_factory = repository_factory
+        self.checkpoint_store = checkpoint_store
+        self.client_options = client_options or {}
+        self.max_workers = max(1, max_workers)
+
+    def execute(self, jobs: List[BatchJob]) -> List[JobResult]:
+        """Roda todos os jobs; a falha de um job nao interrompe os demais."""
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='job') as executor:
+            # Cada job roda com o contexto de quem chamou (ex.: escopo de metricas do ciclo)
+            futures = [submit_in_context(executor, self._run_job, job) for job in jobs]
+            return [future.result() for future in futures]
+
+    def _run_job(self, job: BatchJob) -> JobResult:
+        # Os jobs rodam em paralelo: cada um mede no proprio escopo, sem misturar com os demais
+        with metrics.scope() as job_metrics:
+            result = self._execute_job(job)
+        result.metrics = job_metrics.snapshot()
+        self._write_report(job, result)
+        return result
+
+    def _execute_job(self, job: BatchJob) -> JobResult:
+        # Importado aqui: load_jobs (usado no --check-config) nao precisa do cliente HTTP
+        from src.application.use_cases.fetch_news_use_case import FetchNewsUseCase
+
+        logger.info("Job %s: iniciando busca por '%s'", job.name, job.search_phrase)
+        result = JobResult(job.name, job.output)
+        start = time.perf_counter()
+        try:
+            use_case = FetchNewsUseCase(self.repository_factory(job), self.checkpoint_store, self.client_options,
+                                        checkpoint_scope=job.name)
+            result.news_count = use_case.execute(
+                search_phrase=job.search_phrase,
+                categories=job.categories,
+                months_to_search=job.months_to_search,
+                incremental=job.incremental,
+                extra_phrases=job.extra_phrases
+            )
+            logger.info("Job %s: %s noticias extraidas", job.name, result.news_count)
+        except Exception as e:
+            logger.error("Job %s: erro no processamento: %s", job.name, e)
+            result.error = str(e)
+        result.duration_seconds = round(time.perf_counter() - start, 3)
+        return result
+
+    @staticmethod
+    def _write_report(job: BatchJob, result: JobResult) -> None:
+        """Relatorio do job ao lado da saida dele."""
+        try:
+            path = report_path_for(job)
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'job': asdict(job), 'result': asdict(result)}, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            logger.error("Job %s: erro ao salvar relatorio: %s", job.name, e)
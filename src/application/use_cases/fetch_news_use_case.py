@@ -1,16 +1,85 @@
-from typing import List
+from typing import Dict, Iterable, Iterator, List, Optional
 from src.domain.entities.news import News
 from src.domain.repositories.news_repository import NewsRepository
+from src.infrastructure.checkpoints.checkpoint_store import CheckpointStore, CheckpointTracker
 from src.infrastructure.clients.news_api_client import NewsAPIClient
+from src.infrastructure.logging.logger import logger
+from src.infrastructure.metrics.metrics import metrics
 
 class FetchNewsUseCase:
-    def __init__(self, repository: NewsRepository):
+    """Pipeline em streaming: paginas -> artigos -> analise -> imagens -> saida, com memoria limitada."""
+
+    def __init__(self, repository: NewsRepository, checkpoint_store: Optional[CheckpointStore] = None,
+                 client_options: Optional[Dict] = None, checkpoint_scope: str = ''):
         self.repository = repository
+        self.checkpoint_store = checkpoint_store
+        # O checkpoint descreve a saida deste repositorio: jobs com a mesma busca nao podem dividi-lo
+        self.checkpoint_scope = checkpoint_scope
+        # Argumentos extras do NewsAPIClient (ex.: sessao e caches compartilhados no modo batch)
+        self.client_options = client_options or {}
+
+    def execute(self, search_phrase: str, categories: List[str], months_to_search: int, incremental: bool = False,
+                extra_phrases: Optional[List[str]] = None) -> int:
+        """Executa a extracao e retorna a quantidade de noticias gravadas."""
+        if incremental and self.checkpoint_store:
+            return self._execute_incremental(search_phrase, categories, months_to_search, extra_phrases)
+
+        api_client = NewsAPIClient(search_phrase, categories, months_to_search, extra_phrases=extra_phrases,
+                                   **self.client_options)
+        # As noticias vao para a saida (inclui download das imagens) enquanto as proximas paginas sao buscadas
+        return self._stream(api_client.iter_news(), merge=False)
+
+    def _execute_incremental(self, search_phrase: str, categories: List[str], months_to_search: int,
+                             extra_phrases: Optional[List[str]] = None) -> int:
+        """Busca apenas o delta desde o ultimo checkpoint e mescla com a saida existente."""
+        key = CheckpointStore.make_key(search_phrase, categories, self.checkpoint_scope)
+        checkpoint = self.checkpoint_store.load(key)
+        if checkpoint.high_water_mark:
+            logger.info("Modo incremental: buscando noticias a partir de %s", checkpoint.high_water_mark.isoformat())
+        api_client = NewsAPIClient(
+            search_phrase,
+            categories,
+            months_to_search,
+            since=checkpoint.high_water_mark,
+            seen_ids=checkpoint.seen_ids,
+            extra_phrases=extra_phrases,
+            **self.client_options
+        )
+        tracker = CheckpointTracker(checkpoint)
+        count = self._stream(self._complete_news(api_client), merge=True, tracker=tracker)
+        # O checkpoint so avanca depois que a saida foi publicada
+        self.checkpoint_store.save(key, tracker.result())
+        return count
+
+    @staticmethod
+    def _complete_news(api_client: NewsAPIClient) -> Iterator[News]:
+        """Noticias do cliente; se alguma pagina ou janela falhou, a execucao e abortada no fim.
+
+        Com paginas faltando, o checkpoint passaria por artigos nunca buscados e as proximas
+        execucoes nao voltariam a eles: a saida anterior e o checkpoint ficam como estavam.
+        """
+        yield from api_client.iter_news()
+        if api_client.failed_requests:
+            raise RuntimeError(f"Busca incompleta: {api_client.failed_requests} pagina(s) ou janela(s) falharam; "
+                               "checkpoint mantido para a proxima execucao")
+
+    def _stream(self, news_iter: Iterable[News], merge: bool, tracker: Optional[CheckpointTracker] = None) -> int:
+        counter = {'count': 0}
+
+        def observed() -> Iterator[News]:
+            for news in news_iter:
+                counter['count'] += 1
+                if tracker:
+                    tracker.observe(news)
+                yield news
 
-    def execute(self, search_phrase: str, categories: List[str], months_to_search: int) -> list[News]:
-        api_client = NewsAPIClient(search_phrase, categories, months_to_search)
-        news_list = api_client.fetch_news()
-        
-        # Salvar notícias (inclui download assíncrono de imagens)
-        self.repository.save_news(news_list)
-        return news_list 
\ No newline at end of file
+        self.repository.open(merge)
+        try:
+            with metrics.stage('pipeline'):
+                self.repository.append(observed())
+            with metrics.stage('save'):
+                self.repository.close()
+        except Exception:
+            self.repository.abort()
+            raise
+        return counter['count']
@@ -0,0 +1,113 @@
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+from src.application.use_cases.batch_fetch_news_use_case import BatchFetchNewsUseCase, BatchJob, JobResult
+from src.infrastructure.logging.logger import logger
+from src.infrastructure.metrics.metrics import metrics
+
+@dataclass
+class CycleResult:
+    number: int
+    started_at: str
+    duration_seconds: float = 0.0
+    news_count: int = 0
+    jobs: List[JobResult] = field(default_factory=list)
+
+    @property
+    def errors(self) -> List[str]:
+        return [f"Job {job.name}: {job.error}" for job in self.jobs if job.error]
+
+
+class PollNewsUseCase:
+    """Modo servico: roda os mesmos jobs a cada intervalo num unico processo.
+
+    A sessao HTTP, o rate limiter e os caches vivem no BatchFetchNewsUseCase recebido,
+    entao cada ciclo so paga pelas noticias novas (os jobs devem ser incrementais).
+    """
+
+    MAX_CONSECUTIVE_FAILURES = 3  # ciclos seguidos com erro ate o /health responder 503
+
+    def __init__(self, jobs: List[BatchJob], batch_use_case: BatchFetchNewsUseCase, interval_seconds: float,
+                 on_cycle: Optional[Callable[[CycleResult], None]] = None):
+        self.jobs = jobs
+        self.batch_use_case = batch_use_case
+        self.interval_seconds = max(0.0, interval_seconds)
+        self.on_cycle = on_cycle
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._status = {
+            'state': 'starting',
+            'started_at': datetime.now().isoformat(timespec='seconds'),
+            'cycles': 0,
+            'news_count': 0,
+            'consecutive_failures': 0,
+            'next_run_at': None,
+            'last_cycle': None
+        }
+
+    def run(self, max_cycles: Optional[int] = None) -> None:
+        """Roda ciclos ate stop() (ou `max_cycles`); o intervalo conta do inicio de cada ciclo."""
+        cycles = 0
+        while not self._stop.is_set():
+            start = time.monotonic()
+            self.run_cycle()
+            cycles += 1
+            if max_cycles is not None and cycles >= max_cycles:
+                break
+            # Ciclo mais longo que o intervalo: o proximo comeca logo em seguida
+            delay = max(0.0, self.interval_seconds - (time.monotonic() - start))
+            self._update(state='idle', next_run_at=datetime.fromtimestamp(time.time() + delay).isoformat(timespec='seconds'))
+            self._stop.wait(delay)
+        self._update(state='stopped', next_run_at=None)
+
+    def run_cycle(self) -> CycleResult:
+        number = self._status['cycles'] + 1
+        # As metricas (exportadas a cada ciclo e servidas em /metrics) cobrem so o ciclo atual
+        metrics.reset()
+        self._update(state='running', next_run_at=None)
+        logger.info("Ciclo %s: %s job(s)", number, len(self.jobs))
+        cycle = CycleResult(number, datetime.now().isoformat(timespec='seconds'))
+        start = time.perf_counter()
+        try:
+            cycle.jobs = self.batch_use_case.execute(self.jobs)
+        except Exception as e:
+            logger.error("Ciclo %s: erro inesperado: %s", number, e)
+            cycle.jobs = [JobResult('ciclo', '', error=str(e))]
+        cycle.duration_seconds = round(time.perf_counter() - start, 3)
+        cycle.news_count = sum(job.news_count for job in cycle.jobs)
+        logger.info("Ciclo %s: %s noticias novas em %.1fs", number, cycle.news_count, cycle.duration_seconds)
+
+        with self._lock:
+            self._status['cycles'] = number
+            self._status['news_count'] += cycle.news_count
+            self._status['consecutive_failures'] = self._status['consecutive_failures'] + 1 if cycle.errors else 0
+            self._status['last_cycle'] = {**asdict(cycle), 'errors': cycle.errors}
+        if self.on_cycle:
+            try:
+                self.on_cycle(cycle)
+            except Exception as e:
+                logger.error("Ciclo %s: erro no callback: %s", number, e)
+        return cycle
+
+    def stop(self) -> None:
+        """Interrompe a espera e encerra apos o ciclo em andamento."""
+        self._update(state='stopping')
+        self._stop.set()
+
+    @property
+    def healthy(self) -> bool:
+        with self._lock:
+            return self._status['consecutive_failures'] < self.MAX_CONSECUTIVE_FAILURES
+
+    def status(self) -> Dict:
+        with self._lock:
+            status = dict(self._status)
+        status['healthy'] = self.healthy
+        status['interval_seconds'] = self.interval_seconds
+        return status
+
+    def _update(self, **values) -> None:
+        with self._lock:
+            self._status.update(values)
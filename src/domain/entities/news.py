@@ -1,12 +1,39 @@
-from dataclasses import dataclass
 from datetime import datetime
+from typing import Dict, Optional
 
-@dataclass
 class News:
-    title: str
-    date: datetime
-    description: str
-    image_filename: str
-    image_url: str
-    search_phrase_count: int
-    has_money: bool 
\ No newline at end of file
+    """Noticia extraida. Usa __slots__ (sem __dict__ por instancia) para reduzir a memoria em lotes grandes.
+
+    Escrita a mao em vez de @dataclass(slots=True), que so existe a partir do Python 3.10.
+    """
+
+    __slots__ = ('title', 'date', 'description', 'image_filename', 'image_url', 'search_phrase_count',
+                 'has_money', 'article_id', 'phrase_counts')
+
+    def __init__(self, title: str, date: datetime, description: str, image_filename: str, image_url: str,
+                 search_phrase_count: int, has_money: bool, article_id: str = "",
+                 phrase_counts: Optional[Dict[str, int]] = None):
+        self.title = title
+        self.date = date
+        self.description = description
+        self.image_filename = image_filename
+        self.image_url = image_url
+        self.search_phrase_count = search_phrase_count
+        self.has_money = has_money
+        self.article_id = article_id
+        # Contagem de cada frase adicional (EXTRA_PHRASES)
+        self.phrase_counts = phrase_counts if phrase_counts is not None else {}
+
+    def as_tuple(self) -> tuple:
+        return tuple(getattr(self, name) for name in News.__slots__)
+
+    def __eq__(self, other):
+        if not hasattr(other, 'as_tuple'):
+            return NotImplemented
+        return self.as_tuple() == other.as_tuple()
+
+    __hash__ = None  # mutavel, como o dataclass anterior
+
+    def __repr__(self):
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in News.__slots__)
+        return f"News({fields})"
@@ -0,0 +1,172 @@
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Iterator, List, Optional
+from src.domain.entities.news import News
+
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+# Offset reservado para datas sem fuso (naive)
+_NAIVE = -(2 ** 31)
+
+
+class NewsBatch:
+    """Lote de noticias em colunas: datas como inteiros (epoch em microssegundos), contagens e
+    flags em arrays, textos em listas. Cada linha e exposta como NewsRow, compativel com News.
+
+    Datas com fuso guardam apenas o offset (nome de zona do zoneinfo nao e preservado).
+    """
+
+    def __init__(self, news: Iterable[News] = ()):
+        self.titles: List[str] = []
+        self.descriptions: List[str] = []
+        self.image_filenames: List[str] = []
+        self.image_urls: List[str] = []
+        self.article_ids: List[str] = []
+        self.timestamps = array('q')
+        self.utc_offsets = array('l')
+        self.search_phrase_counts = array('q')
+        self.has_money = bytearray()
+        # Uma coluna por frase adicional; linhas sem a frase ficam com 0
+        self.phrase_counts: Dict[str, array] = {}
+        self._timezones: Dict[int, timezone] = {}
+        self.extend(news)
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def __iter__(self) -> Iterator['NewsRow']:
+        for index in range(len(self)):
+            yield NewsRow(self, index)
+
+    def __getitem__(self, index: int) -> 'NewsRow':
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('NewsBatch index out of range')
+        return NewsRow(self, index)
+
+    def append(self, news: News) -> None:
+        row = len(self)
+        self.titles.append(news.title)
+        self.descriptions.append(news.description)
+        self.image_filenames.append(news.image_filename)
+        self.image_urls.append(news.image_url)
+        self.article_ids.append(news.article_id)
+        timestamp, offset = self._encode_date(news.date)
+        self.timestamps.append(timestamp)
+        self.utc_offsets.append(offset)
+        self.search_phrase_counts.append(news.search_phrase_count)
+        self.has_money.append(1 if news.has_money else 0)
+        for phrase, count in news.phrase_counts.items():
+            column = self.phrase_counts.get(phrase)
+            if column is None:
+                column = self.phrase_counts[phrase] = array('q', bytes(8 * row))
+            column.append(count)
+        for column in self.phrase_counts.values():
+            if len(column) == row:
+                column.append(0)
+
+    def extend(self, news: Iterable[News]) -> None:
+        for item in news:
+            self.append(item)
+
+    def date_at(self, index: int) -> datetime:
+        offset = self.utc_offsets[index]
+        delta = self.timestamps[index] * _MICROSECOND
+        if offset == _NAIVE:
+            return _EPOCH_NAIVE + delta
+        tz = self._timezones.get(offset)
+        if tz is None:
+            tz = self._timezones[offset] = timezone(timedelta(seconds=offset))
+        return (_EPOCH_UTC + delta).astimezone(tz)
+
+    def phrase_counts_at(self, index: int) -> Dict[str, int]:
+        return {phrase: column[index] for phrase, column in self.phrase_counts.items()}
+
+    def to_news(self, index: int) -> News:
+        return News(
+            title=self.titles[index],
+            date=self.date_at(index),
+            description=self.descriptions[index],
+            image_filename=self.image_filenames[index],
+            image_url=self.image_urls[index],
+            search_phrase_count=self.search_phrase_counts[index],
+            has_money=bool(self.has_money[index]),
+            article_id=self.article_ids[index],
+            phrase_counts=self.phrase_counts_at(index)
+        )
+
+    @staticmethod
+    def _encode_date(date: datetime):
+        offset: Optional[timedelta] = date.utcoffset()
+        if offset is None:
+            return (date - _EPOCH_NAIVE) // _MICROSECOND, _NAIVE
+        return (date - _EPOCH_UTC) // _MICROSECOND, int(offset.total_seconds())
+
+
+class NewsRow:
+    """Visao de uma linha do NewsBatch com os mesmos atributos de News (leitura e escrita)."""
+
+    __slots__ = ('_batch', '_index')
+
+    def __init__(self, batch: NewsBatch, index: int):
+        self._batch = batch
+        self._index = index
+
+    @property
+    def title(self) -> str:
+        return self._batch.titles[self._index]
+
+    @property
+    def description(self) -> str:
+        return self._batch.descriptions[self._index]
+
+    @property
+    def date(self) -> datetime:
+        return self._batch.date_at(self._index)
+
+    @property
+    def image_filename(self) -> str:
+        return self._batch.image_filenames[self._index]
+
+    @image_filename.setter
+    def image_filename(self, value: str) -> None:
+        # O download das imagens grava o status do arquivo aqui
+        self._batch.image_filenames[self._index] = value
+
+    @property
+    def image_url(self) -> str:
+        return self._batch.image_urls[self._index]
+
+    @property
+    def search_phrase_count(self) -> int:
+        return self._batch.search_phrase_counts[self._index]
+
+    @property
+    def has_money(self) -> bool:
+        return bool(self._batch.has_money[self._index])
+
+    @property
+    def article_id(self) -> str:
+        return self._batch.article_ids[self._index]
+
+    @property
+    def phrase_counts(self) -> Dict[str, int]:
+        return self._batch.phrase_counts_at(self._index)
+
+    def to_news(self) -> News:
+        return self._batch.to_news(self._index)
+
+    def as_tuple(self) -> tuple:
+        return self.to_news().as_tuple()
+
+    def __eq__(self, other):
+        if not hasattr(other, 'as_tuple'):
+            return NotImplemented
+        return self.as_tuple() == other.as_tuple()
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"NewsRow({self._index}, {self.title!r})"
@@ -1,12 +1,39 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterable
 from src.domain.entities.news import News
 
 class NewsRepository(ABC):
     @abstractmethod
-    def save_news(self, news: List[News]) -> None:
+    def save_news(self, news: Iterable[News]) -> None:
         pass
 
     @abstractmethod
     def save_image(self, url: str, filename: str) -> None:
-        pass 
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def merge_news(self, news: Iterable[News]) -> None:
+        """Acrescenta noticias novas a saida ja existente (modo incremental)."""
+        pass
+
+    # Protocolo incremental: open -> append (quantas vezes for preciso) -> close (ou abort)
+
+    @abstractmethod
+    def open(self, merge: bool = False) -> None:
+        """Abre a saida; com `merge` o conteudo ja existente e preservado."""
+        pass
+
+    @abstractmethod
+    def append(self, news: Iterable[News]) -> None:
+        """Grava as noticias conforme chegam (aceita geradores)."""
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """Conclui a saida e publica o arquivo."""
+        pass
+
+    @abstractmethod
+    def abort(self) -> None:
+        """Descarta a saida em andamento, mantendo o arquivo anterior."""
+        pass
@@ -1,67 +1,121 @@
+import logging
 import re
-from typing import Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, List, Sequence, Tuple
 import string
 import unicodedata
 from src.domain.entities.news import News
+from src.domain.services.phrase_matcher import PhraseMatcher
 from src.infrastructure.logging.logger import logger
 
 class NewsAnalyzer:
+    # Tradutor para remover pontuacao (montado uma unica vez)
+    _TRANSLATOR = str.maketrans('', '', string.punctuation)
+
+    # Padroes para identificar valores monetarios conforme especificado no desafio,
+    # combinados numa unica regex
+    _MONEY_PATTERN = re.compile(
+        '|'.join([
+            r'\$\s*\d+[.,]\d+',  # $ 11,1
+            r'US\$\s*\d+[.,]\d+',  # US$ 111.111,11
+            r'\d+\s*dolares?',  # 11 dolares
+            r'\d+\s*dollars?'  # 11 dollars
+        ]),
+        re.IGNORECASE
+    )
+    # Separador entre titulo e descricao que nenhum padrao monetario atravessa
+    _FIELD_SEPARATOR = '\x00'
+
+    def __init__(self, search_phrase: str = '', extra_phrases: Sequence[str] = (), whole_words: bool = False):
+        self.search_phrase = search_phrase
+        self.phrase_clean = self._clean_text(search_phrase)
+        self.extra_phrases = list(extra_phrases)
+        self.whole_words = whole_words
+        # Frases adicionais sao contadas juntas, numa unica passada (Aho-Corasick)
+        self._matcher = PhraseMatcher(
+            {phrase: self._clean_text(phrase) for phrase in self.extra_phrases},
+            whole_words=whole_words
+        ) if self.extra_phrases else None
+
+    @classmethod
+    @lru_cache(maxsize=32)
+    def for_phrase(cls, search_phrase: str, extra_phrases: Tuple[str, ...] = (), whole_words: bool = False) -> 'NewsAnalyzer':
+        """Analisador pre-compilado para a frase (reaproveitado entre chamadas)."""
+        return cls(search_phrase, extra_phrases, whole_words)
+
     @staticmethod
     def remove_accents(text: str) -> str:
+        if text.isascii():
+            return text
         return ''.join(c for c in unicodedata.normalize('NFD', text) if unicodedata.category(c) != 'Mn')
 
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Texto como a analise compara: minusculas, sem acentos e sem pontuacao."""
+        return NewsAnalyzer._clean_text(text)
+
     @staticmethod
     def analyze_news(title: str, description: str, search_phrase: str) -> Tuple[int, bool]:
+        return NewsAnalyzer.for_phrase(search_phrase).analyze(title, description)
+
+    def analyze(self, title: str, description: str) -> Tuple[int, bool]:
+        search_count, has_money, _ = self.analyze_with_phrases(title, description)
+        return search_count, has_money
+
+    def analyze_with_phrases(self, title: str, description: str) -> Tuple[int, bool, Dict[str, int]]:
+        """Como `analyze`, incluindo a contagem de cada frase adicional."""
+        debug = logger.isEnabledFor(logging.DEBUG)
         # Loga os textos originais para depuracao
-        NewsAnalyzer._log_original_texts(title, description, search_phrase)
-        # Cria um tradutor para remover pontuacao
-        translator = str.maketrans('', '', string.punctuation)
+        if debug:
+            self._log_original_texts(title, self.search_phrase)
         # Limpa e normaliza os textos (minusculas, sem acentos, sem pontuacao)
-        title_clean = NewsAnalyzer._clean_text(title, translator)
-        description_clean = NewsAnalyzer._clean_text(description, translator)
-        phrase_clean = NewsAnalyzer._clean_text(search_phrase, translator)
+        title_clean = self._clean_text(title)
+        description_clean = self._clean_text(description)
         # Loga os textos processados para depuracao
-        NewsAnalyzer._log_processed_texts(title_clean, description_clean, phrase_clean)
+        if debug:
+            self._log_processed_texts(title_clean, description_clean, self.phrase_clean)
         # Conta quantas vezes a frase de busca aparece no titulo e descricao
-        search_count = NewsAnalyzer._count_phrase(title_clean, description_clean, phrase_clean)
-        logger.debug(f"Contagem total para este artigo: {search_count}")
+        search_count = self._count_phrase(title_clean, description_clean, self.phrase_clean)
+        if debug:
+            logger.debug("Contagem total para este artigo: %s", search_count)
+        # Conta as frases adicionais no titulo e na descricao de uma so vez
+        phrase_counts = self._matcher.count(f"{title_clean}{self._FIELD_SEPARATOR}{description_clean}") if self._matcher else {}
         # Verifica se ha mencao a valores monetarios usando regex
-        has_money = NewsAnalyzer._has_money(title, description)
-        return search_count, has_money
+        has_money = self._has_money(title, description)
+        return search_count, has_money, phrase_counts
+
+    def analyze_many(self, texts: Iterable[Tuple[str, str]]) -> List[Tuple[int, bool]]:
+        """Analisa um lote de pares (titulo, descricao), na mesma ordem."""
+        return [self.analyze(title, description) for title, description in texts]
+
+    def analyze_many_with_phrases(self, texts: Iterable[Tuple[str, str]]) -> List[Tuple[int, bool, Dict[str, int]]]:
+        """Como `analyze_many`, incluindo a contagem das frases adicionais."""
+        return [self.analyze_with_phrases(title, description) for title, description in texts]
 
     @staticmethod
-    def _log_original_texts(title, description, search_phrase):
-        logger.debug(f"Titulo original: {NewsAnalyzer.remove_accents(title)}")
-        logger.debug(f"Frase de busca: {search_phrase}")
+    def _log_original_texts(title, search_phrase):
+        logger.debug("Titulo original: %s", NewsAnalyzer.remove_accents(title))
+        logger.debug("Frase de busca: %s", search_phrase)
 
     @staticmethod
-    def _clean_text(text, translator):
-        return NewsAnalyzer.remove_accents(text.lower()).translate(translator)
+    def _clean_text(text):
+        return NewsAnalyzer.remove_accents(text.lower()).translate(NewsAnalyzer._TRANSLATOR)
 
     @staticmethod
     def _log_processed_texts(title_clean, description_clean, phrase_clean):
-        logger.debug(f"Titulo processado: {title_clean}")
-        logger.debug(f"Descricao processada: {description_clean}")
-        logger.debug(f"Frase de pesquisa processada: {phrase_clean}")
+        logger.debug("Titulo processado: %s", title_clean)
+        logger.debug("Descricao processada: %s", description_clean)
+        logger.debug("Frase de pesquisa processada: %s", phrase_clean)
 
     @staticmethod
     def _count_phrase(title_clean, description_clean, phrase_clean):
         count_title = title_clean.count(phrase_clean)
         count_desc = description_clean.count(phrase_clean)
-        logger.debug(f"Frase '{phrase_clean}' - no titulo: {count_title}, na descricao: {count_desc}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Frase '%s' - no titulo: %s, na descricao: %s", phrase_clean, count_title, count_desc)
         return count_title + count_desc
 
     @staticmethod
     def _has_money(title, description):
-        # Padroes para identificar valores monetarios conforme especificado no desafio
-        money_patterns = [
-            r'\$\s*\d+[.,]\d+',  # $ 11,1
-            r'US\$\s*\d+[.,]\d+',  # US$ 111.111,11
-            r'\d+\s*dolares?',  # 11 dolares
-            r'\d+\s*dollars?'  # 11 dollars
-        ]
-        return any(
-            re.search(pattern, title, re.IGNORECASE) or 
-            re.search(pattern, description, re.IGNORECASE)
-            for pattern in money_patterns
-        ) 
\ No newline at end of file
+        # Titulo e descricao sao varridos numa unica busca
+        return NewsAnalyzer._MONEY_PATTERN.search(f"{title}{NewsAnalyzer._FIELD_SEPARATOR}{description}") is not None
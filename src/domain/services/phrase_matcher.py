@@ -0,0 +1,69 @@
+from collections import deque
+from typing import Dict, List, Tuple
+
+
+class PhraseMatcher:
+    """Automato de Aho-Corasick: conta todas as frases numa unica passada pelo texto.
+
+    Recebe as frases ja normalizadas (chave -> padrao). Ocorrencias sobrepostas
+    sao contadas; com `whole_words` so valem ocorrencias delimitadas por
+    caracteres nao alfanumericos (ou pelas bordas do texto).
+    """
+
+    def __init__(self, patterns: Dict[str, str], whole_words: bool = False):
+        self.whole_words = whole_words
+        self.keys = list(patterns)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[str, int]]] = [[]]
+        for key, pattern in patterns.items():
+            if pattern:
+                self._insert(key, pattern)
+        self._build_failure_links()
+
+    def _insert(self, key: str, pattern: str) -> None:
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = next_state
+        self._out[state].append((key, len(pattern)))
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._out[next_state] = self._out[next_state] + self._out[self._fail[next_state]]
+
+    def count(self, text: str) -> Dict[str, int]:
+        counts = dict.fromkeys(self.keys, 0)
+        goto, fail, out = self._goto, self._fail, self._out
+        last_index = len(text) - 1
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if not out[state]:
+                continue
+            for key, length in out[state]:
+                if self.whole_words:
+                    start = index - length + 1
+                    if start > 0 and text[start - 1].isalnum():
+                        continue
+                    if index < last_index and text[index + 1].isalnum():
+                        continue
+                counts[key] += 1
+        return counts
@@ -0,0 +1,165 @@
+import hashlib
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlparse
+from src.infrastructure.logging.logger import logger
+
+@dataclass
+class CachedImage:
+    url: str
+    content_hash: str
+    blob_path: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+
+class ImageCache:
+    """Armazena imagens por hash de conteudo, com metadados de revalidacao indexados pelo hash da URL."""
+
+    def __init__(self, cache_dir: str, ttl_seconds: float):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.blobs_dir = os.path.join(cache_dir, 'blobs')
+        os.makedirs(self.blobs_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(cache_dir, 'index.sqlite'), check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS images (
+                url_hash TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                blob_name TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL
+            )"""
+        )
+        self._conn.commit()
+
+    @classmethod
+    def from_env(cls) -> Optional['ImageCache']:
+        """Cria o cache a partir do .env; IMAGE_CACHE_DIR vazio desativa o cache."""
+        cache_dir = os.getenv('IMAGE_CACHE_DIR', os.path.join('.cache', 'images'))
+        if not cache_dir:
+            return None
+        return cls(cache_dir, float(os.getenv('IMAGE_CACHE_TTL', '86400')))
+
+    @staticmethod
+    def url_hash(url: str) -> str:
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def filename_for(url: str) -> str:
+        """Nome de arquivo estavel para a URL (nao depende da posicao do artigo)."""
+        extension = os.path.splitext(urlparse(url).path)[1].lower() or '.jpg'
+        return f"{ImageCache.url_hash(url)[:16]}{extension}"
+
+    def lookup(self, url: str) -> Optional[CachedImage]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content_hash, blob_name, etag, last_modified, fetched_at FROM images WHERE url_hash = ?",
+                (self.url_hash(url),)
+            ).fetchone()
+        if not row:
+            return None
+        content_hash, blob_name, etag, last_modified, fetched_at = row
+        blob_path = os.path.join(self.blobs_dir, blob_name)
+        if not os.path.exists(blob_path):
+            return None
+        return CachedImage(url, content_hash, blob_path, etag, last_modified, fetched_at)
+
+    def is_fresh(self, cached: CachedImage) -> bool:
+        return time.time() - cached.fetched_at < self.ttl_seconds
+
+    def conditional_headers(self, cached: Optional[CachedImage]) -> Dict[str, str]:
+        """Cabecalhos para GET condicional (resposta 304 quando a imagem nao mudou)."""
+        headers = {}
+        if cached and cached.etag:
+            headers['If-None-Match'] = cached.etag
+        if cached and cached.last_modified:
+            headers['If-Modified-Since'] = cached.last_modified
+        return headers
+
+    def touch(self, url: str) -> None:
+        """Marca a entrada como revalidada agora."""
+        with self._lock:
+            self._conn.execute("UPDATE images SET fetched_at = ? WHERE url_hash = ?", (time.time(), self.url_hash(url)))
+            self._conn.commit()
+
+    def store(self, url: str, chunks: Iterable[bytes], etag: Optional[str] = None, last_modified: Optional[str] = None) -> CachedImage:
+        """Grava o conteudo no cache; payloads identicos compartilham o mesmo arquivo."""
+        digest = hashlib.sha256()
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.part')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in chunks:
+                    digest.update(chunk)
+                    f.write(chunk)
+            content_hash = digest.hexdigest()
+            blob_name = content_hash + os.path.splitext(self.filename_for(url))[1]
+            blob_path = os.path.join(self.blobs_dir, blob_name)
+            if os.path.exists(blob_path):
+                logger.debug("Conteudo ja existente no cache: %s", blob_name)
+                os.remove(temp_path)
+            else:
+                os.replace(temp_path, blob_path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return self._index(url, content_hash, blob_name, etag, last_modified)
+
+    def store_file(self, url: str, path: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> CachedImage:
+        """Move um arquivo ja baixado para o cache (sem regravar o conteudo quando esta no mesmo disco)."""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        content_hash = digest.hexdigest()
+        blob_name = content_hash + os.path.splitext(self.filename_for(url))[1]
+        blob_path = os.path.join(self.blobs_dir, blob_name)
+        if os.path.exists(blob_path):
+            logger.debug("Conteudo ja existente no cache: %s", blob_name)
+            os.remove(path)
+        else:
+            try:
+                os.replace(path, blob_path)
+            except OSError:
+                # Outro disco: copia para um temporario do cache e renomeia
+                with open(path, 'rb') as f:
+                    self.store(url, iter(lambda: f.read(1024 * 1024), b''), etag, last_modified)
+                os.remove(path)
+        return self._index(url, content_hash, blob_name, etag, last_modified)
+
+    def _index(self, url: str, content_hash: str, blob_name: str, etag: Optional[str],
+               last_modified: Optional[str]) -> CachedImage:
+        fetched_at = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO images VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (self.url_hash(url), url, content_hash, blob_name, etag, last_modified, fetched_at)
+            )
+            self._conn.commit()
+        return CachedImage(url, content_hash, os.path.join(self.blobs_dir, blob_name), etag, last_modified, fetched_at)
+
+    def link(self, cached: CachedImage, target_path: str) -> None:
+        """Materializa a imagem no destino via hard link (copia se o link nao for possivel)."""
+        if os.path.exists(target_path):
+            if os.path.samefile(cached.blob_path, target_path):
+                return
+            os.remove(target_path)
+        try:
+            os.link(cached.blob_path, target_path)
+        except OSError:
+            shutil.copyfile(cached.blob_path, target_path)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,105 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+from src.infrastructure.clients.article_parsing import loads_json
+from src.infrastructure.logging.logger import logger
+
+class ResponseCache:
+    """Cache persistente (SQLite) das respostas da API, com TTL por entrada e descarte LRU por tamanho."""
+
+    IGNORED_PARAMS = ('api-key',)
+
+    def __init__(self, db_path: str, ttl_seconds: float, max_bytes: int):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                params TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access)")
+        self._conn.commit()
+
+    @classmethod
+    def from_env(cls) -> Optional['ResponseCache']:
+        """Cria o cache a partir do .env; RESPONSE_CACHE_PATH vazio desativa o cache."""
+        db_path = os.getenv('RESPONSE_CACHE_PATH', os.path.join('.cache', 'responses.sqlite'))
+        if not db_path:
+            return None
+        return cls(
+            db_path,
+            ttl_seconds=float(os.getenv('RESPONSE_CACHE_TTL', '3600')),
+            max_bytes=int(float(os.getenv('RESPONSE_CACHE_MAX_MB', '256')) * 1024 * 1024)
+        )
+
+    def normalize_params(self, url: str, params: Dict) -> str:
+        """Chave canonica da requisicao: URL + parametros ordenados, sem a chave da API."""
+        safe_params = {k: str(v) for k, v in params.items() if k not in self.IGNORED_PARAMS}
+        return json.dumps({'url': url, 'params': safe_params}, sort_keys=True)
+
+    def make_key(self, url: str, params: Dict) -> str:
+        return hashlib.sha256(self.normalize_params(url, params).encode('utf-8')).hexdigest()
+
+    def get(self, url: str, params: Dict) -> Optional[Dict]:
+        key = self.make_key(url, params)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT body, expires_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None or row[1] <= now:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        return loads_json(row[0])
+
+    def set(self, url: str, params: Dict, body: bytes, ttl_seconds: Optional[float] = None) -> None:
+        """Grava o corpo bruto da resposta; `ttl_seconds` sobrescreve o TTL padrao para esta entrada."""
+        now = time.time()
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (self.make_key(url, params), self.normalize_params(url, params), body, len(body), now + ttl, now)
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now: float) -> None:
+        """Remove entradas expiradas e, se preciso, as menos usadas ate caber em max_bytes."""
+        self._conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = 0
+        for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY last_access").fetchall():
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        logger.debug("Cache de respostas: %s entrada(s) descartada(s) por tamanho", evicted)
+
+    def stats(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,97 @@
+import json
+import os
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterable, List, Optional, Set
+from src.domain.entities.news import News
+
+@dataclass
+class Checkpoint:
+    high_water_mark: Optional[datetime] = None
+    # IDs ja vistos no dia do high-water mark (a janela incremental recomeca nesse dia)
+    seen_ids: Set[str] = field(default_factory=set)
+
+    def advance(self, news_list: Iterable[News]) -> 'Checkpoint':
+        """Novo checkpoint considerando as noticias recem-processadas."""
+        tracker = CheckpointTracker(self)
+        for news in news_list:
+            tracker.observe(news)
+        return tracker.result()
+
+
+class CheckpointTracker:
+    """Avanca o checkpoint noticia a noticia, sem manter a lista (usado no pipeline em streaming).
+
+    Guarda apenas o high-water mark e os IDs do dia dele.
+    """
+
+    def __init__(self, checkpoint: Checkpoint):
+        self.high_water_mark = checkpoint.high_water_mark
+        self._day = checkpoint.high_water_mark.date() if checkpoint.high_water_mark else None
+        self._day_ids = set(checkpoint.seen_ids)
+
+    def observe(self, news: News) -> None:
+        if self.high_water_mark is None or news.date > self.high_water_mark:
+            self.high_water_mark = news.date
+        day = news.date.date()
+        if self._day is None or day > self._day:
+            self._day = day
+            self._day_ids = set()
+        if news.article_id and day == self._day:
+            self._day_ids.add(news.article_id)
+
+    def result(self) -> Checkpoint:
+        if self.high_water_mark is None:
+            return Checkpoint()
+        # O dia do high-water mark e o ultimo dia visto
+        return Checkpoint(self.high_water_mark, set(self._day_ids))
+
+
+class CheckpointStore:
+    """Guarda, por (frase de busca, categorias[, job]), ate onde a extracao ja foi feita."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(search_phrase: str, categories: List[str], scope: str = '') -> str:
+        """Chave do checkpoint; `scope` (nome do job) separa buscas iguais que gravam saidas diferentes."""
+        normalized = sorted(cat.lower().strip() for cat in categories if cat.strip())
+        key = f"{search_phrase.lower().strip()}|{','.join(normalized)}"
+        return f"{key}|{scope}" if scope else key
+
+    def _read_all(self) -> dict:
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def load(self, key: str) -> Checkpoint:
+        with self._lock:
+            entry = self._read_all().get(key)
+        if not entry:
+            return Checkpoint()
+        return Checkpoint(
+            high_water_mark=datetime.fromisoformat(entry['high_water_mark']),
+            seen_ids=set(entry.get('seen_ids', []))
+        )
+
+    def save(self, key: str, checkpoint: Checkpoint) -> None:
+        """Grava o checkpoint de forma atomica (arquivo temporario + rename)."""
+        if checkpoint.high_water_mark is None:
+            return
+        with self._lock:
+            data = self._read_all()
+            data[key] = {
+                'high_water_mark': checkpoint.high_water_mark.isoformat(),
+                'seen_ids': sorted(checkpoint.seen_ids)
+            }
+            directory = os.path.dirname(self.path) or '.'
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+            os.replace(temp_path, self.path)
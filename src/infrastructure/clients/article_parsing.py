@@ -0,0 +1,49 @@
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # Dependencia opcional: sem ela o json da biblioteca padrao e usado
+    orjson = None
+
+# JSON_BACKEND: auto (orjson se instalado), orjson ou json
+JSON_BACKEND = 'orjson' if orjson and os.getenv('JSON_BACKEND', 'auto').lower() in ('auto', 'orjson') else 'json'
+
+def loads_json(body: Union[bytes, str]) -> Any:
+    """Decodifica o corpo direto dos bytes, sem passar por response.text."""
+    if JSON_BACKEND == 'orjson':
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+_TIMEZONES: Dict[str, timezone] = {'Z': timezone.utc, '+0000': timezone.utc, '+00:00': timezone.utc}
+
+def _timezone_for(suffix: str) -> Optional[timezone]:
+    tz = _TIMEZONES.get(suffix)
+    if tz is None:
+        digits = suffix[1:].replace(':', '')
+        if suffix[0] not in '+-' or len(digits) != 4 or not digits.isdigit():
+            return None
+        offset = timedelta(hours=int(digits[:2]), minutes=int(digits[2:]))
+        tz = _TIMEZONES[suffix] = timezone(-offset if suffix[0] == '-' else offset)
+    return tz
+
+def parse_pub_date(value: str) -> datetime:
+    """Le o pub_date da API (2024-01-15T12:34:56+0000) por fatias, sem strptime.
+
+    Formatos fora do padrao (fracoes de segundo, sem fuso...) caem no strptime/fromisoformat.
+    """
+    if len(value) >= 20 and value[4] == '-' and value[7] == '-' and value[10] == 'T' and value[13] == ':' and value[16] == ':':
+        tz = _timezone_for(value[19:])
+        if tz is not None:
+            try:
+                return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                                int(value[11:13]), int(value[14:16]), int(value[17:19]), tzinfo=tz)
+            except ValueError:
+                pass
+    try:
+        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S%z")
+    except ValueError:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
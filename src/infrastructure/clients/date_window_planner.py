@@ -0,0 +1,56 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import List, Tuple
+
+
+@dataclass
+class DateWindow:
+    begin_date: datetime
+    end_date: datetime
+    hits: int = 0
+    fetched: int = 0
+
+    @property
+    def days(self) -> int:
+        return (self.end_date - self.begin_date).days + 1
+
+    @property
+    def coverage(self) -> float:
+        """Fracao dos hits da janela que foi efetivamente coletada."""
+        if not self.hits:
+            return 1.0
+        return min(self.fetched / self.hits, 1.0)
+
+    def label(self) -> str:
+        return f"{self.begin_date.strftime('%Y-%m-%d')} ate {self.end_date.strftime('%Y-%m-%d')}"
+
+
+class DateWindowPlanner:
+    """Divide um periodo em janelas de datas que cabem no limite de paginacao da API."""
+
+    def __init__(self, max_hits: int, initial_days: int = 0):
+        self.max_hits = max_hits
+        self.initial_days = initial_days
+
+    def initial_windows(self, begin_date: datetime, end_date: datetime) -> List[DateWindow]:
+        """Janelas iniciais: o periodo inteiro ou fatias de `initial_days` dias."""
+        if self.initial_days <= 0:
+            return [DateWindow(begin_date, end_date)]
+        windows = []
+        window_begin = begin_date
+        while window_begin <= end_date:
+            window_end = min(window_begin + timedelta(days=self.initial_days - 1), end_date)
+            windows.append(DateWindow(window_begin, window_end))
+            window_begin = window_end + timedelta(days=1)
+        return windows
+
+    def needs_split(self, window: DateWindow) -> bool:
+        return window.hits > self.max_hits and window.days > 1
+
+    def split(self, window: DateWindow) -> Tuple[DateWindow, DateWindow]:
+        """Divide a janela ao meio (a API trabalha com dias inteiros)."""
+        middle = window.begin_date + timedelta(days=window.days // 2 - 1)
+        return (
+            DateWindow(window.begin_date, middle),
+            DateWindow(middle + timedelta(days=1), window.end_date),
+        )
@@ -0,0 +1,262 @@
+import os
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import requests
+from requests.adapters import HTTPAdapter
+from src.domain.entities.news import News
+from src.infrastructure.cache.image_cache import ImageCache
+from src.infrastructure.logging.logger import logger
+from src.infrastructure.metrics.metrics import metrics, submit_in_context
+
+_CONTENT_RANGE = re.compile(r'bytes (\d+)-\d+/(\d+|\*)')
+
+class PartialDownload:
+    """Arquivo .part de um download, retomavel via Range.
+
+    O validador da resposta (ETag ou Last-Modified) fica num arquivo ao lado e vai no If-Range:
+    se a imagem mudou no servidor, a resposta e 200 e o download recomeca do zero.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.validator_path = path + '.validator'
+        self.size = os.path.getsize(path) if os.path.exists(path) else 0
+        self.expected_size: Optional[int] = None
+        self._validator = self._read_validator() if self.size else None
+        self.resumable = bool(self._validator)
+        self._response = None
+        self._file = None
+
+    def _read_validator(self) -> Optional[str]:
+        try:
+            with open(self.validator_path, 'r', encoding='utf-8') as f:
+                return f.read().strip() or None
+        except OSError:
+            return None
+
+    def resume_headers(self) -> Dict[str, str]:
+        if not self.size or not self._validator:
+            return {}
+        return {'Range': f"bytes={self.size}-", 'If-Range': self._validator}
+
+    def start(self, response) -> bool:
+        """Abre o .part conforme a resposta: continua no 206, recomeca no 200. Retorna se retomou."""
+        self._response = response
+        match = _CONTENT_RANGE.match(response.headers.get('Content-Range', '')) if response.status_code == 206 else None
+        resumed = bool(match) and int(match.group(1)) == self.size
+        if response.status_code == 206 and not resumed:
+            self.resumable = False
+            raise ValueError(f"Content-Range inesperado: {response.headers.get('Content-Range')}")
+        if not resumed:
+            self.size = 0
+        length = response.headers.get('Content-Length')
+        if match and match.group(2) != '*':
+            self.expected_size = int(match.group(2))
+        elif length and length.isdigit():
+            self.expected_size = self.size + int(length)
+        validator = response.headers.get('ETag') or response.headers.get('Last-Modified')
+        # ETag fraco nao serve para If-Range
+        self.resumable = bool(validator) and not validator.startswith('W/')
+        if self.resumable:
+            with open(self.validator_path, 'w', encoding='utf-8') as f:
+                f.write(validator)
+        elif os.path.exists(self.validator_path):
+            os.remove(self.validator_path)
+        self._file = open(self.path, 'ab' if resumed else 'wb')
+        return resumed
+
+    def write(self, chunk: bytes) -> None:
+        self._file.write(chunk)
+        self.size += len(chunk)
+
+    def validators(self) -> Tuple[Optional[str], Optional[str]]:
+        headers = self._response.headers
+        return headers.get('ETag'), headers.get('Last-Modified')
+
+    def close(self, keep: bool = True) -> None:
+        if self._file:
+            self._file.close()
+            self._file = None
+        if not keep:
+            self.discard()
+
+    def discard(self) -> None:
+        self.close()
+        for path in (self.path, self.validator_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+class ImageDownloader:
+    """Baixa imagens em paralelo, com sessao compartilhada e limite de conexoes por host."""
+
+    CHUNK_SIZE = 64 * 1024
+    # Locks por arquivo em faixas fixas: o conjunto nao cresce com as imagens vistas (modo servico).
+    # Dois nomes na mesma faixa so esperam um pelo outro, o que e raro com bem mais faixas que workers
+    LOCK_STRIPES = 64
+
+    def __init__(self, images_dir: str, max_workers: int = None, max_per_host: int = None, timeout: float = None,
+                 image_cache: Optional[ImageCache] = None, deadline: float = None, max_bytes: int = None):
+        self.images_dir = images_dir
+        self.image_cache = image_cache
+        self.max_workers = max_workers or int(os.getenv('IMAGE_DOWNLOAD_WORKERS', '8'))
+        self.max_per_host = max_per_host or int(os.getenv('IMAGE_MAX_PER_HOST', '4'))
+        # timeout vale por operacao de rede; deadline e o tempo total por imagem
+        self.timeout = timeout or float(os.getenv('IMAGE_DOWNLOAD_TIMEOUT', '30'))
+        self.deadline = deadline or float(os.getenv('IMAGE_DOWNLOAD_DEADLINE', '120'))
+        # Tamanho maximo por imagem (0 = sem limite)
+        self.max_bytes = int(os.getenv('IMAGE_MAX_BYTES', str(20 * 1024 * 1024))) if max_bytes is None else max_bytes
+        self._file_locks = [threading.Lock() for _ in range(self.LOCK_STRIPES)]
+        self._session = requests.Session()
+        # pool_block limita as conexoes simultaneas por host ao tamanho do pool
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.max_per_host, pool_block=True)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        os.makedirs(images_dir, exist_ok=True)
+
+    def download(self, image_url: str, image_filename: str) -> str:
+        """Baixa uma imagem em blocos para um .part e renomeia ao concluir. Retorna o status do download."""
+        if not image_url:
+            return "URL não fornecida"
+
+        image_path = os.path.join(self.images_dir, image_filename)
+        # Duas noticias com a mesma imagem nao escrevem no mesmo .part ao mesmo tempo
+        with self._lock_for(image_filename):
+            return self._download(image_url, image_filename, image_path)
+
+    def _download(self, image_url: str, image_filename: str, image_path: str) -> str:
+        cached = self.image_cache.lookup(image_url) if self.image_cache else None
+        part = PartialDownload(image_path + '.part')
+        try:
+            if cached and self.image_cache.is_fresh(cached):
+                logger.debug("Imagem em cache dentro do TTL: %s", image_url)
+                metrics.increment('image_cache_hits_total')
+                self.image_cache.link(cached, image_path)
+                part.discard()
+                return image_filename
+
+            logger.debug("Tentando baixar imagem de: %s", image_url)
+            headers = self.image_cache.conditional_headers(cached) if self.image_cache else {}
+            headers.update(part.resume_headers())
+            start = time.perf_counter()
+            deadline = time.monotonic() + self.deadline
+            with self._session.get(image_url, stream=True, timeout=self.timeout, headers=headers) as response:
+                metrics.increment('image_requests_total')
+                logger.debug("Status da resposta: %s", response.status_code)
+                if response.status_code == 304 and cached:
+                    logger.debug("Imagem nao modificada: %s", image_url)
+                    metrics.increment('image_cache_revalidated_total')
+                    self.image_cache.touch(image_url)
+                    self.image_cache.link(cached, image_path)
+                    part.discard()
+                    return image_filename
+                if response.status_code == 416:
+                    # O .part nao corresponde mais ao arquivo do servidor: recomeca na proxima tentativa
+                    part.discard()
+                if response.status_code not in (200, 206):
+                    metrics.increment('image_errors_total')
+                    error_msg = f"Erro ao baixar imagem: {response.status_code}"
+                    logger.error(error_msg)
+                    return error_msg
+
+                resumed = part.start(response)
+                if resumed:
+                    metrics.increment('image_resumed_total')
+                    logger.debug("Retomando download de %s a partir de %s bytes", image_url, part.size)
+                if self.max_bytes and part.expected_size and part.expected_size > self.max_bytes:
+                    return self._oversized(image_url, part)
+                for chunk in self._counted(response.iter_content(chunk_size=self.CHUNK_SIZE)):
+                    part.write(chunk)
+                    if self.max_bytes and part.size > self.max_bytes:
+                        return self._oversized(image_url, part)
+                    if time.monotonic() > deadline and part.size != part.expected_size:
+                        # O .part fica no disco: a proxima execucao continua de onde parou
+                        part.close(keep=part.resumable)
+                        metrics.increment('image_timeouts_total')
+                        error_msg = f"Tempo limite excedido ao baixar imagem ({self.deadline:g}s)"
+                        logger.warning("%s: %s", error_msg, image_url)
+                        return error_msg
+                etag, last_modified = part.validators()
+                part.close()
+
+            if self.image_cache:
+                stored = self.image_cache.store_file(image_url, part.path, etag=etag, last_modified=last_modified)
+                self.image_cache.link(stored, image_path)
+            else:
+                os.replace(part.path, image_path)
+            part.discard()
+            metrics.observe('image_download_seconds', time.perf_counter() - start)
+            logger.info("Imagem salva com sucesso em: %s", image_path)
+            return image_filename
+        except Exception as e:
+            metrics.increment('image_errors_total')
+            # Sem validador (ETag/Last-Modified) o .part nao pode ser retomado com seguranca
+            part.close(keep=part.resumable)
+            error_msg = f"Erro ao salvar imagem: {str(e)}"
+            logger.error(error_msg)
+            return error_msg
+
+    def _oversized(self, image_url: str, part: 'PartialDownload') -> str:
+        part.close(keep=False)
+        metrics.increment('image_oversized_total')
+        error_msg = f"Imagem excede o limite de {self.max_bytes} bytes"
+        logger.warning("%s: %s", error_msg, image_url)
+        return error_msg
+
+    def _lock_for(self, image_filename: str) -> threading.Lock:
+        return self._file_locks[hash(image_filename) % self.LOCK_STRIPES]
+
+    @staticmethod
+    def _counted(chunks: Iterable[bytes]) -> Iterator[bytes]:
+        for chunk in chunks:
+            metrics.increment('image_bytes_downloaded_total', len(chunk))
+            yield chunk
+
+    def submit(self, image_url: str, image_filename: str) -> Future:
+        """Agenda o download e retorna um Future com o status."""
+        return submit_in_context(self._executor, self.download, image_url, image_filename)
+
+    def download_all(self, images: Iterable[Tuple[str, str]]) -> List[str]:
+        """Baixa varias imagens (url, nome) e retorna os status na mesma ordem."""
+        futures = [self.submit(url, filename) for url, filename in images]
+        return [future.result() for future in futures]
+
+    def resolve(self, news_list: Iterable[News]) -> Iterator[News]:
+        """Baixa as imagens e devolve cada noticia assim que a imagem dela termina, com o status em image_filename.
+
+        Uma imagem lenta nao segura as demais: as noticias saem na ordem em que ficam prontas
+        (as sem imagem, na hora). No maximo uma janela limitada de downloads fica em andamento,
+        entao a memoria nao cresce com o tamanho da lista.
+        """
+        window = self.max_workers * 4
+        pending: Dict[Future, News] = {}
+        for news in news_list:
+            if news.image_url and news.image_filename:
+                pending[self.submit(news.image_url, news.image_filename)] = news
+            else:
+                news.image_filename = "Sem imagem"
+                yield news
+            # Janela cheia: espera a proxima imagem pronta; senao so recolhe as que ja terminaram
+            yield from self._finished(pending, block=len(pending) >= window)
+        while pending:
+            yield from self._finished(pending, block=True)
+
+    @staticmethod
+    def _finished(pending: Dict[Future, News], block: bool) -> Iterator[News]:
+        if not pending:
+            return
+        done, _ = wait(pending, timeout=None if block else 0, return_when=FIRST_COMPLETED)
+        for future in done:
+            news = pending.pop(future)
+            news.image_filename = future.result()
+            yield news
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        self._session.close()
+        if self.image_cache:
+            self.image_cache.close()
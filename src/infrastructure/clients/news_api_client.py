@@ -1,34 +1,93 @@
+import logging
 import os
+import math
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import List, Dict, Iterator, Optional, Set, Tuple
 import requests
+from requests.adapters import HTTPAdapter
 import time
-from functools import lru_cache
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 from src.domain.entities.news import News
+from src.domain.entities.news_batch import NewsBatch
 from src.domain.services.news_analyzer import NewsAnalyzer
+from src.domain.services.parallel_news_analyzer import ParallelNewsAnalyzer
+from src.infrastructure.cache.image_cache import ImageCache
+from src.infrastructure.cache.response_cache import ResponseCache
+from src.infrastructure.clients.article_parsing import loads_json, parse_pub_date
+from src.infrastructure.clients.date_window_planner import DateWindow, DateWindowPlanner
+from src.infrastructure.clients.rate_limiter import QuotaExhaustedError, RateLimiter, parse_retry_after
 from src.infrastructure.logging.logger import logger
+from src.infrastructure.metrics.metrics import metrics, submit_in_context
+from src.infrastructure.processes.process_pool import process_context
+
+def _preview(body: bytes, limit: int = 500) -> str:
+    """Trecho do corpo para log, decodificado so ate o limite."""
+    text = body[:limit].decode('ascii', 'ignore')
+    return text + "..." if len(body) > limit else text
+
 
 class NewsAPIClient:
-    def __init__(self, search_phrase: str, categories: List[str], months_to_search: int):
+    PAGE_SIZE = 10  # A API retorna 10 artigos por pagina
+    MAX_PAGES = 100  # A API nao pagina alem deste limite
+    PAGE_PREFETCH_FACTOR = 4  # Paginas buscadas adiante por requisicao simultanea
+
+    def __init__(self, search_phrase: str, categories: List[str], months_to_search: int,
+                 response_cache: Optional[ResponseCache] = None, since: Optional[datetime] = None,
+                 seen_ids: Optional[Set[str]] = None, extra_phrases: Optional[List[str]] = None,
+                 session: Optional[requests.Session] = None, rate_limiter: Optional[RateLimiter] = None):
         self.search_phrase = search_phrase.strip() if search_phrase else ""
         self.categories = [cat.lower().strip() for cat in categories] if categories else []
         self.months_to_search = months_to_search
+        # Modo incremental: busca apenas a partir do ultimo artigo ja extraido
+        self.since = since
+        self.seen_ids = seen_ids or set()
+        # Frases contadas alem da SEARCH_PHRASE (uma coluna por frase na saida)
+        self.extra_phrases = [phrase.strip() for phrase in extra_phrases or [] if phrase.strip()]
+        self.whole_words = os.getenv('PHRASE_WHOLE_WORDS', 'false').lower() in ('1', 'true', 'yes', 'sim')
+        # Analise em varios processos para corpora grandes (0 ou 1 = no proprio processo)
+        self.analysis_processes = int(os.getenv('ANALYSIS_PROCESSES', '0'))
         self.api_key = os.getenv('API_KEY')
         if not self.api_key:
             raise ValueError("API_KEY não encontrada no arquivo .env")
         self.api_url = os.getenv('API_URL', "https://api.newsapi.org/v2/everything")
-        self._cache = {}
-        self._last_request_time = 0
-        self._min_request_interval = 2  # Aumentado para 2 segundos entre requisições
+        # Lido uma vez por cliente, nao a cada artigo
+        self.image_base_url = os.getenv('IMAGE_BASE_URL', 'https://static.newsapi.org')
+        self.response_cache = response_cache if response_cache is not None else ResponseCache.from_env()
+        # Janelas ja encerradas nao mudam mais, entao podem ficar mais tempo em cache
+        self.historical_cache_ttl = float(os.getenv('RESPONSE_CACHE_TTL_HISTORICAL', '604800'))
+        # Sessao e rate limiter podem ser compartilhados entre buscas (modo batch);
+        # sem limitador explicito, todos os clientes do processo usam o mesmo
+        self._rate_limiter = rate_limiter or RateLimiter.from_env()
+        self.max_concurrent_requests = max(1, int(os.getenv('MAX_CONCURRENT_REQUESTS', '4')))
+        # (conexao, leitura) em segundos: sem timeout uma conexao travada prende um worker para sempre
+        self.request_timeout = (float(os.getenv('API_CONNECT_TIMEOUT', '10')), float(os.getenv('API_READ_TIMEOUT', '60')))
+        self._session = session or self.create_session(self.max_concurrent_requests)
+        self._window_planner = DateWindowPlanner(
+            max_hits=self.PAGE_SIZE * self.MAX_PAGES,
+            initial_days=int(os.getenv('SEARCH_WINDOW_DAYS', '0'))
+        )
+        self.window_coverage: List[DateWindow] = []
+        # Janelas e paginas que falharam mesmo apos as retentativas (a busca segue sem elas)
+        self.failed_requests = 0
+        # Cota diaria esgotada sem reset: as requisicoes seguintes nem sao enviadas
+        self._quota_error: Optional[QuotaExhaustedError] = None
+
+    @staticmethod
+    def create_session(max_connections: int) -> requests.Session:
+        """Sessao HTTP com pool de conexoes reaproveitadas."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_connections)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
 
     def _wait_for_rate_limit(self):
-        """Espera o tempo necessário para respeitar o rate limit."""
-        current_time = time.time()
-        time_since_last_request = current_time - self._last_request_time
-        if time_since_last_request < self._min_request_interval:
-            time.sleep(self._min_request_interval - time_since_last_request)
-        self._last_request_time = time.time()
+        """Espera o tempo necessário para respeitar o rate limit (compartilhado entre as paginas)."""
+        start = time.perf_counter()
+        self._rate_limiter.wait()
+        metrics.add_stage_time('api_rate_limit_wait', time.perf_counter() - start)
 
     def _build_categories_filter(self) -> str:
         if not self.categories:
@@ -55,142 +114,314 @@ class NewsAPIClient:
         return params
 
     def _extract_article_data(self, doc: Dict) -> Dict:
-        headline = doc.get('headline', {})
-        title = headline.get('main', '') if isinstance(headline, dict) else str(headline)
-        pub_date = datetime.strptime(doc.get('pub_date', ''), "%Y-%m-%dT%H:%M:%S%z")
-        description = doc.get('abstract', '')
-        img_url = self._extract_image_url(doc)
+        """Extrai apenas os campos usados (headline.main, pub_date, abstract, multimedia.default.url)."""
+        headline = doc.get('headline') or {}
         return {
-            'title': title,
-            'date': pub_date,
-            'description': description,
-            'img_url': img_url
+            'id': doc.get('_id') or doc.get('uri') or doc.get('web_url', ''),
+            'title': headline.get('main', '') if isinstance(headline, dict) else str(headline),
+            'date': parse_pub_date(doc.get('pub_date', '')),
+            'description': doc.get('abstract', ''),
+            'img_url': self._extract_image_url(doc)
         }
 
     def _extract_image_url(self, doc: Dict) -> str:
-        multimedia = doc.get('multimedia', {})
-        default = multimedia.get('default', {})
-        url = default.get('url')
+        multimedia = doc.get('multimedia')
+        url = ((multimedia.get('default') or {}).get('url') if isinstance(multimedia, dict) else None)
         if not url:
             return None
-        image_base_url = os.getenv('IMAGE_BASE_URL', 'https://static.newsapi.org')
         if url.startswith('/'):
-            url = f"{image_base_url}{url}"
+            url = f"{self.image_base_url}{url}"
         return url
 
     @retry(
         stop=stop_after_attempt(5),
-        wait=wait_exponential(multiplier=2, min=10, max=60),
-        retry=retry_if_exception_type((requests.exceptions.RequestException, requests.exceptions.HTTPError)),
+        # A pausa apos um 429 fica a cargo do rate limiter (Retry-After); aqui so um backoff curto
+        wait=wait_exponential(multiplier=1, min=1, max=30),
+        retry=retry_if_exception_type((requests.exceptions.Timeout, requests.exceptions.RequestException,
+                                       requests.exceptions.HTTPError)),
+        before_sleep=lambda retry_state: metrics.increment('api_retries_total'),
         reraise=True
     )
     def _make_api_request(self, params: Dict) -> requests.Response:
+        if self._quota_error:
+            raise QuotaExhaustedError(str(self._quota_error))
         self._wait_for_rate_limit()
-        safe_params = params.copy()
-        safe_params.pop('api-key', None)
-        logger.debug(f"Parametros da requisicao: {safe_params}")
-        full_url = requests.Request('GET', self.api_url, params=params).prepare().url
-        logger.debug(f"URL completa da requisicao: {full_url}")
-        response = requests.get(self.api_url, params=params)
-        logger.debug(f"Status da resposta: {response.status_code}")
-        logger.debug(f"Headers da resposta: {dict(response.headers)}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            # Sem a api-key (a URL completa a exporia no log)
+            safe_params = params.copy()
+            safe_params.pop('api-key', None)
+            logger.debug("Requisicao: %s %s", self.api_url, safe_params)
+        start = time.perf_counter()
+        try:
+            response = self._session.get(self.api_url, params=params, timeout=self.request_timeout)
+        except requests.exceptions.Timeout:
+            metrics.increment('api_timeouts_total')
+            logger.warning("Tempo limite excedido na requisicao a API (%.0fs para conectar, %.0fs para ler)",
+                           *self.request_timeout)
+            raise
+        metrics.observe('api_request_seconds', time.perf_counter() - start)
+        # O corpo e lido uma vez, em bytes; response.text (decodificacao completa) nao e usado
+        body = response.content
+        metrics.increment('api_requests_total')
+        metrics.increment('api_bytes_downloaded_total', len(body))
+        logger.debug("Status da resposta: %s", response.status_code)
+        if debug:
+            logger.debug("Headers da resposta: %s", dict(response.headers))
         if response.status_code == 429:
-            logger.warning("Rate limit excedido. Aguardando antes de tentar novamente...")
-            logger.debug(f"Resposta do rate limit: {response.text.encode('ascii', 'ignore').decode()}")
-            time.sleep(20)
+            metrics.increment('api_rate_limited_total')
+            pause = self._rate_limiter.penalize(parse_retry_after(response.headers.get('Retry-After')))
+            logger.warning("Rate limit excedido. Pausando as requisicoes por %.1fs (taxa reduzida para %.3f req/s)",
+                           pause, self._rate_limiter.current_rate)
+            if debug:
+                logger.debug("Resposta do rate limit: %s", _preview(body))
             raise requests.exceptions.HTTPError("Rate limit exceeded")
         if response.status_code != 200:
-            logger.error(f"Erro na requisicao: {response.status_code} - {response.text.encode('ascii', 'ignore').decode()}")
+            metrics.increment('api_errors_total')
+            logger.error("Erro na requisicao: %s - %s", response.status_code, _preview(body, 2000))
             raise requests.exceptions.RequestException(f"Erro na requisicao: {response.status_code}")
-        response_text = response.text[:500] + "..." if len(response.text) > 500 else response.text
-        logger.debug(f"Corpo da resposta: {response_text.encode('ascii', 'ignore').decode()}")
+        # Recupera a taxa aos poucos e respeita os cabecalhos de cota (X-RateLimit-*)
+        try:
+            self._rate_limiter.record_success(response.headers)
+        except QuotaExhaustedError as e:
+            # Esta resposta e valida e segue adiante; a proxima requisicao e que falha
+            logger.error("%s: a busca sera interrompida", e)
+            self._quota_error = e
+        if debug:
+            logger.debug("Corpo da resposta: %s", _preview(body))
         return response
 
-    @lru_cache(maxsize=128)
-    def _get_cached_articles(self, cache_key: str) -> List[Dict]:
-        """Obtém artigos do cache ou faz nova requisição."""
-        logger.debug(f"Cache miss para chave: {cache_key}")
-        return self._get_search_results()
-
-    def _get_search_results(self) -> List[Dict]:
-        """Obtém resultados da busca para todo o período."""
-        cache_key = "all_results"
-        if cache_key in self._cache:
-            logger.debug(f"Cache hit para chave: {cache_key}")
-            return self._cache[cache_key]
-        logger.debug(f"Cache miss para chave: {cache_key}")
-
-        # Calcula o período total
+    def _search_period(self):
+        """Calcula o periodo de busca (1o de janeiro ate o fim do ultimo mes, ou apenas o delta desde `since`)."""
         current_year = datetime.now().year
         begin_date = datetime(current_year, 1, 1)  # Primeiro dia do primeiro mês
         end_date = datetime(current_year, self.months_to_search + 1, 1) - timedelta(days=1)  # Último dia do último mês
+        if self.since:
+            # A API trabalha com dias inteiros; o dia do checkpoint e rebuscado e filtrado por seen_ids
+            since_day = datetime(self.since.year, self.since.month, self.since.day)
+            begin_date = max(begin_date, since_day)
+        return begin_date, end_date
 
-        logger.info(f"Fazendo requisicao para a API - Periodo: {begin_date.strftime('%Y-%m-%d')} ate {end_date.strftime('%Y-%m-%d')}")
-        logger.debug(f"Categorias: {', '.join(self.categories)}")
-        
-        params = self._build_request_params(begin_date, end_date)
-        try:
-            response = self._make_api_request(params)
-            data = response.json()
-        except Exception as e:
-            logger.error(f"Erro ao obter resposta da API: {str(e)}")
-            self._cache[cache_key] = []
-            return []
-        # Processamento seguro do JSON
+    def _response_ttl(self, params: Dict) -> Optional[float]:
+        """TTL da entrada: longo para periodos ja encerrados, padrao do cache para os demais."""
+        if params.get('end_date', '') < datetime.now().strftime('%Y%m%d'):
+            return self.historical_cache_ttl
+        return None
+
+    def _fetch_page(self, params: Dict, page: int) -> Dict:
+        """Busca uma unica pagina de resultados, consultando antes o cache de respostas."""
+        page_params = dict(params)
+        page_params['page'] = page
+        if self.response_cache:
+            cached = self.response_cache.get(self.api_url, page_params)
+            if cached is not None:
+                metrics.increment('response_cache_hits_total')
+                logger.debug("Cache hit para a pagina %s (%s-%s)", page, params['begin_date'], params['end_date'])
+                return cached
+            metrics.increment('response_cache_misses_total')
+        response = self._make_api_request(page_params)
+        data = loads_json(response.content)
+        if self.response_cache:
+            self.response_cache.set(self.api_url, page_params, response.content, self._response_ttl(params))
+        return data
+
+    def _extract_docs(self, data: Dict) -> List[Dict]:
+        """Valida o JSON de uma pagina e retorna a lista de documentos."""
         if not data or 'response' not in data or 'docs' not in data['response']:
-            logger.info(f"Nenhum artigo encontrado para o periodo")
-            self._cache[cache_key] = []
-            return []
-        if data['response']['docs'] is None and data['response'].get('metadata', {}).get('hits', 0) == 0:
-            logger.info(f"Nenhum artigo encontrado para o periodo")
-            self._cache[cache_key] = []
             return []
         if data['response']['docs'] is None:
-            logger.error(f"Campo 'docs' e null mas hits nao e 0: {data['response']}")
-            self._cache[cache_key] = []
+            if data['response'].get('metadata', {}).get('hits', 0) != 0:
+                logger.error("Campo 'docs' e null mas hits nao e 0: %s", data['response'])
             return []
-        logger.info(f"Encontrados {len(data['response']['docs'])} artigos")
-        articles = []
-        for article in data['response']['docs']:
-            try:
-                article_data = self._extract_article_data(article)
-                articles.append(article_data)
-                logger.debug(f"Artigo processado com sucesso: {article_data['title'].encode('ascii', 'ignore').decode()}")
-            except Exception as e:
-                logger.error(f"Erro ao processar artigo: {str(e)}")
-                logger.debug(f"Artigo com erro: {article}")
-                continue
-        logger.info(f"Total de artigos processados com sucesso: {len(articles)}")
-        self._cache[cache_key] = articles
-        return articles
-
-    def fetch_news(self) -> List[News]:
-        news_list = []
-        # Faz uma única requisição para todo o período
-        articles = self._get_search_results()
-        
-        for idx, article in enumerate(articles):
-            search_count, has_money = NewsAnalyzer.analyze_news(
-                article['title'],
-                article['description'],
-                self.search_phrase
-            )
-            img_url = article['img_url']
-            img_filename = f"image_{idx}.jpg" if img_url else ""
-            if img_url and not img_url.startswith('http'):
-                image_base_url = os.getenv('IMAGE_BASE_URL', 'https://static.newsapi.org')
-                img_url = f"{image_base_url}{img_url.lstrip('/')}"
-                logger.debug(f"URL da imagem completa: {img_url}")
-            if img_url:
-                logger.info(f"Imagem a ser baixada: {img_url}")
-            news = News(
-                title=article['title'],
-                date=article['date'],
-                description=article['description'],
-                image_filename=img_filename,
-                image_url=img_url or '',
-                search_phrase_count=search_count,
-                has_money=has_money
-            )
-            news_list.append(news)
-        return news_list 
\ No newline at end of file
+        return data['response']['docs']
+
+    def _count_hits(self, data: Dict) -> int:
+        return (data.get('response') or {}).get('metadata', {}).get('hits', 0) or 0
+
+    def _count_pages(self, data: Dict) -> int:
+        """Calcula quantas paginas existem a partir de response.metadata.hits."""
+        return min(math.ceil(self._count_hits(data) / self.PAGE_SIZE), self.MAX_PAGES)
+
+    def _probe_window(self, window: DateWindow) -> Dict:
+        """Busca a primeira pagina da janela (traz o total de hits)."""
+        params = self._build_request_params(window.begin_date, window.end_date)
+        return self._fetch_page(params, 0)
+
+    def _plan_windows(self, begin_date: datetime, end_date: datetime, executor: ThreadPoolExecutor) -> List[Tuple[DateWindow, Dict]]:
+        """Sonda as janelas em paralelo, estreitando as que passam do limite de paginacao."""
+        windows = self._window_planner.initial_windows(begin_date, end_date)
+        futures = {submit_in_context(executor, self._probe_window, window): window for window in windows}
+        planned = []
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                window = futures.pop(future)
+                try:
+                    first_page = future.result()
+                except QuotaExhaustedError:
+                    raise
+                except Exception as e:
+                    logger.error("Erro ao obter resposta da API para a janela %s: %s", window.label(), e)
+                    self.failed_requests += 1
+                    continue
+                window.hits = self._count_hits(first_page)
+                if self._window_planner.needs_split(window):
+                    logger.debug("Janela %s com %s hits excede o limite, dividindo", window.label(), window.hits)
+                    for half in self._window_planner.split(window):
+                        futures[submit_in_context(executor, self._probe_window, half)] = half
+                    continue
+                if window.hits > self._window_planner.max_hits:
+                    logger.warning("Janela %s tem %s hits e nao pode ser dividida, resultados serao truncados",
+                                   window.label(), window.hits)
+                planned.append((window, first_page))
+        # Mantem a ordenacao 'newest' entre janelas
+        planned.sort(key=lambda item: item[0].begin_date, reverse=True)
+        return planned
+
+    def _log_window_coverage(self, window: DateWindow) -> None:
+        logger.info("Janela %s: %s/%s artigos coletados (%.0f%%)",
+                    window.label(), window.fetched, window.hits, window.coverage * 100)
+
+    def _iter_search_pages(self, begin_date: datetime, end_date: datetime) -> Iterator[List[Dict]]:
+        """Busca as paginas de todas as janelas em paralelo e as entrega em ordem, conforme chegam."""
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrent_requests)
+        try:
+            planned = self._plan_windows(begin_date, end_date, executor)
+            self.window_coverage = [window for window, _ in planned]
+            if not planned:
+                return
+            logger.info("Periodo dividido em %s janela(s)", len(planned))
+
+            # Sequencia global de paginas na ordem de entrega: (janela, ultima pagina?, pagina, params, dados ja obtidos)
+            sequence = deque()
+            for window, first_page in planned:
+                total_pages = max(self._count_pages(first_page), 1)
+                params = self._build_request_params(window.begin_date, window.end_date)
+                for page in range(total_pages):
+                    sequence.append((window, page == total_pages - 1, page, params, first_page if page == 0 else None))
+            logger.info("Total de paginas a buscar: %s", len(sequence))
+
+            # Apenas uma janela limitada de paginas fica em voo (ou pronta aguardando a vez):
+            # se o consumidor for mais lento, a busca espera em vez de acumular paginas na memoria
+            prefetch = self.max_concurrent_requests * self.PAGE_PREFETCH_FACTOR
+            in_flight = deque()
+
+            def submit_next():
+                window, last_page, page, params, data = sequence.popleft()
+                future = submit_in_context(executor, self._fetch_page, params, page) if data is None else None
+                in_flight.append((window, last_page, page, data, future))
+
+            while sequence and len(in_flight) < prefetch:
+                submit_next()
+            while in_flight:
+                window, last_page, page, data, future = in_flight.popleft()
+                if sequence:
+                    submit_next()
+                if future is not None:
+                    try:
+                        data = future.result()
+                    except QuotaExhaustedError:
+                        # Sem cota nao adianta seguir: o job falha em vez de terminar com dados parciais
+                        raise
+                    except Exception as e:
+                        logger.error("Erro ao obter pagina %s: %s", page, e)
+                        self.failed_requests += 1
+                        data = None
+                docs = self._extract_docs(data)
+                window.fetched += len(docs)
+                if last_page:
+                    self._log_window_coverage(window)
+                yield docs
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _iter_articles(self) -> Iterator[Dict]:
+        """Entrega os artigos pagina a pagina, conforme chegam da API ou do cache."""
+        begin_date, end_date = self._search_period()
+        if begin_date > end_date:
+            logger.info("Nenhum periodo novo para buscar desde o ultimo checkpoint")
+            return
+        logger.info("Fazendo requisicao para a API - Periodo: %s ate %s",
+                    begin_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
+        logger.debug("Categorias: %s", ', '.join(self.categories))
+
+        processed = 0
+        for docs in self._iter_search_pages(begin_date, end_date):
+            for article in docs:
+                try:
+                    article_data = self._extract_article_data(article)
+                except Exception as e:
+                    logger.error("Erro ao processar artigo: %s", e)
+                    logger.debug("Artigo com erro: %s", article)
+                    continue
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Artigo processado com sucesso: %s", article_data['title'].encode('ascii', 'ignore').decode())
+                if article_data['id'] and article_data['id'] in self.seen_ids:
+                    continue
+                processed += 1
+                yield article_data
+        if not processed:
+            logger.info("Nenhum artigo encontrado para o periodo")
+        logger.info("Total de artigos processados com sucesso: %s", processed)
+        if self.response_cache:
+            stats = self.response_cache.stats()
+            logger.info("Cache de respostas: %s hit(s), %s miss(es)", stats['hits'], stats['misses'])
+
+    def _get_search_results(self) -> List[Dict]:
+        """Obtém resultados da busca para todo o período."""
+        return list(self._iter_articles())
+
+    def iter_news(self) -> Iterator[News]:
+        """Gera as noticias ja analisadas conforme as paginas chegam (pipeline em streaming)."""
+        analyzer = NewsAnalyzer.for_phrase(self.search_phrase, tuple(self.extra_phrases), self.whole_words)
+        if self.analysis_processes > 1:
+            # A analise em processos precisa do corpus inteiro para dividir em chunks
+            yield from self._fetch_news_parallel(analyzer)
+            return
+
+        for article in self._iter_articles():
+            start = time.perf_counter()
+            analysis = analyzer.analyze_with_phrases(article['title'], article['description'])
+            metrics.add_stage_time('analysis', time.perf_counter() - start)
+            metrics.increment('articles_analyzed_total')
+            yield self._build_news(article, *analysis)
+
+    def fetch_news(self) -> NewsBatch:
+        """Busca e analisa as noticias; o resultado fica em colunas (NewsBatch) para caber em memoria."""
+        if self.analysis_processes > 1:
+            analyzer = NewsAnalyzer.for_phrase(self.search_phrase, tuple(self.extra_phrases), self.whole_words)
+            return self._fetch_news_parallel(analyzer)
+        return NewsBatch(self.iter_news())
+
+    def _fetch_news_parallel(self, analyzer: NewsAnalyzer) -> NewsBatch:
+        """Busca todos os artigos e analisa o corpus em paralelo (ANALYSIS_PROCESSES)."""
+        articles = list(self._iter_articles())
+        parallel_analyzer = ParallelNewsAnalyzer(analyzer, self.analysis_processes,
+                                                 int(os.getenv('ANALYSIS_PARALLEL_MIN_ITEMS', '2000')),
+                                                 mp_context=process_context())
+        start = time.perf_counter()
+        results = parallel_analyzer.analyze_many([(article['title'], article['description']) for article in articles])
+        metrics.add_stage_time('analysis', time.perf_counter() - start)
+        metrics.increment('articles_analyzed_total', len(articles))
+        return NewsBatch(self._build_news(article, *analysis) for article, analysis in zip(articles, results))
+
+    def _build_news(self, article: Dict, search_count: int, has_money: bool, phrase_counts: Dict[str, int]) -> News:
+        img_url = article['img_url']
+        if img_url and not img_url.startswith('http'):
+            img_url = f"{self.image_base_url}{img_url.lstrip('/')}"
+            logger.debug("URL da imagem completa: %s", img_url)
+        # Nome derivado da URL: estavel entre execucoes, independente da posicao do artigo
+        img_filename = ImageCache.filename_for(img_url) if img_url else ""
+        if img_url:
+            logger.debug("Imagem a ser baixada: %s", img_url)
+        return News(
+            title=article['title'],
+            date=article['date'],
+            description=article['description'],
+            image_filename=img_filename,
+            image_url=img_url or '',
+            search_phrase_count=search_count,
+            has_money=has_money,
+            article_id=article['id'],
+            phrase_counts=phrase_counts
+        )
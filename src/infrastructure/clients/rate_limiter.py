@@ -0,0 +1,225 @@
+import asyncio
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterator, Mapping, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Janelas dos cabecalhos de cota (X-RateLimit-Limit-Minute, X-RateLimit-Remaining-Day, ...)
+QUOTA_WINDOWS = {'second': 1, 'minute': 60, 'hour': 3600, 'day': 86400}
+# A partir desta janela, cota esgotada sem reset falha em vez de pausar
+QUOTA_FAIL_WINDOW = QUOTA_WINDOWS['day']
+
+
+class QuotaExhaustedError(RuntimeError):
+    """A cota da API acabou e nao ha horario de reset para esperar."""
+
+
+def _number(value) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+def parse_retry_after(value: Optional[str], now: float = None) -> Optional[float]:
+    """Segundos de espera do Retry-After (em segundos ou data HTTP)."""
+    if not value:
+        return None
+    seconds = _number(value)
+    if seconds is not None:
+        return max(0.0, seconds)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - (now or time.time()))
+    except (TypeError, ValueError):
+        return None
+
+def _reset_time(value: Optional[str], now: float) -> Optional[float]:
+    """Horario em que a cota volta, a partir de um cabecalho X-RateLimit-Reset."""
+    reset = _number(value)
+    if reset is None:
+        return None
+    # Reset pode vir como epoch ou como segundos restantes
+    return reset if reset > 1e9 else now + reset
+
+def parse_quota_headers(headers: Mapping[str, str], now: float) -> Tuple[Optional[float], Optional[float]]:
+    """Taxa maxima permitida pela cota (req/s) e, se a cota acabou, ate quando pausar.
+
+    Cota diaria esgotada sem horario de reset levanta QuotaExhaustedError: pausar um dia
+    inteiro deixaria o job parado sem sinal nenhum.
+    """
+    lowered = {name.lower(): value for name, value in headers.items()}
+    ceiling = None
+    pause_until = None
+    for window, seconds in QUOTA_WINDOWS.items():
+        limit = _number(lowered.get(f'x-ratelimit-limit-{window}'))
+        if limit:
+            ceiling = min(ceiling if ceiling is not None else math.inf, limit / seconds)
+        remaining = _number(lowered.get(f'x-ratelimit-remaining-{window}'))
+        if remaining is not None and remaining <= 0:
+            # Reset da propria janela ou, sem ele, o X-RateLimit-Reset geral
+            reset = _reset_time(lowered.get(f'x-ratelimit-reset-{window}', lowered.get('x-ratelimit-reset')), now)
+            if reset is None and seconds >= QUOTA_FAIL_WINDOW:
+                raise QuotaExhaustedError(f"Cota da API esgotada (janela: {window}) e sem horario de reset")
+            pause_until = max(pause_until or 0.0, reset if reset is not None else now + seconds)
+    remaining = _number(lowered.get('x-ratelimit-remaining'))
+    if remaining is not None and remaining <= 0:
+        reset = _reset_time(lowered.get('x-ratelimit-reset'), now)
+        if reset is not None:
+            pause_until = max(pause_until or 0.0, reset)
+    return ceiling, pause_until
+
+
+class RateLimiter:
+    """Token bucket adaptativo (GCRA) compartilhado entre threads, tarefas asyncio e processos.
+
+    A taxa comeca no maximo configurado, cai pela metade a cada 429 e volta a subir aos
+    poucos a cada resposta bem-sucedida, limitada pelos cabecalhos de cota da API.
+    Retry-After pausa todas as requisicoes ate o horario indicado. Com `state_path`, o
+    estado fica num arquivo protegido por lock, e processos separados dividem o mesmo limite.
+    """
+
+    DECREASE_FACTOR = 0.5
+    INCREASE_FRACTION = 0.1  # fracao da taxa maxima recuperada a cada sucesso
+    MIN_COOLDOWN = 1.0  # pausa apos um 429 sem Retry-After (dobra a cada 429 seguido)
+    MAX_COOLDOWN = 60.0
+
+    _shared: Dict[Tuple, 'RateLimiter'] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_rate: float, burst: int = 1, min_rate: float = None, state_path: Optional[str] = None):
+        self.max_rate = max_rate if max_rate > 0 else math.inf
+        self.burst = max(1, burst)
+        self.min_rate = min_rate or (min(self.max_rate, 1.0) / 10 if math.isfinite(self.max_rate) else 0.1)
+        self.state_path = state_path
+        self._lock = threading.Lock()
+        self._state = self._initial_state()
+
+    @classmethod
+    def from_env(cls) -> 'RateLimiter':
+        """Limitador do processo para a configuracao do .env (o mesmo objeto para todos os clientes)."""
+        interval = float(os.getenv('API_MIN_REQUEST_INTERVAL', '2'))
+        max_rate = 1 / interval if interval > 0 else math.inf
+        burst = int(os.getenv('API_RATE_BURST', '1'))
+        state_path = os.getenv('API_RATE_LIMIT_STATE') or None
+        key = (max_rate, burst, state_path)
+        with cls._shared_lock:
+            limiter = cls._shared.get(key)
+            if limiter is None:
+                limiter = cls._shared[key] = cls(max_rate, burst, state_path=state_path)
+            return limiter
+
+    def _initial_state(self) -> Dict[str, float]:
+        return {'tat': 0.0, 'paused_until': 0.0, 'rate': self.max_rate, 'cooldown': 0.0}
+
+    @contextmanager
+    def _locked_state(self) -> Iterator[Dict[str, float]]:
+        with self._lock:
+            if not self.state_path:
+                yield self._state
+                return
+            directory = os.path.dirname(os.path.abspath(self.state_path))
+            os.makedirs(directory, exist_ok=True)
+            with open(self.state_path + '.lock', 'a+b') as lock_file:
+                _lock_file(lock_file)
+                try:
+                    state = self._read_state()
+                    yield state
+                    with open(self.state_path, 'w', encoding='utf-8') as f:
+                        json.dump(state, f)
+                finally:
+                    _unlock_file(lock_file)
+
+    def _read_state(self) -> Dict[str, float]:
+        state = self._initial_state()
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+        # A taxa maxima e a deste processo, mesmo que outro tenha sido configurado com outra
+        state['rate'] = min(state['rate'], self.max_rate)
+        return state
+
+    def reserve(self) -> float:
+        """Reserva a proxima vaga e retorna quantos segundos esperar por ela."""
+        with self._locked_state() as state:
+            now = time.time()
+            interval = 1 / state['rate'] if math.isfinite(state['rate']) else 0.0
+            tat = max(state['tat'], now, state['paused_until'])
+            allowed_at = max(tat - interval * (self.burst - 1), now, state['paused_until'])
+            state['tat'] = tat + interval
+        return allowed_at - now
+
+    def wait(self) -> None:
+        """Bloqueia ate a vaga reservada."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self) -> None:
+        """Versao para asyncio: espera sem bloquear o event loop."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def penalize(self, retry_after: Optional[float] = None) -> float:
+        """Registra um 429: pausa todos ate Retry-After (ou um cooldown crescente) e reduz a taxa."""
+        with self._locked_state() as state:
+            now = time.time()
+            if retry_after is None:
+                retry_after = min(max(state['cooldown'] * 2, self.MIN_COOLDOWN), self.MAX_COOLDOWN)
+                state['cooldown'] = retry_after
+            state['paused_until'] = max(state['paused_until'], now + retry_after)
+            if math.isfinite(state['rate']):
+                state['rate'] = max(self.min_rate, state['rate'] * self.DECREASE_FACTOR)
+            return retry_after
+
+    def record_success(self, headers: Mapping[str, str] = None) -> None:
+        """Registra uma resposta bem-sucedida: recupera a taxa, respeitando os cabecalhos de cota."""
+        # Cota esgotada sem reset falha aqui, antes de mexer no estado compartilhado
+        now = time.time()
+        ceiling, pause_until = parse_quota_headers(headers or {}, now)
+        with self._locked_state() as state:
+            limit = min(self.max_rate, ceiling) if ceiling else self.max_rate
+            state['cooldown'] = 0.0
+            if math.isfinite(limit):
+                step = limit * self.INCREASE_FRACTION
+                state['rate'] = min(limit, state['rate'] + step)
+            else:
+                state['rate'] = limit
+            if pause_until:
+                state['paused_until'] = max(state['paused_until'], pause_until)
+
+    @property
+    def current_rate(self) -> float:
+        with self._locked_state() as state:
+            return state['rate']
+
+
+def _lock_file(lock_file) -> None:
+    if fcntl:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+    else:
+        lock_file.seek(0)
+        while True:
+            try:
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                time.sleep(0.01)
+
+def _unlock_file(lock_file) -> None:
+    if fcntl:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    else:
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,38 @@
+import os
+from dataclasses import dataclass
+from typing import Dict, Optional
+import requests
+from src.infrastructure.cache.image_cache import ImageCache
+from src.infrastructure.cache.response_cache import ResponseCache
+from src.infrastructure.clients.image_downloader import ImageDownloader
+from src.infrastructure.clients.news_api_client import NewsAPIClient
+from src.infrastructure.clients.rate_limiter import RateLimiter
+
+@dataclass
+class SharedClients:
+    """Recursos reaproveitados entre varias buscas no mesmo processo (modo batch)."""
+    session: requests.Session
+    rate_limiter: RateLimiter
+    response_cache: Optional[ResponseCache]
+    image_downloader: ImageDownloader
+
+    @classmethod
+    def from_env(cls, images_dir: str, parallel_jobs: int = 1) -> 'SharedClients':
+        max_concurrent_requests = max(1, int(os.getenv('MAX_CONCURRENT_REQUESTS', '4')))
+        return cls(
+            session=NewsAPIClient.create_session(max_concurrent_requests * parallel_jobs),
+            # Um unico limitador: o intervalo vale para o processo todo, nao para cada busca
+            rate_limiter=RateLimiter.from_env(),
+            response_cache=ResponseCache.from_env(),
+            image_downloader=ImageDownloader(images_dir, image_cache=ImageCache.from_env())
+        )
+
+    def client_options(self) -> Dict:
+        """Argumentos para o NewsAPIClient usar os recursos compartilhados."""
+        return {'session': self.session, 'rate_limiter': self.rate_limiter, 'response_cache': self.response_cache}
+
+    def close(self) -> None:
+        self.image_downloader.close()
+        self.session.close()
+        if self.response_cache:
+            self.response_cache.close()
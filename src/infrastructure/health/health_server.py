@@ -0,0 +1,67 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict
+from urllib.parse import urlparse
+from src.infrastructure.metrics.metrics import metrics
+
+class HealthServer(ThreadingHTTPServer):
+    """Endpoint HTTP local do modo servico: /health, /status (JSON) e /metrics (Prometheus)."""
+
+    daemon_threads = True
+
+    def __init__(self, status_provider: Callable[[], Dict], host: str = '127.0.0.1', port: int = 0):
+        self.status_provider = status_provider
+        self._thread = None
+        super().__init__((host, port), HealthHandler)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'HealthServer':
+        self._thread = threading.Thread(target=self.serve_forever, name='health-server', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> 'HealthServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+class HealthHandler(BaseHTTPRequestHandler):
+    server: HealthServer
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if path == '/health':
+            status = self.server.status_provider()
+            self._send(200 if status.get('healthy') else 503, 'application/json',
+                       json.dumps({'status': 'ok' if status.get('healthy') else 'unhealthy', 'state': status.get('state')}))
+        elif path == '/status':
+            payload = {**self.server.status_provider(), 'metrics': metrics.snapshot()}
+            self._send(200, 'application/json', json.dumps(payload, default=str))
+        elif path == '/metrics':
+            self._send(200, 'text/plain; version=0.0.4', metrics.to_prometheus())
+        else:
+            self._send(404, 'application/json', json.dumps({'error': 'not found'}))
+
+    def _send(self, status: int, content_type: str, body: str):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
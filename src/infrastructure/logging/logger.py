@@ -1,36 +1,96 @@
+import atexit
+import copy
+import json
 import logging
 import os
+import queue
+import threading
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+class DeferredQueueHandler(QueueHandler):
+    """QueueHandler que nao formata a mensagem na thread chamadora.
+
+    A formatacao (e o `%` dos argumentos) acontece na thread do QueueListener.
+    A fila e em memoria, entao o registro nao precisa ser serializavel.
+    """
+
+    def prepare(self, record):
+        return copy.copy(record)
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Um objeto JSON por linha, para ingestao estruturada dos logs."""
+
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'message': record.getMessage()
+        }
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+# O logger existe desde o import, mas sem handlers: diretorio e arquivos de log so sao
+# criados em setup_logger(), chamado pelo ponto de entrada depois de carregar o .env
+logger = logging.getLogger('news_extractor')
+_configured = False
+_setup_lock = threading.Lock()
 
 def setup_logger():
+    """Configura os handlers do logger (idempotente)."""
+    global _configured
+    with _setup_lock:
+        if not _configured:
+            _configure(logger)
+            _configured = True
+    return logger
+
+def _configure(logger):
     # Cria o diretório de logs se não existir
     log_dir = os.getenv('LOG_DIR', 'logs')
     os.makedirs(log_dir, exist_ok=True)
-    
+
     # Configura o logger
-    logger = logging.getLogger('news_extractor')
-    logger.setLevel(logging.DEBUG)
-    
+    level = getattr(logging, os.getenv('LOG_LEVEL', 'INFO').upper(), logging.INFO)
+    logger.setLevel(level)
+
     # Formato do log
     formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    
+
     # Handler para arquivo
     log_file = os.path.join(log_dir, f'news_extractor_{datetime.now().strftime("%Y%m%d")}.log')
     file_handler = RotatingFileHandler(log_file, maxBytes=10485760, backupCount=5)
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(formatter)
-    
+
     # Handler para console
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
-    
-    # Adiciona os handlers ao logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-    
-    return logger
 
-# Cria o logger global
-logger = setup_logger() 
\ No newline at end of file
+    handlers = [file_handler, console_handler]
+
+    # Sink opcional em JSON lines
+    json_path = os.getenv('LOG_JSON_PATH')
+    if json_path:
+        json_handler = RotatingFileHandler(json_path, maxBytes=10485760, backupCount=5)
+        json_handler.setLevel(logging.DEBUG)
+        json_handler.setFormatter(JsonLinesFormatter())
+        handlers.append(json_handler)
+
+    # Modo assincrono: a thread que loga so enfileira, a escrita em disco fica com o listener
+    if os.getenv('LOG_ASYNC', 'true').lower() in ('1', 'true', 'yes', 'sim'):
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        handlers = [DeferredQueueHandler(log_queue)]
+
+    # Adiciona os handlers ao logger
+    for handler in handlers:
+        logger.addHandler(handler)
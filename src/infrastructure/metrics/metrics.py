@@ -0,0 +1,177 @@
+import bisect
+import contextvars
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional, Sequence
+
+# Limites (em segundos) dos buckets dos histogramas de latencia
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+METRIC_PREFIX = 'news_extractor'
+
+
+class Histogram:
+    """Histograma cumulativo no estilo Prometheus (buckets fixos, soma e contagem)."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # ultimo = +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Estimativa do quantil pelo limite superior do bucket (max no bucket +Inf)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            if cumulative >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict:
+        return {
+            'count': self.count,
+            'sum': round(self.sum, 6),
+            'mean': round(self.sum / self.count, 6) if self.count else 0.0,
+            'max': round(self.max, 6),
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99)
+        }
+
+
+class MetricsRegistry:
+    """Contadores, tempos por etapa e histogramas de uma execucao (seguro entre threads).
+
+    `scope()` abre um registro separado (por job, por exemplo) que recebe, alem deste, tudo
+    o que for medido no mesmo contexto, inclusive nas threads iniciadas com `submit_in_context`.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._scopes = contextvars.ContextVar(f'metrics_scopes_{id(self)}', default=())
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counters: Dict[str, float] = {}
+            self.stage_seconds: Dict[str, float] = {}
+            self.histograms: Dict[str, Histogram] = {}
+
+    def increment(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+        for scope in self._scopes.get():
+            scope.increment(name, value)
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.observe(seconds)
+        for scope in self._scopes.get():
+            scope.observe(name, seconds)
+
+    def add_stage_time(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+        for scope in self._scopes.get():
+            scope.add_stage_time(stage, seconds)
+
+    @contextmanager
+    def scope(self) -> Iterator['MetricsRegistry']:
+        """Registro proprio para o bloco (job, ciclo...); o registro global continua acumulando tudo."""
+        registry = MetricsRegistry()
+        token = self._scopes.set(self._scopes.get() + (registry,))
+        try:
+            yield registry
+        finally:
+            self._scopes.reset(token)
+
+    @contextmanager
+    def stage(self, stage: str) -> Iterator[None]:
+        """Acumula o tempo gasto no bloco na etapa informada."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_stage_time(stage, time.perf_counter() - start)
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                'counters': dict(sorted(self.counters.items())),
+                'stage_seconds': {stage: round(seconds, 6) for stage, seconds in sorted(self.stage_seconds.items())},
+                'histograms': {name: histogram.to_dict() for name, histogram in sorted(self.histograms.items())}
+            }
+
+    def to_prometheus(self, gauges: Optional[Dict[str, float]] = None) -> str:
+        """Formato texto do Prometheus (para o textfile collector do node_exporter)."""
+        lines = []
+        with self._lock:
+            for name, value in sorted((gauges or {}).items()):
+                lines.append(f"# TYPE {METRIC_PREFIX}_{name} gauge")
+                lines.append(f"{METRIC_PREFIX}_{name} {value}")
+            for name, value in sorted(self.counters.items()):
+                lines.append(f"# TYPE {METRIC_PREFIX}_{name} counter")
+                lines.append(f"{METRIC_PREFIX}_{name} {value}")
+            if self.stage_seconds:
+                lines.append(f"# TYPE {METRIC_PREFIX}_stage_seconds gauge")
+                for stage, seconds in sorted(self.stage_seconds.items()):
+                    lines.append(f'{METRIC_PREFIX}_stage_seconds{{stage="{stage}"}} {seconds:.6f}')
+            for name, histogram in sorted(self.histograms.items()):
+                metric = f"{METRIC_PREFIX}_{name}"
+                lines.append(f"# TYPE {metric} histogram")
+                cumulative = 0
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    lines.append(f'{metric}_bucket{{le="{bound}"}} {cumulative}')
+                lines.append(f'{metric}_bucket{{le="+Inf"}} {histogram.count}')
+                lines.append(f"{metric}_sum {histogram.sum:.6f}")
+                lines.append(f"{metric}_count {histogram.count}")
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path: str, gauges: Optional[Dict[str, float]] = None) -> None:
+        _write_atomic(path, self.to_prometheus(gauges))
+
+    def write_json(self, path: str, run_info: Optional[Dict] = None) -> None:
+        report = dict(run_info or {})
+        report.update(self.snapshot())
+        _write_atomic(path, json.dumps(report, ensure_ascii=False, indent=2, default=str))
+
+
+def submit_in_context(executor: Executor, fn: Callable, *args) -> Future:
+    """executor.submit levando o contexto atual: o que a tarefa medir vai para os escopos abertos aqui."""
+    return executor.submit(contextvars.copy_context().run, fn, *args)
+
+def _write_atomic(path: str, content: str) -> None:
+    """Grava via temporario + rename: o coletor nunca le um arquivo pela metade."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+# Registro global da execucao
+metrics = MetricsRegistry()
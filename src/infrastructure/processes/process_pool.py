@@ -0,0 +1,11 @@
+import multiprocessing
+from multiprocessing.context import BaseContext
+
+# Os pools de processos sobem com spawn, nunca com fork: o processo principal tem threads vivas
+# (listener de log, pool de imagens, prefetch da API) e um fork copiaria locks presos por elas.
+# O custo e reimportar os modulos em cada worker, pago uma vez por pool
+PROCESS_START_METHOD = 'spawn'
+
+def process_context() -> BaseContext:
+    """Contexto de multiprocessing usado por todos os pools de processos do extrator."""
+    return multiprocessing.get_context(PROCESS_START_METHOD)
@@ -0,0 +1,150 @@
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional
+from src.domain.entities.news import News
+from src.domain.repositories.news_repository import NewsRepository
+from src.infrastructure.cache.image_cache import ImageCache
+from src.infrastructure.clients.image_downloader import ImageDownloader
+from src.infrastructure.logging.logger import logger
+
+RECORD_FIELDS = ['title', 'date', 'description', 'image', 'search_phrase_count', 'has_money', 'article_id']
+
+def news_to_record(news: News) -> Dict:
+    """Representacao plana de uma noticia para os formatos tabulares."""
+    return {
+        'title': news.title,
+        'date': news.date.isoformat(),
+        'description': news.description,
+        'image': news.image_filename,
+        'search_phrase_count': news.search_phrase_count,
+        'has_money': news.has_money,
+        'article_id': news.article_id,
+        'phrase_counts': news.phrase_counts
+    }
+
+def phrase_column(phrase: str) -> str:
+    """Nome da coluna com a contagem de uma frase adicional."""
+    return f"count:{phrase}"
+
+def batched(items: Iterable, size: int) -> Iterator[List]:
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+class NewsWriter(ABC):
+    """Escritor incremental de um formato de saida: recebe lotes e grava ao fechar."""
+
+    @abstractmethod
+    def write(self, news_batch: List[News]) -> None:
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """Conclui a escrita e publica o arquivo."""
+        pass
+
+    @abstractmethod
+    def abort(self) -> None:
+        """Descarta a escrita em andamento, mantendo o arquivo anterior."""
+        pass
+
+
+class AtomicFileWriter(NewsWriter):
+    """Base para escritores que gravam num temporario ao lado do destino e renomeiam no close."""
+
+    def __init__(self, output_path: str):
+        self.output_path = output_path
+        directory = os.path.dirname(os.path.abspath(output_path))
+        os.makedirs(directory, exist_ok=True)
+        suffix = os.path.splitext(output_path)[1] + '.tmp'
+        fd, self.temp_path = tempfile.mkstemp(dir=directory, suffix=suffix)
+        os.close(fd)
+
+    def _publish(self) -> None:
+        os.replace(self.temp_path, self.output_path)
+
+    def _discard(self) -> None:
+        if os.path.exists(self.temp_path):
+            os.remove(self.temp_path)
+
+
+class BatchNewsRepository(NewsRepository):
+    """Repositorio que grava em lotes atraves de um NewsWriter (um por formato)."""
+
+    def __init__(self, output_path: str, images_dir: str, image_downloader: Optional[ImageDownloader] = None,
+                 batch_size: int = None, phrase_columns: Optional[List[str]] = None):
+        self.output_path = output_path
+        # Frases adicionais: uma coluna de contagem por frase nos formatos tabulares
+        self.phrase_columns = list(phrase_columns or [])
+        self.images_dir = images_dir
+        if not os.path.exists(images_dir):
+            os.makedirs(images_dir)
+        self.image_downloader = image_downloader or ImageDownloader(images_dir, image_cache=ImageCache.from_env())
+        self.batch_size = batch_size or int(os.getenv('OUTPUT_BATCH_SIZE', '1000'))
+        self._writer: Optional[NewsWriter] = None
+        self._merge = False
+        self._appended = 0
+
+    @abstractmethod
+    def open_writer(self, merge: bool = False) -> NewsWriter:
+        """Abre um escritor; com `merge` o conteudo ja existente e preservado."""
+        pass
+
+    def output_paths(self) -> List[str]:
+        return [self.output_path]
+
+    def save_news(self, news_list: Iterable[News]) -> None:
+        self._write_all(news_list, merge=False)
+
+    def merge_news(self, news_list: Iterable[News]) -> None:
+        self._write_all(news_list, merge=True)
+
+    def _write_all(self, news_list: Iterable[News], merge: bool) -> None:
+        self.open(merge)
+        try:
+            self.append(news_list)
+        except Exception:
+            self.abort()
+            raise
+        self.close()
+
+    def open(self, merge: bool = False) -> None:
+        if self._writer is not None:
+            raise RuntimeError("A saida ja esta aberta")
+        self._writer = self.open_writer(merge)
+        self._merge = merge
+        self._appended = 0
+
+    def append(self, news_list: Iterable[News]) -> None:
+        """Baixa as imagens e grava em lotes conforme as noticias chegam (abre a saida se preciso)."""
+        if self._writer is None:
+            self.open()
+        for batch in batched(self.image_downloader.resolve(news_list), self.batch_size):
+            self._writer.write(batch)
+            self._appended += len(batch)
+
+    def close(self) -> None:
+        writer, self._writer = self._writer, None
+        if writer is None:
+            return
+        if self._merge and not self._appended and all(os.path.exists(path) for path in self.output_paths()):
+            # Nada novo para mesclar: a saida anterior ja esta correta e nao precisa ser reescrita
+            writer.abort()
+            logger.info("Nenhuma noticia nova; saida mantida: %s", ', '.join(self.output_paths()))
+            return
+        writer.close()
+
+    def abort(self) -> None:
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.abort()
+
+    def save_image(self, image_url: str, image_filename: str) -> None:
+        """Metodo para compatibilidade com a interface."""
+        self.image_downloader.download(image_url, image_filename)
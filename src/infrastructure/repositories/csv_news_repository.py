@@ -0,0 +1,66 @@
+import csv
+import os
+import shutil
+from typing import Dict, List, Optional
+from src.domain.entities.news import News
+from src.infrastructure.logging.logger import logger
+from src.infrastructure.repositories.batch_news_repository import (
+    RECORD_FIELDS, AtomicFileWriter, BatchNewsRepository, NewsWriter, news_to_record, phrase_column
+)
+
+class CsvNewsWriter(AtomicFileWriter):
+    def __init__(self, csv_path: str, merge: bool = False, phrase_columns: Optional[List[str]] = None):
+        super().__init__(csv_path)
+        self.count = 0
+        self.phrase_columns = list(phrase_columns or [])
+        self._file = open(self.temp_path, 'w', newline='', encoding='utf-8')
+        self.fieldnames = RECORD_FIELDS + [phrase_column(phrase) for phrase in self.phrase_columns]
+        self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames)
+        self._writer.writeheader()
+        self._existing_path = csv_path if merge and os.path.exists(csv_path) else None
+
+    def write(self, news_batch: List[News]) -> None:
+        self._writer.writerows(self._row(news) for news in news_batch)
+        self.count += len(news_batch)
+
+    def _row(self, news: News) -> Dict:
+        row = news_to_record(news)
+        phrase_counts = row.pop('phrase_counts')
+        for phrase in self.phrase_columns:
+            row[phrase_column(phrase)] = phrase_counts.get(phrase, 0)
+        return row
+
+    def close(self) -> None:
+        try:
+            if self._existing_path:
+                # Linhas da execucao anterior vem depois das novas
+                self._copy_existing()
+            self._file.close()
+            self._publish()
+        except Exception:
+            self.abort()
+            raise
+        logger.info("Arquivo CSV salvo com sucesso em '%s' (%s linhas novas)", self.output_path, self.count)
+
+    def _copy_existing(self) -> None:
+        with open(self._existing_path, 'r', newline='', encoding='utf-8') as existing:
+            header = next(csv.reader(existing), None)
+            if header == self.fieldnames:
+                # Mesmas colunas: o corpo e copiado como esta (sem o cabecalho)
+                shutil.copyfileobj(existing, self._file)
+                return
+            # Colunas mudaram (ex.: EXTRA_PHRASES): cada linha antiga e remapeada pelo nome da coluna.
+            # Frases novas ficam vazias nas linhas antigas e colunas que sairam sao descartadas
+            logger.warning("Colunas do CSV anterior diferem das atuais; linhas antigas remapeadas: %s",
+                           self._existing_path)
+            reader = csv.DictReader(existing, fieldnames=header or [])
+            self._writer.writerows({name: row.get(name) or '' for name in self.fieldnames} for row in reader)
+
+    def abort(self) -> None:
+        self._file.close()
+        self._discard()
+
+
+class CsvNewsRepository(BatchNewsRepository):
+    def open_writer(self, merge: bool = False) -> NewsWriter:
+        return CsvNewsWriter(self.output_path, merge, self.phrase_columns)
@@ -1,50 +1,62 @@
 import os
-from datetime import datetime
-import requests
-from openpyxl import Workbook
+from copy import copy
+from typing import Iterable, Iterator, List, Optional
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
 from src.domain.entities.news import News
-from src.domain.repositories.news_repository import NewsRepository
+from src.infrastructure.clients.image_downloader import ImageDownloader
 from src.infrastructure.logging.logger import logger
-
-class ExcelNewsRepository(NewsRepository):
-    def __init__(self, excel_path: str, images_dir: str):
-        self.excel_path = excel_path
-        self.images_dir = images_dir
-        if not os.path.exists(images_dir):
-            os.makedirs(images_dir)
-
-    def _download_image(self, image_url: str, image_filename: str) -> str:
-        """Download sincrono de imagem. Retorna o status do download."""
-        if not image_url:
-            return "URL não fornecida"
-
-        try:
-            logger.debug(f"Tentando baixar imagem de: {image_url}")
-            response = requests.get(image_url)
-            logger.debug(f"Status da resposta: {response.status_code}")
-            
-            if response.status_code == 200:
-                image_path = os.path.join(self.images_dir, image_filename)
-                with open(image_path, 'wb') as f:
-                    f.write(response.content)
-                logger.info(f"Imagem salva com sucesso em: {image_path}")
-                return image_filename
-            else:
-                error_msg = f"Erro ao baixar imagem: {response.status_code}"
-                logger.error(error_msg)
-                return error_msg
-        except Exception as e:
-            error_msg = f"Erro ao salvar imagem: {str(e)}"
-            logger.error(error_msg)
-            return error_msg
-
-    def save_news(self, news_list: list[News]) -> None:
-        # Criar nova planilha
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Notícias"
+from src.infrastructure.repositories.batch_news_repository import AtomicFileWriter, BatchNewsRepository, NewsWriter
+
+HEADERS = ['Titulo', 'Data', 'Descricao', 'Imagem', 'Contagem da Frase', 'Contem Valor']
+
+def excel_headers(phrase_columns: List[str]) -> List[str]:
+    return HEADERS + [f"Contagem: {phrase}" for phrase in phrase_columns]
+
+def excel_row(news: News, phrase_columns: List[str]) -> list:
+    return [
+        news.title,
+        news.date.strftime('%Y-%m-%d %H:%M:%S'),
+        news.description,
+        news.image_filename,
+        news.search_phrase_count,
+        "Sim" if news.has_money else "Nao"
+    ] + [news.phrase_counts.get(phrase, 0) for phrase in phrase_columns]
+
+def sheet_rows(ws, headers: List[str]) -> Iterator[tuple]:
+    """Linhas de uma aba de saida anterior nas colunas atuais, casadas pelo cabecalho.
+
+    Se EXTRA_PHRASES mudou entre as execucoes, cada valor vai para a coluna de mesmo nome:
+    frases novas ficam vazias nas linhas antigas e colunas que sairam sao descartadas.
+    """
+    rows = ws.iter_rows(values_only=True)
+    header = list(next(rows, None) or [])
+    if header == headers:
+        yield from rows
+        return
+    logger.warning("Colunas da planilha anterior diferem das atuais; linhas antigas remapeadas: %s", ws.title)
+    positions = {name: idx for idx, name in enumerate(header) if name is not None}
+    order = [positions.get(name) for name in headers]
+    for row in rows:
+        yield tuple(row[idx] if idx is not None and idx < len(row) else None for idx in order)
+
+
+class ExcelSheetWriter:
+    """Escreve linhas ja formatadas numa aba de uma planilha write-only, com cabecalho e estilos."""
+
+    MAX_COLUMN_WIDTH = 100  # Limita a largura máxima
+    # No modo write-only as larguras precisam ser definidas antes da primeira linha,
+    # entao sao calculadas sobre as primeiras linhas (as demais quebram texto na celula)
+    WIDTH_SAMPLE_ROWS = 1000
+
+    def __init__(self, ws, headers: List[str]):
+        self._ws = ws
+        self.headers = headers
+        self.count = 0
+        self._sample = []
+        self._started = False
 
         # Definir estilos
         header_font = Font(bold=True, size=12)
@@ -58,86 +70,138 @@ class ExcelNewsRepository(NewsRepository):
             bottom=Side(style='thin')
         )
 
-        # Definir cabeçalhos
-        headers = ['Titulo', 'Data', 'Descricao', 'Imagem', 'Contagem da Frase', 'Contem Valor']
-
-        # Aplicar estilos aos cabeçalhos
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col)
-            cell.value = header
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_alignment
-            cell.border = thin_border
-
-        # Download das imagens e preparação dos dados
-        processed_news = []
-        for news in news_list:
-            if news.image_url and news.image_filename:
-                image_status = self._download_image(news.image_url, news.image_filename)
-                news.image_filename = image_status
-            else:
-                news.image_filename = "Sem imagem"
-            processed_news.append(news)
-
-        # Adicionar dados
-        for row, news in enumerate(processed_news, 2):
-            # Titulo
-            cell = ws.cell(row=row, column=1)
-            cell.value = news.title
-            cell.alignment = cell_alignment
-            cell.border = thin_border
-
-            # Data
-            cell = ws.cell(row=row, column=2)
-            cell.value = news.date.strftime('%Y-%m-%d %H:%M:%S')
-            cell.alignment = cell_alignment
-            cell.border = thin_border
-
-            # Descricao
-            cell = ws.cell(row=row, column=3)
-            cell.value = news.description
-            cell.alignment = cell_alignment
-            cell.border = thin_border
-
-            # Imagem
-            cell = ws.cell(row=row, column=4)
-            cell.value = news.image_filename
-            cell.alignment = cell_alignment
-            cell.border = thin_border
-
-            # Contagem da Frase
-            cell = ws.cell(row=row, column=5)
-            cell.value = news.search_phrase_count
-            cell.alignment = cell_alignment
-            cell.border = thin_border
-
-            # Contem Valor
-            cell = ws.cell(row=row, column=6)
-            cell.value = "Sim" if news.has_money else "Nao"
-            cell.alignment = cell_alignment
-            cell.border = thin_border
-
-        # Ajustar largura das colunas
-        for column in ws.columns:
-            max_length = 0
-            column_letter = get_column_letter(column[0].column)
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 100)  # Limita a largura máxima
-            ws.column_dimensions[column_letter].width = adjusted_width
+        # Os estilos sao registrados uma unica vez; cada celula so copia os indices
+        self._header_template = WriteOnlyCell(self._ws)
+        self._header_template.font = header_font
+        self._header_template.fill = header_fill
+        self._header_template.alignment = header_alignment
+        self._header_template.border = thin_border
+        self._cell_template = WriteOnlyCell(self._ws)
+        self._cell_template.alignment = cell_alignment
+        self._cell_template.border = thin_border
+
+    def write_rows(self, rows: Iterable[list]) -> None:
+        if self._started:
+            self._append_rows(rows)
+            return
+        self._sample.extend(rows)
+        if len(self._sample) >= self.WIDTH_SAMPLE_ROWS:
+            self._start()
+
+    def finish(self) -> None:
+        """Garante o cabecalho mesmo numa aba sem linhas e descarrega a amostra pendente."""
+        if not self._started:
+            self._start()
+
+    def _start(self) -> None:
+        """Define larguras e cabecalho a partir da amostra e descarrega as linhas acumuladas."""
+        # Ajustar largura das colunas conforme as primeiras linhas chegam
+        widths = [len(header) for header in self.headers]
+        for values in self._sample:
+            for idx, value in enumerate(values[:len(widths)]):
+                length = len(str(value))
+                if length > widths[idx]:
+                    widths[idx] = length
+        for col, width in enumerate(widths, 1):
+            self._ws.column_dimensions[get_column_letter(col)].width = min(width + 2, self.MAX_COLUMN_WIDTH)
 
         # Congelar cabeçalho
-        ws.freeze_panes = 'A2'
+        self._ws.freeze_panes = 'A2'
+
+        self._ws.append([self._styled_cell(header, self._header_template) for header in self.headers])
+        self._started = True
+        sample, self._sample = self._sample, []
+        self._append_rows(sample)
+
+    def _append_rows(self, rows: Iterable[list]) -> None:
+        for values in rows:
+            self._ws.append([self._styled_cell(value, self._cell_template) for value in values])
+            self.count += 1
+
+    def _styled_cell(self, value, template: WriteOnlyCell) -> WriteOnlyCell:
+        cell = WriteOnlyCell(self._ws, value)
+        cell._style = copy(template._style)
+        return cell
+
+
+class ExcelNewsWriter(AtomicFileWriter):
+    HEADERS = HEADERS
+    MAX_COLUMN_WIDTH = ExcelSheetWriter.MAX_COLUMN_WIDTH
+
+    def __init__(self, excel_path: str, merge: bool = False, phrase_columns: Optional[List[str]] = None):
+        super().__init__(excel_path)
+        self.merge = merge and os.path.exists(excel_path)
+        self.phrase_columns = list(phrase_columns or [])
+        self.headers = excel_headers(self.phrase_columns)
+
+        # Planilha em modo streaming: as linhas vao direto para o disco
+        self._wb = Workbook(write_only=True)
+        self._sheet = ExcelSheetWriter(self._wb.create_sheet("Notícias"), self.headers)
 
-        # Salvar arquivo
-        wb.save(self.excel_path)
-        logger.info(f"Arquivo Excel salvo com sucesso em '{self.excel_path}'")
+    @property
+    def count(self) -> int:
+        return self._sheet.count
 
-    def save_image(self, image_url: str, image_filename: str) -> None:
-        """Metodo para compatibilidade com a interface."""
-        self._download_image(image_url, image_filename) 
\ No newline at end of file
+    def row_values(self, news: News) -> list:
+        return excel_row(news, self.phrase_columns)
+
+    def write(self, news_batch: List[News]) -> None:
+        self._sheet.write_rows([self.row_values(news) for news in news_batch])
+
+    def write_rows(self, rows: Iterable[list]) -> None:
+        """Grava linhas ja formatadas (usado pelas partes da saida dividida)."""
+        self._sheet.write_rows(rows)
+
+    def save(self) -> None:
+        """Grava a planilha no temporario sem publicar (quem chama decide quando renomear)."""
+        try:
+            self._sheet.finish()
+            if self.merge:
+                # Linhas da execucao anterior vem depois das novas
+                existing = load_workbook(self.output_path, read_only=True)
+                try:
+                    self._sheet.write_rows(sheet_rows(existing.active, self.headers))
+                finally:
+                    existing.close()
+            self._wb.save(self.temp_path)
+        except Exception:
+            self._discard()
+            raise
+
+    def close(self) -> None:
+        # Salvar arquivo (temporario + rename, o arquivo anterior segue legivel ate o fim)
+        self.save()
+        try:
+            self._publish()
+        except Exception:
+            self._discard()
+            raise
+        logger.info("Arquivo Excel salvo com sucesso em '%s' (%s linhas)", self.output_path, self.count)
+
+    def abort(self) -> None:
+        self._discard()
+
+
+class ExcelNewsRepository(BatchNewsRepository):
+    """Saida Excel; com EXCEL_SHARD_BY (month ou rows) a saida e dividida em partes com um indice."""
+
+    def __init__(self, excel_path: str, images_dir: str, image_downloader: Optional[ImageDownloader] = None,
+                 batch_size: int = None, phrase_columns: Optional[List[str]] = None, shard_by: Optional[str] = None,
+                 shard_rows: int = None, shard_layout: Optional[str] = None, shard_processes: int = None):
+        super().__init__(excel_path, images_dir, image_downloader, batch_size, phrase_columns)
+        self.excel_path = excel_path
+        self.shard_by = (shard_by if shard_by is not None else os.getenv('EXCEL_SHARD_BY', '')).strip().lower()
+        self.shard_rows = shard_rows or int(os.getenv('EXCEL_SHARD_ROWS', '100000'))
+        self.shard_layout = (shard_layout or os.getenv('EXCEL_SHARD_LAYOUT', 'workbooks')).strip().lower()
+        self.shard_processes = shard_processes if shard_processes is not None else int(os.getenv('EXCEL_SHARD_PROCESSES', '0'))
+
+    def open_writer(self, merge: bool = False) -> NewsWriter:
+        if self.shard_by and self.shard_by != 'none':
+            from src.infrastructure.repositories.sharded_excel_news_writer import ShardedExcelNewsWriter
+            return ShardedExcelNewsWriter(self.excel_path, merge, self.phrase_columns, self.shard_by,
+                                          self.shard_rows, self.shard_layout, self.shard_processes)
+        return ExcelNewsWriter(self.excel_path, merge, self.phrase_columns)
+
+    def _download_image(self, image_url: str, image_filename: str) -> str:
+        """Download de imagem. Retorna o status do download."""
+        return self.image_downloader.download(image_url, image_filename)
@@ -0,0 +1,50 @@
+import json
+import os
+import shutil
+from typing import Dict, List, Optional
+from src.domain.entities.news import News
+from src.infrastructure.logging.logger import logger
+from src.infrastructure.repositories.batch_news_repository import (
+    AtomicFileWriter, BatchNewsRepository, NewsWriter, news_to_record
+)
+
+class JsonlNewsWriter(AtomicFileWriter):
+    def __init__(self, jsonl_path: str, merge: bool = False, phrase_columns: Optional[List[str]] = None):
+        super().__init__(jsonl_path)
+        self.count = 0
+        self.phrase_columns = list(phrase_columns or [])
+        self._file = open(self.temp_path, 'w', encoding='utf-8')
+        self._existing_path = jsonl_path if merge and os.path.exists(jsonl_path) else None
+
+    def write(self, news_batch: List[News]) -> None:
+        self._file.write(''.join(json.dumps(self._record(news), ensure_ascii=False) + '\n' for news in news_batch))
+        self.count += len(news_batch)
+
+    def _record(self, news: News) -> Dict:
+        record = news_to_record(news)
+        if self.phrase_columns:
+            # Como as colunas dos formatos tabulares: toda frase configurada aparece, mesmo com zero
+            record['phrase_counts'] = {phrase: news.phrase_counts.get(phrase, 0) for phrase in self.phrase_columns}
+        return record
+
+    def close(self) -> None:
+        try:
+            if self._existing_path:
+                # Linhas da execucao anterior vem depois das novas
+                with open(self._existing_path, 'r', encoding='utf-8') as existing:
+                    shutil.copyfileobj(existing, self._file)
+            self._file.close()
+            self._publish()
+        except Exception:
+            self.abort()
+            raise
+        logger.info("Arquivo JSONL salvo com sucesso em '%s' (%s linhas novas)", self.output_path, self.count)
+
+    def abort(self) -> None:
+        self._file.close()
+        self._discard()
+
+
+class JsonlNewsRepository(BatchNewsRepository):
+    def open_writer(self, merge: bool = False) -> NewsWriter:
+        return JsonlNewsWriter(self.output_path, merge, self.phrase_columns)
@@ -0,0 +1,50 @@
+from typing import List, Optional
+from src.domain.entities.news import News
+from src.infrastructure.clients.image_downloader import ImageDownloader
+from src.infrastructure.repositories.batch_news_repository import BatchNewsRepository, NewsWriter
+
+class FanOutNewsWriter(NewsWriter):
+    """Repassa cada lote para varios escritores."""
+
+    def __init__(self, writers: List[NewsWriter]):
+        self.writers = writers
+
+    def write(self, news_batch: List[News]) -> None:
+        for writer in self.writers:
+            writer.write(news_batch)
+
+    def close(self) -> None:
+        for idx, writer in enumerate(self.writers):
+            try:
+                writer.close()
+            except Exception:
+                for pending in self.writers[idx + 1:]:
+                    pending.abort()
+                raise
+
+    def abort(self) -> None:
+        for writer in self.writers:
+            writer.abort()
+
+
+class MultiFormatNewsRepository(BatchNewsRepository):
+    """Grava varios formatos numa unica passada: imagens baixadas uma vez, cada lote vai para todos."""
+
+    def __init__(self, repositories: List[BatchNewsRepository], images_dir: str,
+                 image_downloader: Optional[ImageDownloader] = None, batch_size: int = None):
+        super().__init__('', images_dir, image_downloader, batch_size)
+        self.repositories = repositories
+
+    def output_paths(self) -> List[str]:
+        return [path for repository in self.repositories for path in repository.output_paths()]
+
+    def open_writer(self, merge: bool = False) -> NewsWriter:
+        writers = []
+        try:
+            for repository in self.repositories:
+                writers.append(repository.open_writer(merge))
+        except Exception:
+            for writer in writers:
+                writer.abort()
+            raise
+        return FanOutNewsWriter(writers)
@@ -0,0 +1,80 @@
+import os
+from typing import List
+from src.domain.entities.news import News
+from src.infrastructure.logging.logger import logger
+from src.infrastructure.repositories.batch_news_repository import (
+    AtomicFileWriter, BatchNewsRepository, NewsWriter
+)
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Dependencia opcional, necessaria apenas para o formato parquet
+    pa = None
+    pq = None
+
+
+def _schema():
+    return pa.schema([
+        ('title', pa.string()),
+        ('date', pa.timestamp('us', tz='UTC')),
+        ('description', pa.string()),
+        ('image', pa.string()),
+        ('search_phrase_count', pa.int32()),
+        ('has_money', pa.bool_()),
+        ('article_id', pa.string()),
+        ('phrase_counts', pa.map_(pa.string(), pa.int32())),
+    ])
+
+
+class ParquetNewsWriter(AtomicFileWriter):
+    """Grava cada lote recebido como um row group."""
+
+    def __init__(self, parquet_path: str, merge: bool = False):
+        super().__init__(parquet_path)
+        self.count = 0
+        self._schema = _schema()
+        self._writer = pq.ParquetWriter(self.temp_path, self._schema)
+        self._existing_path = parquet_path if merge and os.path.exists(parquet_path) else None
+
+    def write(self, news_batch: List[News]) -> None:
+        columns = {
+            'title': [news.title for news in news_batch],
+            'date': [news.date for news in news_batch],
+            'description': [news.description for news in news_batch],
+            'image': [news.image_filename for news in news_batch],
+            'search_phrase_count': [news.search_phrase_count for news in news_batch],
+            'has_money': [news.has_money for news in news_batch],
+            'article_id': [news.article_id for news in news_batch],
+            'phrase_counts': [list(news.phrase_counts.items()) for news in news_batch],
+        }
+        self._writer.write_table(pa.table([columns[name] for name in self._schema.names], schema=self._schema))
+        self.count += len(news_batch)
+
+    def close(self) -> None:
+        try:
+            if self._existing_path:
+                # Row groups da execucao anterior vem depois dos novos
+                existing = pq.ParquetFile(self._existing_path)
+                for index in range(existing.num_row_groups):
+                    self._writer.write_table(existing.read_row_group(index).cast(self._schema))
+            self._writer.close()
+            self._publish()
+        except Exception:
+            self.abort()
+            raise
+        logger.info("Arquivo Parquet salvo com sucesso em '%s' (%s linhas novas)", self.output_path, self.count)
+
+    def abort(self) -> None:
+        self._writer.close()
+        self._discard()
+
+
+class ParquetNewsRepository(BatchNewsRepository):
+    def __init__(self, *args, **kwargs):
+        if pa is None:
+            raise ImportError("O formato parquet requer o pacote 'pyarrow' (pip install pyarrow)")
+        super().__init__(*args, **kwargs)
+
+    def open_writer(self, merge: bool = False) -> NewsWriter:
+        return ParquetNewsWriter(self.output_path, merge)
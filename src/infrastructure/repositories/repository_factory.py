@@ -0,0 +1,71 @@
+import importlib
+import os
+from typing import TYPE_CHECKING, List, Optional, Type
+
+if TYPE_CHECKING:
+    from src.domain.repositories.news_repository import NewsRepository
+    from src.infrastructure.clients.image_downloader import ImageDownloader
+    from src.infrastructure.repositories.batch_news_repository import BatchNewsRepository
+
+# formato -> (repositorio, variavel com o caminho de saida, extensao padrao).
+# O repositorio e importado so quando o formato e usado (openpyxl e pyarrow sao pesados)
+OUTPUT_BACKENDS = {
+    'excel': ('src.infrastructure.repositories.excel_news_repository:ExcelNewsRepository', 'EXCEL_PATH', '.xlsx'),
+    'csv': ('src.infrastructure.repositories.csv_news_repository:CsvNewsRepository', 'CSV_PATH', '.csv'),
+    'jsonl': ('src.infrastructure.repositories.jsonl_news_repository:JsonlNewsRepository', 'JSONL_PATH', '.jsonl'),
+    'parquet': ('src.infrastructure.repositories.parquet_news_repository:ParquetNewsRepository', 'PARQUET_PATH', '.parquet'),
+    'sqlite': ('src.infrastructure.repositories.sqlite_news_repository:SqliteNewsRepository', 'SQLITE_PATH', '.sqlite'),
+}
+
+# Divisao da saida Excel (EXCEL_SHARD_BY / EXCEL_SHARD_LAYOUT)
+EXCEL_SHARD_MODES = ('month', 'rows')
+EXCEL_SHARD_LAYOUTS = ('workbooks', 'sheets')
+
+def repository_class_for(output_format: str) -> Type['BatchNewsRepository']:
+    module_name, class_name = OUTPUT_BACKENDS[output_format][0].split(':')
+    return getattr(importlib.import_module(module_name), class_name)
+
+def output_path_for(output_format: str, excel_path: str, env_paths: bool = True) -> str:
+    """Caminho de saida do formato: variavel propria ou o EXCEL_PATH com outra extensao.
+
+    Sem `env_paths` (jobs do JOBS_FILE) o caminho sempre vem da saida do job: uma CSV_PATH
+    global faria jobs paralelos substituirem o arquivo uns dos outros.
+    """
+    _, env_var, extension = OUTPUT_BACKENDS[output_format]
+    if output_format == 'excel':
+        return excel_path
+    return (os.getenv(env_var) if env_paths else None) or os.path.splitext(excel_path)[0] + extension
+
+def path_variables_set() -> List[str]:
+    """Variaveis de caminho por formato (CSV_PATH, ...) definidas no ambiente."""
+    return [env_var for output_format, (_, env_var, _) in OUTPUT_BACKENDS.items()
+            if output_format != 'excel' and os.getenv(env_var)]
+
+def parse_output_formats(value: Optional[str]) -> List[str]:
+    formats = [fmt.strip().lower() for fmt in (value or 'excel').split(',') if fmt.strip()]
+    unknown = [fmt for fmt in formats if fmt not in OUTPUT_BACKENDS]
+    if unknown:
+        raise ValueError(f"Formatos de saida desconhecidos: {', '.join(unknown)}")
+    return formats or ['excel']
+
+def create_news_repository(output_formats: List[str], excel_path: str, images_dir: str,
+                           image_downloader: Optional['ImageDownloader'] = None,
+                           phrase_columns: Optional[List[str]] = None, env_paths: bool = True) -> 'NewsRepository':
+    """Monta o repositorio de saida; com varios formatos, todos sao gravados na mesma passada."""
+    from src.infrastructure.cache.image_cache import ImageCache
+    from src.infrastructure.clients.image_downloader import ImageDownloader
+    from src.infrastructure.repositories.multi_format_news_repository import MultiFormatNewsRepository
+
+    image_downloader = image_downloader or ImageDownloader(images_dir, image_cache=ImageCache.from_env())
+    repositories: List['BatchNewsRepository'] = []
+    for output_format in output_formats:
+        repository_class = repository_class_for(output_format)
+        repositories.append(repository_class(
+            output_path_for(output_format, excel_path, env_paths),
+            images_dir,
+            image_downloader,
+            phrase_columns=phrase_columns
+        ))
+    if len(repositories) == 1:
+        return repositories[0]
+    return MultiFormatNewsRepository(repositories, images_dir, image_downloader)
@@ -0,0 +1,347 @@
+import logging
+import os
+import pickle
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+from openpyxl.worksheet.hyperlink import Hyperlink
+from src.domain.entities.news import News
+from src.infrastructure.logging.logger import logger
+from src.infrastructure.processes.process_pool import process_context
+from src.infrastructure.repositories.batch_news_repository import AtomicFileWriter, batched
+from src.infrastructure.repositories.excel_news_repository import (ExcelNewsWriter, ExcelSheetWriter, excel_headers,
+                                                                   excel_row, sheet_rows)
+from src.infrastructure.repositories.repository_factory import EXCEL_SHARD_LAYOUTS, EXCEL_SHARD_MODES
+
+INDEX_SHEET = 'Indice'
+INDEX_HEADERS = ['Parte', 'Local', 'Linhas', 'Primeira data', 'Ultima data']
+DATE_COLUMN = 1  # 'Data' no formato 2024-01-15 12:34:56: o mes sao os 7 primeiros caracteres
+
+def month_of(key: str) -> str:
+    """Mes de uma parte mensal ('2024-01' ou, passando de EXCEL_SHARD_ROWS, '2024-01_0002')."""
+    return key[:7]
+
+@dataclass
+class Shard:
+    key: str
+    location: str  # arquivo da parte (relativo ao indice) ou nome da aba
+    rows: int = 0
+    first_date: str = ''
+    last_date: str = ''
+
+    def include(self, first_date: str, last_date: str) -> None:
+        if first_date and (not self.first_date or first_date < self.first_date):
+            self.first_date = first_date
+        if last_date and last_date > self.last_date:
+            self.last_date = last_date
+
+
+def read_index(index_path: str) -> Optional[List[Shard]]:
+    """Partes listadas no indice de uma execucao anterior (None se o arquivo nao tem indice)."""
+    wb = load_workbook(index_path, read_only=True)
+    try:
+        if INDEX_SHEET not in wb.sheetnames:
+            return None
+        return [Shard(str(key), str(location), int(rows or 0), first or '', last or '')
+                for key, location, rows, first, last in wb[INDEX_SHEET].iter_rows(min_row=2, max_col=5, values_only=True)
+                if key is not None]
+    finally:
+        wb.close()
+
+def read_sheet_rows(path: str, headers: List[str], sheet: Optional[str] = None) -> Iterator[tuple]:
+    """Linhas de uma parte (ou aba) anterior, remapeadas para as colunas atuais."""
+    wb = load_workbook(path, read_only=True)
+    try:
+        ws = wb[sheet] if sheet else wb.active
+        yield from sheet_rows(ws, headers)
+    finally:
+        wb.close()
+
+def read_sheet_header(path: str) -> list:
+    wb = load_workbook(path, read_only=True)
+    try:
+        return list(next(wb.active.iter_rows(max_row=1, values_only=True), None) or [])
+    finally:
+        wb.close()
+
+
+class RowSpool:
+    """Guarda as linhas de cada parte em arquivos temporarios (um pickle por lote) ate o close."""
+
+    def __init__(self, directory: str):
+        self.directory = tempfile.mkdtemp(dir=directory, prefix='.shards-')
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pickle")
+
+    def add(self, key: str, rows: List[list]) -> None:
+        with open(self.path(key), 'ab') as f:
+            pickle.dump(rows, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def cleanup(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+def read_spool(path: str) -> Iterator[List[list]]:
+    if not os.path.exists(path):
+        return
+    with open(path, 'rb') as f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+def _init_worker() -> None:
+    # Os workers (spawn, ver process_context) nao configuram handlers de log
+    logging.getLogger('news_extractor').setLevel(logging.WARNING)
+
+def _write_workbook(task: Tuple[str, str, List[str]]) -> Tuple[str, int]:
+    """Escreve uma parte num temporario ao lado do destino (roda num processo do pool).
+
+    A parte nao e publicada aqui: o escritor principal so renomeia quando todas deram certo.
+    """
+    spool_path, output_path, phrase_columns = task
+    writer = ExcelNewsWriter(output_path, phrase_columns=phrase_columns)
+    try:
+        for rows in read_spool(spool_path):
+            writer.write_rows(rows)
+    except Exception:
+        writer.abort()
+        raise
+    writer.save()
+    return writer.temp_path, writer.count
+
+
+class ShardedExcelNewsWriter(AtomicFileWriter):
+    """Divide a saida Excel em partes por mes (`month`) ou a cada N linhas (`rows`).
+
+    Nenhuma parte passa de `shard_rows` linhas: um mes maior vira `2024-01`, `2024-01_0002`...
+
+    No layout `workbooks` cada parte vira um arquivo `<base>_<parte>.xlsx`, gravado em paralelo
+    por processos, e o EXCEL_PATH vira um indice com links para as partes. No layout `sheets`
+    as partes sao abas do proprio EXCEL_PATH, depois da aba de indice (um arquivo so, escrito em serie).
+    As linhas ficam num spool em disco ate o close, entao a memoria nao cresce com a execucao.
+    """
+
+    def __init__(self, excel_path: str, merge: bool = False, phrase_columns: Optional[List[str]] = None,
+                 shard_by: str = 'month', shard_rows: int = 100000, layout: str = 'workbooks', processes: int = 0):
+        if shard_by not in EXCEL_SHARD_MODES:
+            raise ValueError(f"EXCEL_SHARD_BY invalido: {shard_by} (use {', '.join(EXCEL_SHARD_MODES)})")
+        if layout not in EXCEL_SHARD_LAYOUTS:
+            raise ValueError(f"EXCEL_SHARD_LAYOUT invalido: {layout} (use {', '.join(EXCEL_SHARD_LAYOUTS)})")
+        if shard_rows < 1:
+            raise ValueError("EXCEL_SHARD_ROWS deve ser maior que zero")
+        super().__init__(excel_path)
+        self.shard_by = shard_by
+        self.shard_rows = shard_rows
+        self.layout = layout
+        self.processes = processes
+        self.phrase_columns = list(phrase_columns or [])
+        self.headers = excel_headers(self.phrase_columns)
+        self.directory = os.path.dirname(os.path.abspath(excel_path))
+        self.base_name = os.path.splitext(os.path.basename(excel_path))[0]
+        exists = os.path.exists(excel_path)
+        self.merge = merge and exists
+        # Indice anterior: partes mantidas no merge e arquivos orfaos removidos numa escrita completa
+        self._previous = read_index(excel_path) if exists else None
+        self._shards: Dict[str, Shard] = {}
+        self._rows_per_group: Dict[str, int] = {}  # linhas por mes (ou no total, no modo rows)
+        self._pending: List[Tuple[str, str]] = []  # (temporario, destino) publicados juntos no close
+        self._spool = RowSpool(self.directory)
+
+    def write(self, news_batch: List[News]) -> None:
+        self._add_rows([excel_row(news, self.phrase_columns) for news in news_batch])
+
+    def _key_for(self, row: list) -> str:
+        group = str(row[DATE_COLUMN])[:7] if self.shard_by == 'month' else ''
+        position = self._rows_per_group.get(group, 0)
+        self._rows_per_group[group] = position + 1
+        part = position // self.shard_rows + 1
+        if self.shard_by == 'rows':
+            return f"{part:04d}"
+        return group if part == 1 else f"{group}_{part:04d}"
+
+    def _add_rows(self, rows: Iterable[list]) -> None:
+        groups: Dict[str, List[list]] = {}
+        for row in rows:
+            groups.setdefault(self._key_for(row), []).append(row)
+        for key, group in groups.items():
+            shard = self._shards.get(key)
+            if shard is None:
+                location = f"{self.base_name}_{key}.xlsx" if self.layout == 'workbooks' else key
+                shard = self._shards[key] = Shard(key, location)
+            dates = [str(row[DATE_COLUMN]) for row in group]
+            shard.rows += len(group)
+            shard.include(min(dates), max(dates))
+            self._spool.add(key, group)
+
+    def _keeps_previous_workbooks(self) -> bool:
+        """Merge mensal em workbooks: so os meses com noticias novas sao reescritos.
+
+        Se as colunas mudaram (EXTRA_PHRASES), todas as partes sao reescritas com as colunas atuais.
+        """
+        return (self.merge and bool(self._previous) and self.shard_by == 'month' and self.layout == 'workbooks'
+                and all(self._is_workbook(shard) for shard in self._previous) and self._previous_headers_match())
+
+    def _previous_headers_match(self) -> bool:
+        # As partes de uma saida sempre tem as mesmas colunas: basta conferir uma
+        paths = [self._shard_path(shard) for shard in self._previous if os.path.exists(self._shard_path(shard))]
+        return not paths or read_sheet_header(paths[0]) == self.headers
+
+    def _existing_rows(self, months: Optional[set] = None) -> Iterator[tuple]:
+        """Linhas da saida anterior, na ordem do indice (ou da aba unica de uma saida sem divisao).
+
+        Com `months`, so as partes desses meses.
+        """
+        if self._previous is None:
+            yield from read_sheet_rows(self.output_path, self.headers)
+            return
+        for shard in self._ordered(self._previous):
+            if months is not None and month_of(shard.key) not in months:
+                continue
+            if not self._is_workbook(shard):
+                yield from read_sheet_rows(self.output_path, self.headers, shard.location)
+            elif os.path.exists(self._shard_path(shard)):
+                yield from read_sheet_rows(self._shard_path(shard), self.headers)
+
+    def _is_workbook(self, shard: Shard) -> bool:
+        return shard.location.endswith('.xlsx')
+
+    def _shard_path(self, shard: Shard) -> str:
+        # So o nome do arquivo: o indice nunca aponta para fora da pasta da saida
+        return os.path.join(self.directory, os.path.basename(shard.location))
+
+    def close(self) -> None:
+        try:
+            keep_previous = self._keeps_previous_workbooks()
+            if self.merge:
+                # Linhas da execucao anterior vem depois das novas (redistribuidas pelas partes).
+                # No merge mensal em workbooks, so as dos meses com noticias novas
+                months = {month_of(key) for key in self._shards} if keep_previous else None
+                for rows in batched(self._existing_rows(months), 1000):
+                    self._add_rows(rows)
+            if self.layout == 'workbooks':
+                shards = self._write_workbooks(keep_previous)
+            else:
+                shards = self._write_sheets()
+            # Partes e indice so sao publicados depois que todos foram gravados
+            for temp_path, output_path in self._pending:
+                os.replace(temp_path, output_path)
+            self._pending = []
+            self._publish()
+        except Exception:
+            self._discard_pending()
+            self._discard()
+            raise
+        finally:
+            self._spool.cleanup()
+        self._remove_orphans(shards)
+        logger.info("Saida Excel dividida em %s parte(s) (%s, %s) com indice em '%s' (%s linhas)",
+                    len(shards), self.shard_by, self.layout, self.output_path, sum(shard.rows for shard in shards))
+
+    def abort(self) -> None:
+        self._spool.cleanup()
+        self._discard_pending()
+        self._discard()
+
+    def _discard_pending(self) -> None:
+        for temp_path, _ in self._pending:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        self._pending = []
+
+    def _ordered(self, shards: Iterable[Shard]) -> List[Shard]:
+        if self.shard_by == 'rows':
+            return sorted(shards, key=lambda shard: shard.key)
+        # Meses mais recentes primeiro, como as linhas na saida sem divisao; partes de um mes em ordem
+        return sorted(sorted(shards, key=lambda shard: shard.key), key=lambda shard: month_of(shard.key), reverse=True)
+
+    def _write_workbooks(self, keep_previous: bool) -> List[Shard]:
+        touched = {month_of(key) for key in self._shards}
+        # Meses sem noticias novas ficam como estao (arquivo e entrada do indice)
+        kept = [shard for shard in self._previous if month_of(shard.key) not in touched] if keep_previous else []
+        tasks = [(self._spool.path(key), self._shard_path(shard), self.phrase_columns) for key, shard in self._shards.items()]
+        results = self._run_tasks(tasks)
+        self._pending = [(temp_path, task[1]) for task, (temp_path, _) in zip(tasks, results)]
+
+        shards = kept + [Shard(shard.key, shard.location, count, shard.first_date, shard.last_date)
+                         for shard, (_, count) in zip(self._shards.values(), results)]
+        shards = self._ordered(shards)
+
+        wb = Workbook(write_only=True)
+        self._write_index(wb.create_sheet(INDEX_SHEET), shards)
+        wb.save(self.temp_path)
+        return shards
+
+    def _run_tasks(self, tasks: List[Tuple[str, str, List[str]]]) -> List[Tuple[str, int]]:
+        """Grava as partes (em processos, se houver mais de uma CPU); falhou uma, nenhuma fica."""
+        workers = min(len(tasks), self.processes or os.cpu_count() or 1)
+        if workers <= 1:
+            results = []
+            try:
+                for task in tasks:
+                    results.append(_write_workbook(task))
+            except Exception:
+                self._remove_temps(results)
+                raise
+            return results
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 mp_context=process_context()) as executor:
+            futures = [executor.submit(_write_workbook, task) for task in tasks]
+            wait(futures)
+        errors = [future.exception() for future in futures if future.exception() is not None]
+        if errors:
+            self._remove_temps([future.result() for future in futures if future.exception() is None])
+            raise errors[0]
+        return [future.result() for future in futures]
+
+    @staticmethod
+    def _remove_temps(results: List[Tuple[str, int]]) -> None:
+        for temp_path, _ in results:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _write_sheets(self) -> List[Shard]:
+        shards = self._ordered(self._shards.values())
+        wb = Workbook(write_only=True)
+        # A aba de indice e criada primeiro para abrir como a primeira, mas preenchida no fim
+        index = wb.create_sheet(INDEX_SHEET)
+        for shard in shards:
+            sheet = ExcelSheetWriter(wb.create_sheet(shard.location), self.headers)
+            for rows in read_spool(self._spool.path(shard.key)):
+                sheet.write_rows(rows)
+            sheet.finish()
+        self._write_index(index, shards)
+        wb.save(self.temp_path)
+        return shards
+
+    def _write_index(self, ws, shards: List[Shard]) -> None:
+        header_font = Font(bold=True)
+        header = []
+        for title in INDEX_HEADERS:
+            cell = WriteOnlyCell(ws, title)
+            cell.font = header_font
+            header.append(cell)
+        ws.append(header)
+        for shard in shards:
+            link = WriteOnlyCell(ws, shard.location)
+            if self.layout == 'workbooks':
+                link.hyperlink = shard.location
+            else:
+                link.hyperlink = Hyperlink(ref='', location=f"'{shard.location}'!A1")
+            link.style = 'Hyperlink'
+            ws.append([shard.key, link, shard.rows, shard.first_date, shard.last_date])
+
+    def _remove_orphans(self, shards: List[Shard]) -> None:
+        """Remove arquivos de partes que sairam do indice (escrita completa ou troca de layout)."""
+        current = {shard.location for shard in shards}
+        for shard in self._previous or []:
+            path = self._shard_path(shard)
+            if self._is_workbook(shard) and shard.location not in current and os.path.exists(path):
+                os.remove(path)
@@ -0,0 +1,173 @@
+import sqlite3
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Iterator, List, Optional, Sequence
+from src.domain.entities.news import News
+from src.domain.services.news_analyzer import NewsAnalyzer
+from src.infrastructure.logging.logger import logger
+from src.infrastructure.repositories.batch_news_repository import BatchNewsRepository, NewsWriter
+
+# O indice FTS5 usa o tokenizer trigram sobre o texto normalizado (como o NewsAnalyzer compara):
+# uma frase com 3+ caracteres vira uma busca por substring, a mesma semantica do str.count da analise
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    article_key TEXT NOT NULL UNIQUE,
+    article_id TEXT NOT NULL DEFAULT '',
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    pub_date TEXT NOT NULL,
+    image_filename TEXT NOT NULL DEFAULT '',
+    image_url TEXT NOT NULL DEFAULT '',
+    title_clean TEXT NOT NULL,
+    description_clean TEXT NOT NULL,
+    stored_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS articles_pub_date ON articles (pub_date);
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title_clean, description_clean, content='articles', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts (rowid, title_clean, description_clean)
+    VALUES (new.id, new.title_clean, new.description_clean);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title_clean, description_clean)
+    VALUES ('delete', old.id, old.title_clean, old.description_clean);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_au AFTER UPDATE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title_clean, description_clean)
+    VALUES ('delete', old.id, old.title_clean, old.description_clean);
+    INSERT INTO articles_fts (rowid, title_clean, description_clean)
+    VALUES (new.id, new.title_clean, new.description_clean);
+END;
+"""
+
+# Artigo buscado de novo so e regravado (e reindexado) se algo mudou
+UPSERT = """
+INSERT INTO articles (article_key, article_id, title, description, pub_date, image_filename, image_url,
+                      title_clean, description_clean, stored_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (article_key) DO UPDATE SET
+    title = excluded.title, description = excluded.description, pub_date = excluded.pub_date,
+    image_filename = excluded.image_filename, image_url = excluded.image_url,
+    title_clean = excluded.title_clean, description_clean = excluded.description_clean, stored_at = excluded.stored_at
+WHERE title != excluded.title OR description != excluded.description OR pub_date != excluded.pub_date
+    OR image_filename != excluded.image_filename OR image_url != excluded.image_url
+"""
+
+COLUMNS = 'a.article_id, a.title, a.description, a.pub_date, a.image_filename, a.image_url'
+MIN_FTS_PHRASE = 3  # o trigram nao indexa frases menores: nesses casos a tabela e varrida
+
+def utc_isoformat(value: datetime) -> str:
+    """Data em UTC (sem fuso = UTC): pub_date e comparado como texto, entao todos precisam do mesmo fuso."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc).isoformat()
+    return value.astimezone(timezone.utc).isoformat()
+
+def article_key(news: News) -> str:
+    """Identifica o artigo: o id da API ou, sem ele, data + titulo."""
+    return news.article_id or f"{news.date.isoformat()}|{news.title}"
+
+
+class SqliteNewsStore:
+    """Acervo local dos artigos extraidos, com indice FTS5 para reanalisar frases sem chamar a API."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        # O escritor pode ser aberto numa thread e usado em outra; o uso e sempre sequencial
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        # WAL: consultas seguem liberadas enquanto uma execucao grava
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(SCHEMA)
+
+    def upsert(self, news_batch: Sequence[News]) -> None:
+        """Grava um lote numa transacao propria: o que ja foi gravado fica mesmo se a execucao falhar depois."""
+        stored_at = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        rows = [(article_key(news), news.article_id, news.title, news.description, utc_isoformat(news.date),
+                 news.image_filename or '', news.image_url or '',
+                 NewsAnalyzer.normalize(news.title), NewsAnalyzer.normalize(news.description), stored_at)
+                for news in news_batch]
+        with self._conn:
+            self._conn.executemany(UPSERT, rows)
+
+    def count(self) -> int:
+        return self._conn.execute('SELECT COUNT(*) FROM articles').fetchone()[0]
+
+    def reanalyze(self, search_phrase: str, extra_phrases: Sequence[str] = (), whole_words: bool = False,
+                  since: Optional[datetime] = None, until: Optional[datetime] = None, only_matches: bool = True,
+                  limit: Optional[int] = None) -> List[News]:
+        """Recalcula search_phrase_count, has_money e as frases adicionais a partir do acervo local.
+
+        Com `only_matches` so voltam artigos que contem a frase (pre-filtrados pelo FTS5);
+        sem ele, todos os artigos do periodo, mais recentes primeiro.
+        """
+        analyzer = NewsAnalyzer.for_phrase(search_phrase, tuple(extra_phrases), whole_words)
+        results = self._analyze(self._candidates(analyzer.phrase_clean, since, until, only_matches), analyzer)
+        if only_matches:
+            results = (news for news in results if news.search_phrase_count > 0)
+        return list(islice(results, limit))
+
+    def _candidates(self, phrase_clean: str, since: Optional[datetime], until: Optional[datetime],
+                    only_matches: bool) -> Iterator[tuple]:
+        conditions, params = [], []
+        if only_matches and len(phrase_clean) >= MIN_FTS_PHRASE:
+            source = 'articles_fts JOIN articles a ON a.id = articles_fts.rowid'
+            conditions.append('articles_fts MATCH ?')
+            params.append('"' + phrase_clean.replace('"', '""') + '"')
+        else:
+            source = 'articles a'
+        if since is not None:
+            conditions.append('a.pub_date >= ?')
+            params.append(utc_isoformat(since))
+        if until is not None:
+            conditions.append('a.pub_date < ?')
+            params.append(utc_isoformat(until))
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ''
+        return self._conn.execute(f"SELECT {COLUMNS} FROM {source}{where} ORDER BY a.pub_date DESC", params)
+
+    @staticmethod
+    def _analyze(rows: Iterator[tuple], analyzer: NewsAnalyzer) -> Iterator[News]:
+        for article_id, title, description, pub_date, image_filename, image_url in rows:
+            search_count, has_money, phrase_counts = analyzer.analyze_with_phrases(title, description)
+            yield News(title, datetime.fromisoformat(pub_date), description, image_filename, image_url,
+                       search_count, has_money, article_id, phrase_counts)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> 'SqliteNewsStore':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class SqliteNewsWriter(NewsWriter):
+    """Acrescenta os artigos ao acervo (upsert por lote); o acervo nunca e substituido, so cresce."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.count = 0
+        self._store = SqliteNewsStore(db_path)
+
+    def write(self, news_batch: List[News]) -> None:
+        self._store.upsert(news_batch)
+        self.count += len(news_batch)
+
+    def close(self) -> None:
+        self._store.close()
+        logger.info("Acervo SQLite atualizado em '%s' (%s artigos gravados)", self.db_path, self.count)
+
+    def abort(self) -> None:
+        # Os lotes ja confirmados ficam: sao artigos validos, uteis para a proxima reanalise
+        self._store.close()
+
+
+class SqliteNewsRepository(BatchNewsRepository):
+    def open_writer(self, merge: bool = False) -> NewsWriter:
+        return SqliteNewsWriter(self.output_path)
+
+    def store(self) -> SqliteNewsStore:
+        """Abre o acervo para consultas (reanalyze) sem passar pela escrita."""
+        return SqliteNewsStore(self.output_path)
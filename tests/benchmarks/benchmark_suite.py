@@ -0,0 +1,191 @@
+"""Benchmarks offline do analisador, da extracao de artigos e da escrita do Excel.
+
+Uso (na raiz do projeto):
+    python -m tests.benchmarks.benchmark_suite                      # compara com o baseline
+    python -m tests.benchmarks.benchmark_suite --update-baseline    # regrava o baseline
+    python -m tests.benchmarks.benchmark_suite --sizes 1000,10000
+
+Sai com codigo 1 se alguma medida ficar pior que o baseline alem da tolerancia.
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+# Antes de importar o projeto: sem logs de depuracao, sem cache em disco e sem rede
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
+os.environ.setdefault('API_KEY', 'benchmark')
+os.environ.setdefault('RESPONSE_CACHE_PATH', '')
+os.environ.setdefault('IMAGE_CACHE_DIR', '')
+
+from src.domain.entities.news import News
+from src.domain.services.news_analyzer import NewsAnalyzer
+from src.infrastructure.clients.article_parsing import loads_json
+from src.infrastructure.clients.image_downloader import ImageDownloader
+from src.infrastructure.clients.news_api_client import NewsAPIClient
+from src.infrastructure.repositories.excel_news_repository import ExcelNewsRepository
+from tests.benchmarks.corpus import make_corpus
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+DEFAULT_TOLERANCE = 0.25
+# Folga absoluta de memoria: picos muito pequenos variam mais que a tolerancia relativa
+MEMORY_SLACK_MB = 1.0
+SEARCH_PHRASE = 'trump'
+
+def bench_analyze_news(docs: List[Dict]) -> Callable[[], None]:
+    texts = [(doc['headline']['main'], doc['abstract']) for doc in docs]
+
+    def run():
+        for title, description in texts:
+            NewsAnalyzer.analyze_news(title, description, SEARCH_PHRASE)
+    return run
+
+def bench_extract_article_data(docs: List[Dict]) -> Callable[[], None]:
+    client = NewsAPIClient(SEARCH_PHRASE, [], 1)
+
+    def run():
+        for doc in docs:
+            client._extract_article_data(doc)
+    return run
+
+def bench_parse_pages(docs: List[Dict]) -> Callable[[], None]:
+    client = NewsAPIClient(SEARCH_PHRASE, [], 1)
+    # Corpo bruto de cada pagina, como chega da API (10 documentos por pagina)
+    pages = [json.dumps({'response': {'docs': docs[start:start + 10], 'metadata': {'hits': len(docs)}}}).encode('utf-8')
+             for start in range(0, len(docs), 10)]
+
+    def run():
+        for body in pages:
+            for doc in client._extract_docs(loads_json(body)):
+                client._extract_article_data(doc)
+    return run
+
+def bench_excel_save_news(docs: List[Dict]) -> Callable[[], None]:
+    client = NewsAPIClient(SEARCH_PHRASE, [], 1)
+    news_list = []
+    for doc in docs:
+        article = client._extract_article_data(doc)
+        count, has_money = NewsAnalyzer.analyze_news(article['title'], article['description'], SEARCH_PHRASE)
+        # Sem URL de imagem: mede apenas a escrita, sem downloads
+        news_list.append(News(article['title'], article['date'], article['description'], '', '', count, has_money))
+
+    def run():
+        with tempfile.TemporaryDirectory() as temp_dir:
+            images_dir = os.path.join(temp_dir, 'images')
+            downloader = ImageDownloader(images_dir)
+            try:
+                repository = ExcelNewsRepository(os.path.join(temp_dir, 'bench.xlsx'), images_dir, image_downloader=downloader)
+                repository.save_news(news_list)
+            finally:
+                downloader.close()
+    return run
+
+BENCHMARKS = {
+    'analyze_news': bench_analyze_news,
+    'extract_article_data': bench_extract_article_data,
+    'parse_pages': bench_parse_pages,
+    'excel_save_news': bench_excel_save_news,
+}
+
+def measure(run: Callable[[], None], size: int) -> Dict[str, float]:
+    """Throughput (docs/s) numa execucao sem tracemalloc e pico de memoria numa segunda execucao."""
+    gc.collect()
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        'seconds': round(elapsed, 4),
+        'docs_per_second': round(size / elapsed, 1) if elapsed else float('inf'),
+        'peak_memory_mb': round(peak / (1024 * 1024), 3)
+    }
+
+def run_suite(sizes: List[int], names: List[str] = None) -> Dict[str, Dict[str, Dict[str, float]]]:
+    results = {}
+    for size in sizes:
+        docs = make_corpus(size)
+        for name in names or BENCHMARKS:
+            result = measure(BENCHMARKS[name](docs), size)
+            results.setdefault(name, {})[str(size)] = result
+            print(f"{name:<22} {size:>7} docs: {result['docs_per_second']:>12.1f} docs/s, "
+                  f"pico {result['peak_memory_mb']:.1f} MB ({result['seconds']:.3f}s)")
+    return results
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Lista as regressoes: throughput abaixo ou memoria acima do baseline alem da tolerancia."""
+    regressions = []
+    for name, by_size in results.items():
+        for size, result in by_size.items():
+            expected = baseline.get(name, {}).get(size)
+            if not expected:
+                continue
+            min_throughput = expected['docs_per_second'] * (1 - tolerance)
+            if result['docs_per_second'] < min_throughput:
+                regressions.append(
+                    f"{name} ({size} docs): {result['docs_per_second']:.1f} docs/s < {min_throughput:.1f} docs/s"
+                )
+            max_memory = max(expected['peak_memory_mb'] * (1 + tolerance), expected['peak_memory_mb'] + MEMORY_SLACK_MB)
+            if result['peak_memory_mb'] > max_memory:
+                regressions.append(
+                    f"{name} ({size} docs): pico de {result['peak_memory_mb']:.1f} MB > {max_memory:.1f} MB"
+                )
+    return regressions
+
+def load_baseline(path: str) -> Dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_baseline(path: str, results: Dict) -> None:
+    """Mescla os resultados no baseline (tamanhos nao medidos agora sao mantidos)."""
+    baseline = load_baseline(path)
+    for name, by_size in results.items():
+        baseline.setdefault(name, {}).update(by_size)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmarks offline do extrator de noticias')
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help='tamanhos dos corpora, separados por virgula')
+    parser.add_argument('--only', default='', help=f"benchmarks a executar ({', '.join(BENCHMARKS)})")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--tolerance', type=float, default=float(os.getenv('BENCHMARK_TOLERANCE', DEFAULT_TOLERANCE)))
+    parser.add_argument('--update-baseline', action='store_true')
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    names = [name.strip() for name in args.only.split(',') if name.strip()] or None
+    results = run_suite(sizes, names)
+
+    if args.update_baseline:
+        save_baseline(args.baseline, results)
+        print(f"Baseline atualizado em {args.baseline}")
+        return 0
+
+    regressions = compare(results, load_baseline(args.baseline), args.tolerance)
+    if regressions:
+        print("Regressoes de desempenho:")
+        for regression in regressions:
+            print(f"- {regression}")
+        return 1
+    print("Sem regressoes em relacao ao baseline")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,39 @@
+import random
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+# Vocabulario pequeno, com acentos e pontuacao, para exercitar a normalizacao do analisador
+WORDS = [
+    'economia', 'eleição', 'governo', 'mercado', 'saúde', 'tecnologia', 'política', 'acordo',
+    'presidente', 'congresso', 'inflação', 'empresa', 'ações', 'juros', 'casa', 'branca',
+    'market', 'deal', 'stocks', 'trade', 'tariffs', 'election', 'court', 'senate'
+]
+SECTIONS = ['business', 'health', 'technology', 'world', 'u.s.', 'politics', 'arts', 'opinion']
+MONEY = ['$ 11,1', 'US$ 111.111,11', '11 dolares', '25 dollars']
+
+def make_doc(rng: random.Random, index: int, search_phrase: str = 'trump', base_date: datetime = None) -> Dict:
+    """Documento no formato do articlesearch do NYT."""
+    base_date = base_date or datetime(2025, 1, 1)
+    title_words = rng.choices(WORDS, k=rng.randint(6, 12))
+    abstract_words = rng.choices(WORDS, k=rng.randint(20, 40))
+    for words in (title_words, abstract_words):
+        if rng.random() < 0.4:
+            words.insert(rng.randrange(len(words) + 1), search_phrase.capitalize())
+    if rng.random() < 0.2:
+        abstract_words.insert(rng.randrange(len(abstract_words) + 1), rng.choice(MONEY))
+    pub_date = base_date + timedelta(minutes=index * 7)
+    return {
+        '_id': f"nyt://article/{index:08d}",
+        'uri': f"nyt://article/{index:08d}",
+        'web_url': f"https://www.nytimes.com/{pub_date:%Y/%m/%d}/article-{index}.html",
+        'headline': {'main': ' '.join(title_words).capitalize() + '.'},
+        'abstract': ', '.join(' '.join(abstract_words[i:i + 8]) for i in range(0, len(abstract_words), 8)) + '.',
+        'pub_date': pub_date.strftime('%Y-%m-%dT%H:%M:%S+0000'),
+        'section_name': rng.choice(SECTIONS),
+        'multimedia': {'default': {'url': f"/images/{pub_date:%Y/%m/%d}/{index}.jpg"}}
+    }
+
+def make_corpus(size: int, seed: int = 42, search_phrase: str = 'trump') -> List[Dict]:
+    """Corpus deterministico: a mesma semente gera sempre os mesmos documentos."""
+    rng = random.Random(seed)
+    return [make_doc(rng, index, search_phrase) for index in range(size)]
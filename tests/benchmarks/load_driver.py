@@ -0,0 +1,87 @@
+"""Executa o NewsExtractorFramework completo contra o servidor falso do NYT e mede o throughput.
+
+Uso (na raiz do projeto):
+    python -m tests.benchmarks.load_driver --months 1 --docs-per-day 20 --latency 0.05 \\
+        --rate-limit-every 30 --rate-limit-burst 2 --error-rate 0.02 --min-request-interval 0.1
+
+Opcoes que nao sao do servidor viram variaveis de ambiente do extrator
+(MAX_CONCURRENT_REQUESTS, API_MIN_REQUEST_INTERVAL, IMAGE_DOWNLOAD_WORKERS...).
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Dict
+
+# Antes de importar o projeto: logs apenas de avisos, sem caches persistentes
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
+os.environ['RESPONSE_CACHE_PATH'] = ''
+os.environ['IMAGE_CACHE_DIR'] = ''
+
+from main import NewsExtractorFramework
+from src.infrastructure.metrics.metrics import metrics
+from tests.fakes.fake_nyt_server import FakeNYTServer, add_config_arguments, config_from_args
+
+def run_load(server: FakeNYTServer, output_dir: str, months: int, extractor_env: Dict[str, str]) -> Dict:
+    """Roda uma extracao completa apontada para o servidor e devolve o relatorio."""
+    os.environ.update({
+        'API_KEY': 'load-driver',
+        'API_URL': server.api_url,
+        'IMAGE_BASE_URL': server.base_url,
+        'SEARCH_PHRASE': 'trump',
+        'CATEGORIES': os.getenv('CATEGORIES', 'business,politics,world'),
+        'MONTHS_TO_SEARCH': str(months),
+        'EXCEL_PATH': os.path.join(output_dir, 'load_results.xlsx'),
+        'IMAGES_DIR': os.path.join(output_dir, 'images'),
+        'INCREMENTAL': 'false'
+    })
+    os.environ.update(extractor_env)
+    metrics.reset()
+
+    framework = NewsExtractorFramework()
+    start = time.perf_counter()
+    framework.run()
+    elapsed = time.perf_counter() - start
+
+    news_count = framework.state['news_count']
+    return {
+        'seconds': round(elapsed, 3),
+        'news_count': news_count,
+        'news_per_second': round(news_count / elapsed, 2) if elapsed else 0.0,
+        'errors': framework.state['errors'],
+        'server': dict(server.stats),
+        'metrics': metrics.snapshot()
+    }
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Carga ponta a ponta contra o servidor falso do NYT')
+    parser.add_argument('--months', type=int, default=1, help='MONTHS_TO_SEARCH da extracao')
+    parser.add_argument('--max-concurrent-requests', default='4')
+    parser.add_argument('--min-request-interval', default='2')
+    parser.add_argument('--image-download-workers', default='8')
+    parser.add_argument('--output', default='', help='arquivo JSON para o relatorio (padrao: apenas imprime)')
+    add_config_arguments(parser)
+    args = parser.parse_args(argv)
+
+    extractor_env = {
+        'MAX_CONCURRENT_REQUESTS': args.max_concurrent_requests,
+        'API_MIN_REQUEST_INTERVAL': args.min_request_interval,
+        'IMAGE_DOWNLOAD_WORKERS': args.image_download_workers
+    }
+    with tempfile.TemporaryDirectory() as output_dir, FakeNYTServer(config_from_args(args)) as server:
+        report = run_load(server, output_dir, args.months, extractor_env)
+    report['config'] = {**vars(args)}
+
+    text = json.dumps(report, indent=2, default=str)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text)
+    print(text)
+    print(f"Throughput ponta a ponta: {report['news_per_second']} noticias/s "
+          f"({report['news_count']} noticias em {report['seconds']}s)")
+    return 1 if report['errors'] else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
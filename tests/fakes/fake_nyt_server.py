@@ -0,0 +1,285 @@
+"""Servidor local que imita o articlesearch e as imagens do NYT, com injecao de latencia e falhas.
+
+Uso:
+    python -m tests.fakes.fake_nyt_server --port 8080 --latency 0.05 --rate-limit-every 50 --error-rate 0.02
+
+E depois, no .env:
+    API_URL=http://localhost:8080/svc/search/v2/articlesearch.json
+    IMAGE_BASE_URL=http://localhost:8080
+"""
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+from urllib.parse import parse_qs, urlparse
+from tests.benchmarks.corpus import make_doc
+
+SEARCH_PATH = '/svc/search/v2/articlesearch.json'
+PAGE_SIZE = 10
+MAX_PAGES = 100
+
+@dataclass
+class FakeServerConfig:
+    docs_per_day: int = 5
+    seed: int = 42
+    latency: float = 0.0  # segundos por requisicao da busca
+    latency_jitter: float = 0.0  # variacao aleatoria somada a latencia
+    rate_limit_every: int = 0  # a cada N requisicoes comeca uma rajada de 429 (0 = nunca)
+    rate_limit_burst: int = 1  # quantidade de 429 seguidos em cada rajada
+    retry_after: int = 1  # valor do cabecalho Retry-After nos 429
+    error_rate: float = 0.0  # probabilidade de 503 na busca
+    image_size: int = 32 * 1024  # bytes por imagem
+    image_bytes_per_second: int = 0  # limita a velocidade das imagens (0 = sem limite)
+    image_error_rate: float = 0.0  # probabilidade de 500 nas imagens
+
+
+class FakeNYTServer(ThreadingHTTPServer):
+    """Servidor HTTP com documentos deterministicos e contadores do que foi servido."""
+
+    daemon_threads = True
+
+    def __init__(self, config: FakeServerConfig = None, host: str = '127.0.0.1', port: int = 0):
+        self.config = config or FakeServerConfig()
+        self._lock = threading.Lock()
+        self._rng = random.Random(self.config.seed)
+        self._search_requests = 0
+        self.stats = {'search_requests': 0, 'pages_served': 0, 'rate_limited': 0, 'server_errors': 0,
+                      'images_served': 0, 'images_not_modified': 0, 'images_resumed': 0, 'image_errors': 0,
+                      'image_bytes': 0}
+        self._thread = None
+        super().__init__((host, port), FakeNYTHandler)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_url(self) -> str:
+        return self.base_url + SEARCH_PATH
+
+    def start(self) -> 'FakeNYTServer':
+        self._thread = threading.Thread(target=self.serve_forever, name='fake-nyt-server', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> 'FakeNYTServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def count(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.stats[name] += value
+
+    def next_search_fault(self) -> str:
+        """Decide a falha da proxima requisicao de busca: '429', '503' ou ''."""
+        with self._lock:
+            self._search_requests += 1
+            number = self._search_requests
+            roll = self._rng.random()
+        every = self.config.rate_limit_every
+        if every and number >= every and (number - every) % every < self.config.rate_limit_burst:
+            return '429'
+        if roll < self.config.error_rate:
+            return '503'
+        return ''
+
+    def random(self) -> float:
+        with self._lock:
+            return self._rng.random()
+
+    def docs_for_range(self, begin: datetime, end: datetime, sections: List[str]) -> List[Dict]:
+        """Documentos do periodo (ordenados do mais novo para o mais antigo), filtrados por secao."""
+        docs = []
+        day = end
+        while day >= begin:
+            docs.extend(reversed(docs_for_day(day.strftime('%Y%m%d'), self.config.docs_per_day, self.config.seed)))
+            day -= timedelta(days=1)
+        if sections:
+            docs = [doc for doc in docs if doc['section_name'] in sections]
+        return docs
+
+
+@lru_cache(maxsize=4096)
+def docs_for_day(day: str, docs_per_day: int, seed: int) -> List[Dict]:
+    """Documentos de um dia; dependem apenas do dia e da semente."""
+    base_date = datetime.strptime(day, '%Y%m%d')
+    rng = random.Random(f"{seed}-{day}")
+    interval = 24 * 60 // max(docs_per_day, 1)
+    docs = []
+    for index in range(docs_per_day):
+        doc = make_doc(rng, index, base_date=base_date)
+        doc['_id'] = doc['uri'] = f"nyt://article/{day}-{index:04d}"
+        doc['pub_date'] = (base_date + timedelta(minutes=index * interval)).strftime('%Y-%m-%dT%H:%M:%S+0000')
+        docs.append(doc)
+    return docs
+
+def parse_sections(fq: str) -> List[str]:
+    """Secoes do filtro section.name:("a" OR "b")."""
+    return [section.lower() for section in re.findall(r'"([^"]+)"', fq or '')]
+
+
+class FakeNYTHandler(BaseHTTPRequestHandler):
+    server: FakeNYTServer
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if path == SEARCH_PATH:
+            self._search()
+        elif path.startswith('/images/'):
+            self._image(path)
+        else:
+            self._send_json(404, {'fault': 'not found'})
+
+    def _search(self):
+        config = self.server.config
+        self.server.count('search_requests')
+        if config.latency or config.latency_jitter:
+            time.sleep(config.latency + config.latency_jitter * self.server.random())
+
+        params = {key: values[0] for key, values in parse_qs(urlparse(self.path).query).items()}
+        if 'api-key' not in params:
+            self._send_json(401, {'fault': {'faultstring': 'Invalid ApiKey'}})
+            return
+        fault = self.server.next_search_fault()
+        if fault == '429':
+            self.server.count('rate_limited')
+            self._send_json(429, {'fault': {'faultstring': 'Rate limit quota violation'}},
+                            {'Retry-After': str(config.retry_after)})
+            return
+        if fault == '503':
+            self.server.count('server_errors')
+            self._send_json(503, {'fault': 'Service Unavailable'})
+            return
+
+        try:
+            begin = datetime.strptime(params.get('begin_date', ''), '%Y%m%d')
+            end = datetime.strptime(params.get('end_date', ''), '%Y%m%d')
+            page = int(params.get('page', '0'))
+        except ValueError:
+            self._send_json(400, {'status': 'ERROR', 'errors': ['invalid parameters']})
+            return
+        if page >= MAX_PAGES:
+            self._send_json(400, {'status': 'ERROR', 'errors': ['page must be less than 100']})
+            return
+
+        docs = self.server.docs_for_range(begin, end, parse_sections(params.get('fq')))
+        offset = page * PAGE_SIZE
+        self.server.count('pages_served')
+        self._send_json(200, {
+            'status': 'OK',
+            'response': {
+                'docs': docs[offset:offset + PAGE_SIZE],
+                'metadata': {'hits': len(docs), 'offset': offset, 'time': 10}
+            }
+        })
+
+    def _image(self, path: str):
+        config = self.server.config
+        etag = '"' + hashlib.sha256(path.encode('utf-8')).hexdigest()[:16] + '"'
+        if config.image_error_rate and self.server.random() < config.image_error_rate:
+            self.server.count('image_errors')
+            self._send_json(500, {'fault': 'Internal Server Error'})
+            return
+        if self.headers.get('If-None-Match') == etag:
+            self.server.count('images_not_modified')
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        chunk = hashlib.sha256(path.encode('utf-8')).digest() * 256  # 8 KB deterministicos
+        body = (chunk * (config.image_size // len(chunk) + 1))[:config.image_size]
+        # Range so e atendido com If-Range igual ao ETag atual (como um CDN)
+        match = re.match(r'bytes=(\d+)-$', self.headers.get('Range', ''))
+        offset = int(match.group(1)) if match and self.headers.get('If-Range') == etag else 0
+        if offset >= len(body) > 0:
+            self.send_response(416)
+            self.send_header('Content-Range', f"bytes */{len(body)}")
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        if offset:
+            self.server.count('images_resumed')
+            self.send_response(206)
+            self.send_header('Content-Range', f"bytes {offset}-{len(body) - 1}/{len(body)}")
+        else:
+            self.send_response(200)
+        self.send_header('Content-Type', 'image/jpeg')
+        self.send_header('Content-Length', str(len(body) - offset))
+        self.send_header('ETag', etag)
+        self.end_headers()
+        position = offset
+        try:
+            while position < len(body):
+                piece = body[position:position + len(chunk)]
+                self.wfile.write(piece)
+                position += len(piece)
+                if config.image_bytes_per_second:
+                    time.sleep(len(piece) / config.image_bytes_per_second)
+        except (BrokenPipeError, ConnectionResetError):
+            # Cliente desistiu no meio (limite de tempo ou de tamanho)
+            return
+        self.server.count('images_served')
+        self.server.count('image_bytes', len(body) - offset)
+
+    def _send_json(self, status: int, payload: Dict, headers: Dict[str, str] = None):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def add_config_arguments(parser: argparse.ArgumentParser) -> None:
+    """Uma opcao de linha de comando por campo de FakeServerConfig (--docs-per-day, --latency, ...)."""
+    for name, default in asdict(FakeServerConfig()).items():
+        parser.add_argument('--' + name.replace('_', '-'), type=type(default), default=default)
+
+def config_from_args(args: argparse.Namespace) -> FakeServerConfig:
+    return FakeServerConfig(**{name: getattr(args, name) for name in asdict(FakeServerConfig())})
+
+def main():
+    parser = argparse.ArgumentParser(description='Servidor falso do articlesearch do NYT')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    server = FakeNYTServer(config_from_args(args), args.host, args.port)
+    print(f"API_URL={server.api_url}")
+    print(f"IMAGE_BASE_URL={server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(json.dumps(server.stats, indent=2))
+
+if __name__ == '__main__':
+    main()
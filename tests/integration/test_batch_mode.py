@@ -0,0 +1,55 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from src.application.use_cases.batch_fetch_news_use_case import BatchFetchNewsUseCase, BatchJob, report_path_for
+from src.infrastructure.clients.shared_clients import SharedClients
+from src.infrastructure.repositories.repository_factory import create_news_repository, parse_output_formats
+from tests.fakes.fake_nyt_server import FakeNYTServer, FakeServerConfig
+
+class TestBatchMode(unittest.TestCase):
+    def test_jobs_share_clients_and_write_their_own_outputs(self):
+        """Testa varios jobs no mesmo processo, cada um com sua saida e seu relatorio"""
+        with tempfile.TemporaryDirectory() as temp_dir, FakeNYTServer(FakeServerConfig(docs_per_day=2)) as server:
+            env = {'API_KEY': 'test_key', 'API_URL': server.api_url, 'IMAGE_BASE_URL': server.base_url,
+                   'RESPONSE_CACHE_PATH': os.path.join(temp_dir, 'responses.sqlite'),
+                   'IMAGE_CACHE_DIR': os.path.join(temp_dir, 'image_cache'), 'API_MIN_REQUEST_INTERVAL': '0'}
+            with patch.dict(os.environ, env):
+                images_dir = os.path.join(temp_dir, 'images')
+                shared = SharedClients.from_env(images_dir, parallel_jobs=2)
+                jobs = [
+                    BatchJob('business', 'trump', ['business'], 1, os.path.join(temp_dir, 'business.xlsx')),
+                    BatchJob('business-csv', 'trump', ['business'], 1, os.path.join(temp_dir, 'business.csv'), 'csv'),
+                    BatchJob('world', 'trump', ['world'], 1, os.path.join(temp_dir, 'world.xlsx'))
+                ]
+                use_case = BatchFetchNewsUseCase(
+                    repository_factory=lambda job: create_news_repository(
+                        parse_output_formats(job.output_formats), job.output, images_dir, shared.image_downloader
+                    ),
+                    client_options=shared.client_options(),
+                    max_workers=2
+                )
+                try:
+                    results = use_case.execute(jobs)
+                finally:
+                    shared.close()
+
+            self.assertEqual([result.error for result in results], [None, None, None])
+            self.assertTrue(all(result.news_count > 0 for result in results))
+            self.assertEqual(results[0].news_count, results[1].news_count)
+            for job in jobs:
+                self.assertTrue(os.path.exists(job.output))
+                with open(report_path_for(job), encoding='utf-8') as f:
+                    report = json.load(f)
+                self.assertEqual(report['job']['name'], job.name)
+                self.assertIn('pipeline', report['result']['metrics']['stage_seconds'])
+            # Metricas por job: cada um ve so os proprios artigos analisados
+            self.assertEqual([result.metrics['counters']['articles_analyzed_total'] for result in results],
+                             [result.news_count for result in results])
+            # O segundo job da mesma busca e atendido pelo cache de respostas compartilhado
+            self.assertEqual(server.stats['pages_served'], server.stats['search_requests'])
+            self.assertLess(server.stats['search_requests'], 3 * max(result.news_count for result in results))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from tests.fakes.fake_nyt_server import FakeNYTServer, FakeServerConfig
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+class TestDaemonMode(unittest.TestCase):
+    def test_cycles_only_write_new_articles(self):
+        """Testa o main.py --daemon: o segundo ciclo nao encontra noticias novas e mantem a saida"""
+        with tempfile.TemporaryDirectory() as temp_dir, FakeNYTServer(FakeServerConfig(docs_per_day=2)) as server:
+            excel_path = os.path.join(temp_dir, 'daemon.xlsx')
+            env = {**os.environ, 'PYTHONPATH': PROJECT_ROOT,
+                   'API_KEY': 'test_key', 'API_URL': server.api_url, 'IMAGE_BASE_URL': server.base_url,
+                   'SEARCH_PHRASE': 'trump', 'CATEGORIES': 'business', 'MONTHS_TO_SEARCH': '1',
+                   'EXCEL_PATH': excel_path, 'IMAGES_DIR': os.path.join(temp_dir, 'images'),
+                   'CHECKPOINT_PATH': os.path.join(temp_dir, 'checkpoints.json'),
+                   'RESPONSE_CACHE_PATH': os.path.join(temp_dir, 'responses.sqlite'), 'IMAGE_CACHE_DIR': '',
+                   'LOG_DIR': os.path.join(temp_dir, 'logs'), 'LOG_LEVEL': 'INFO', 'API_MIN_REQUEST_INTERVAL': '0',
+                   'POLL_INTERVAL_SECONDS': '0', 'DAEMON_MAX_CYCLES': '2', 'HEALTH_PORT': '0', 'JOBS_FILE': ''}
+            process = subprocess.run([sys.executable, 'main.py', '--daemon'], cwd=PROJECT_ROOT, env=env,
+                                     capture_output=True, text=True, timeout=300)
+            with open(os.path.splitext(excel_path)[0] + '.metrics.json', encoding='utf-8') as f:
+                report = json.load(f)
+
+        self.assertEqual(process.returncode, 0, process.stderr[-2000:])
+        self.assertIn('Ciclo 2: 0 noticias novas', process.stderr)
+        self.assertIn('Nenhuma noticia nova; saida mantida', process.stderr)
+        self.assertGreater(report['news_count'], 0)
+        self.assertEqual(report['errors'], [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import requests
+from src.infrastructure.clients.image_downloader import ImageDownloader
+from src.infrastructure.clients.news_api_client import NewsAPIClient
+from tests.fakes.fake_nyt_server import FakeNYTServer, FakeServerConfig
+
+class TestFakeNYTServer(unittest.TestCase):
+    def test_client_fetches_every_page_from_fake_server(self):
+        """Testa a extracao completa (paginas e imagens ignoradas) contra o servidor falso"""
+        with FakeNYTServer(FakeServerConfig(docs_per_day=3)) as server:
+            env = {'API_KEY': 'test_key', 'API_URL': server.api_url, 'IMAGE_BASE_URL': server.base_url,
+                   'RESPONSE_CACHE_PATH': '', 'API_MIN_REQUEST_INTERVAL': '0'}
+            with patch.dict(os.environ, env):
+                client = NewsAPIClient('trump', [], 1)
+                begin_date, end_date = client._search_period()
+                news_list = client.fetch_news()
+
+            expected = ((end_date - begin_date).days + 1) * 3
+            self.assertEqual(len(news_list), expected)
+            self.assertEqual(len({news.article_id for news in news_list}), expected)
+            self.assertEqual(server.stats['pages_served'], -(-expected // 10))
+            self.assertTrue(news_list[0].image_url.startswith(server.base_url))
+
+    def test_fault_injection(self):
+        """Testa as rajadas de 429 com Retry-After e as imagens com ETag"""
+        config = FakeServerConfig(rate_limit_every=3, rate_limit_burst=2, retry_after=7, image_size=1000)
+        with FakeNYTServer(config) as server:
+            params = {'api-key': 'x', 'begin_date': '20240101', 'end_date': '20240102'}
+            statuses = [requests.get(server.api_url, params=params).status_code for _ in range(5)]
+            limited = requests.get(server.api_url, params=params)
+            image = requests.get(server.base_url + '/images/a.jpg')
+            not_modified = requests.get(server.base_url + '/images/a.jpg', headers={'If-None-Match': image.headers['ETag']})
+
+        self.assertEqual(statuses, [200, 200, 429, 429, 200])
+        self.assertEqual(limited.status_code, 429)
+        self.assertEqual(limited.headers['Retry-After'], '7')
+        self.assertEqual(len(image.content), 1000)
+        self.assertEqual(not_modified.status_code, 304)
+
+    def test_stalled_image_is_resumed_on_next_run(self):
+        """Testa o limite de tempo por imagem: o .part fica no disco e a proxima tentativa continua via Range"""
+        config = FakeServerConfig(image_size=256 * 1024, image_bytes_per_second=128 * 1024)
+        with FakeNYTServer(config) as server, tempfile.TemporaryDirectory() as temp_dir:
+            url = server.base_url + '/images/lenta.jpg'
+            slow = ImageDownloader(temp_dir, max_workers=1, deadline=0.3)
+            try:
+                timed_out = slow.download(url, 'lenta.jpg')
+            finally:
+                slow.close()
+            partial_size = os.path.getsize(os.path.join(temp_dir, 'lenta.jpg.part'))
+
+            server.config.image_bytes_per_second = 0
+            downloader = ImageDownloader(temp_dir, max_workers=1)
+            try:
+                status = downloader.download(url, 'lenta.jpg')
+            finally:
+                downloader.close()
+            with open(os.path.join(temp_dir, 'lenta.jpg'), 'rb') as f:
+                content = f.read()
+            files = sorted(os.listdir(temp_dir))
+            expected = requests.get(url).content
+
+        self.assertTrue(timed_out.startswith('Tempo limite excedido'))
+        self.assertTrue(0 < partial_size < config.image_size)
+        self.assertEqual(status, 'lenta.jpg')
+        self.assertEqual(content, expected)
+        self.assertEqual(server.stats['images_resumed'], 1)
+        self.assertEqual(files, ['lenta.jpg'])
+
+if __name__ == '__main__':
+    unittest.main()
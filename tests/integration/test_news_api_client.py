@@ -1,15 +1,26 @@
 import unittest
 import os
+import tempfile
+from unittest.mock import MagicMock, patch
 from datetime import datetime
+import json
+import requests
+from src.infrastructure.cache.response_cache import ResponseCache
 from src.infrastructure.clients.news_api_client import NewsAPIClient
+from src.infrastructure.clients.rate_limiter import QuotaExhaustedError, RateLimiter
 
 class TestNewsAPIClient(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        # Configura variáveis de ambiente para teste
-        os.environ['API_KEY'] = 'test_key'
-        os.environ['API_URL'] = 'https://api.newsapi.org/v2/everything'
-        os.environ['IMAGE_BASE_URL'] = 'https://static.newsapi.org'
+        # Configura variáveis de ambiente para teste (restauradas ao fim da classe)
+        env = patch.dict(os.environ, {
+            'API_KEY': 'test_key',
+            'API_URL': 'https://api.newsapi.org/v2/everything',
+            'IMAGE_BASE_URL': 'https://static.newsapi.org',
+            'RESPONSE_CACHE_PATH': ''
+        })
+        env.start()
+        cls.addClassCleanup(env.stop)
 
     def setUp(self):
         self.client = NewsAPIClient(
@@ -53,5 +64,107 @@ class TestNewsAPIClient(unittest.TestCase):
         self.assertEqual(article_data['description'], 'Test Description')
         self.assertEqual(article_data['img_url'], 'https://static.newsapi.org/test-image.jpg')
 
+    def test_iter_search_pages_fetches_all_pages_in_order(self):
+        def fake_page(params, page):
+            docs = [{'page': page, 'idx': i} for i in range(10 if page < 2 else 5)]
+            return {'response': {'docs': docs, 'metadata': {'hits': 25}}}
+
+        with patch.object(self.client, '_fetch_page', side_effect=fake_page) as fetch_page:
+            pages = list(self.client._iter_search_pages(datetime(2024, 1, 1), datetime(2024, 1, 31)))
+
+        self.assertEqual(fetch_page.call_count, 3)
+        self.assertEqual([page[0]['page'] for page in pages], [0, 1, 2])
+        self.assertEqual(sum(len(page) for page in pages), 25)
+
+    def test_count_pages_caps_page_depth(self):
+        first_page = {'response': {'docs': [], 'metadata': {'hits': 5000}}}
+        self.assertEqual(self.client._count_pages(first_page), NewsAPIClient.MAX_PAGES)
+
+    def test_iter_search_pages_splits_windows_over_page_cap(self):
+        def fake_page(params, page):
+            # Janeiro inteiro passa do limite; cada metade cabe em uma pagina
+            hits = 5000 if (params['begin_date'], params['end_date']) == ('20240101', '20240131') else 3
+            docs = [{'begin': params['begin_date']}] * 3
+            return {'response': {'docs': docs, 'metadata': {'hits': hits}}}
+
+        with patch.object(self.client, '_fetch_page', side_effect=fake_page):
+            pages = list(self.client._iter_search_pages(datetime(2024, 1, 1), datetime(2024, 1, 31)))
+
+        self.assertEqual([page[0]['begin'] for page in pages], ['20240116', '20240101'])
+        self.assertEqual(len(self.client.window_coverage), 2)
+        self.assertTrue(all(window.coverage == 1.0 for window in self.client.window_coverage))
+
+    def test_fetch_page_uses_response_cache(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ResponseCache(os.path.join(temp_dir, 'responses.sqlite'), ttl_seconds=60, max_bytes=1024 * 1024)
+            client = NewsAPIClient("test", ["technology"], 1, response_cache=cache)
+            response = MagicMock()
+            response.json.return_value = {'response': {'docs': [], 'metadata': {'hits': 0}}}
+            response.content = b'{"response": {"docs": [], "metadata": {"hits": 0}}}'
+            params = client._build_request_params(datetime(2024, 1, 1), datetime(2024, 1, 31))
+
+            with patch.object(client, '_make_api_request', return_value=response) as make_request:
+                first = client._fetch_page(params, 0)
+                second = client._fetch_page(params, 0)
+            cache.close()
+
+        self.assertEqual(make_request.call_count, 1)
+        self.assertEqual(first, second)
+
+    def test_request_uses_timeout_and_retries_on_timeout(self):
+        """Testa que a requisicao passa (conexao, leitura) de timeout e repete apos um Timeout"""
+        response = MagicMock(status_code=200, content=b'{}', headers={})
+        session = MagicMock()
+        session.get.side_effect = [requests.exceptions.ReadTimeout('travou'), response]
+        with patch.dict(os.environ, {'API_CONNECT_TIMEOUT': '2', 'API_READ_TIMEOUT': '7'}):
+            client = NewsAPIClient("test", ["technology"], 1, session=session)
+
+        with patch.object(NewsAPIClient._make_api_request.retry, 'sleep', lambda seconds: None):
+            result = client._make_api_request({'api-key': 'test_key'})
+
+        self.assertIs(result, response)
+        self.assertEqual(session.get.call_count, 2)
+        self.assertEqual(session.get.call_args.kwargs['timeout'], (2.0, 7.0))
+
+    def test_exhausted_daily_quota_fails_the_search(self):
+        """Testa que a cota diaria esgotada interrompe a busca, aproveitando a resposta que a informou"""
+        body = {'response': {'docs': [{'idx': i} for i in range(10)], 'metadata': {'hits': 30}}}
+        response = MagicMock(status_code=200, content=json.dumps(body).encode(),
+                             headers={'X-RateLimit-Remaining-Day': '0'})
+        session = MagicMock()
+        session.get.return_value = response
+        client = NewsAPIClient("test", ["technology"], 1, session=session, rate_limiter=RateLimiter(max_rate=0))
+
+        pages = client._iter_search_pages(datetime(2024, 1, 1), datetime(2024, 1, 31))
+        self.assertEqual(len(next(pages)), 10)
+        with self.assertRaises(QuotaExhaustedError):
+            next(pages)
+        self.assertEqual(session.get.call_count, 1)
+
+    def test_parallel_analysis_spawns_workers(self):
+        """Testa que a analise em processos recebe o contexto spawn do extrator"""
+        self.client.analysis_processes = 2
+        with patch.object(self.client, '_iter_articles', return_value=iter([])), \
+                patch('src.infrastructure.clients.news_api_client.ParallelNewsAnalyzer') as parallel_class:
+            parallel_class.return_value.analyze_many.return_value = []
+            self.client.fetch_news()
+
+        self.assertEqual(parallel_class.call_args.kwargs['mp_context'].get_start_method(), 'spawn')
+
+    def test_incremental_mode_fetches_only_delta(self):
+        since = datetime(datetime.now().year, 1, 20, 15, 30)
+        client = NewsAPIClient("test", ["technology"], 1, since=since, seen_ids={'seen'})
+        docs = [
+            {'_id': 'seen', 'headline': {'main': 'Old'}, 'pub_date': '2024-01-20T10:00:00+0000', 'abstract': ''},
+            {'_id': 'new', 'headline': {'main': 'New'}, 'pub_date': '2024-01-21T10:00:00+0000', 'abstract': ''},
+        ]
+
+        with patch.object(client, '_iter_search_pages', return_value=iter([docs])) as iter_pages:
+            articles = client._get_search_results()
+
+        begin_date, _ = iter_pages.call_args[0]
+        self.assertEqual(begin_date, datetime(since.year, 1, 20))
+        self.assertEqual([article['id'] for article in articles], ['new'])
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,36 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+from src.infrastructure.clients import article_parsing
+from src.infrastructure.clients.article_parsing import loads_json, parse_pub_date
+
+class TestParsePubDate(unittest.TestCase):
+    def test_matches_strptime_for_api_format(self):
+        """Testa que o parser por fatias da o mesmo resultado do strptime"""
+        for value in ['2024-01-15T12:34:56+0000', '2024-02-29T23:59:59-0300', '2024-07-01T00:00:00+0530']:
+            self.assertEqual(parse_pub_date(value), datetime.strptime(value, "%Y-%m-%dT%H:%M:%S%z"))
+
+    def test_other_iso_variants(self):
+        """Testa Z, offset com dois pontos e fracoes de segundo (caminho lento)"""
+        self.assertEqual(parse_pub_date('2024-01-15T12:34:56Z'), datetime(2024, 1, 15, 12, 34, 56, tzinfo=timezone.utc))
+        self.assertEqual(parse_pub_date('2024-01-15T12:34:56-03:00').utcoffset(), timedelta(hours=-3))
+        self.assertEqual(parse_pub_date('2024-01-15T12:34:56.250+00:00').microsecond, 250000)
+
+    def test_invalid_date_raises(self):
+        """Testa que datas invalidas continuam gerando ValueError (o artigo e descartado)"""
+        for value in ['', '2024-13-01T00:00:00+0000', 'ontem']:
+            with self.assertRaises(ValueError):
+                parse_pub_date(value)
+
+
+class TestLoadsJson(unittest.TestCase):
+    def test_decodes_bytes_with_each_backend(self):
+        """Testa a decodificacao direto dos bytes com o backend padrao e com o json da biblioteca padrao"""
+        body = '{"response": {"docs": [{"headline": {"main": "Política"}}]}}'.encode('utf-8')
+
+        self.assertEqual(loads_json(body)['response']['docs'][0]['headline']['main'], 'Política')
+        with patch.object(article_parsing, 'JSON_BACKEND', 'json'):
+            self.assertEqual(loads_json(body), loads_json(body.decode('utf-8')))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import json
+import os
+import tempfile
+import unittest
+from src.application.use_cases.batch_fetch_news_use_case import load_jobs, report_path_for
+
+class TestBatchJobs(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'jobs.json')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write(self, data):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+    def test_load_jobs_with_defaults(self):
+        """Testa a leitura do arquivo de jobs, com valores padrao vindos do .env"""
+        self._write({'jobs': [
+            {'name': 'trump', 'search_phrase': 'trump', 'categories': 'business, politics', 'output': 'out/trump.xlsx'},
+            {'search_phrase': 'economia', 'categories': ['world'], 'months_to_search': 3, 'extra_phrases': 'juros,dolar'}
+        ]})
+
+        jobs = load_jobs(self.path, defaults={'months_to_search': 1, 'output_formats': 'excel,csv'})
+
+        self.assertEqual(jobs[0].categories, ['business', 'politics'])
+        self.assertEqual(jobs[0].months_to_search, 1)
+        self.assertEqual(jobs[0].output_formats, 'excel,csv')
+        self.assertEqual(jobs[1].name, 'job-2')
+        self.assertEqual(jobs[1].output, 'job-2.xlsx')
+        self.assertEqual(jobs[1].months_to_search, 3)
+        self.assertEqual(jobs[1].extra_phrases, ['juros', 'dolar'])
+        self.assertEqual(report_path_for(jobs[0]), os.path.join('out', 'trump.report.json'))
+        self.assertEqual(report_path_for(jobs[1]), 'job-2.report.json')
+
+    def test_invalid_jobs(self):
+        """Testa que jobs sem frase de busca ou com nome repetido sao rejeitados"""
+        self._write([{'name': 'a'}])
+        with self.assertRaises(ValueError):
+            load_jobs(self.path)
+
+        self._write([{'name': 'a', 'search_phrase': 'x'}, {'name': 'a', 'search_phrase': 'y'}])
+        with self.assertRaises(ValueError):
+            load_jobs(self.path)
+
+if __name__ == '__main__':
+    unittest.main()
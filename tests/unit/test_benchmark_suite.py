@@ -0,0 +1,29 @@
+import unittest
+from tests.benchmarks.benchmark_suite import compare, run_suite
+from tests.benchmarks.corpus import make_corpus
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def test_corpus_is_deterministic(self):
+        """Testa que a mesma semente gera o mesmo corpus"""
+        self.assertEqual(make_corpus(20), make_corpus(20))
+        self.assertNotEqual(make_corpus(20, seed=1), make_corpus(20, seed=2))
+
+    def test_run_suite_reports_throughput_and_memory(self):
+        """Testa a execucao dos benchmarks num corpus pequeno"""
+        results = run_suite([50], ['analyze_news', 'extract_article_data'])
+
+        self.assertGreater(results['analyze_news']['50']['docs_per_second'], 0)
+        self.assertIn('peak_memory_mb', results['extract_article_data']['50'])
+
+    def test_compare_flags_regressions(self):
+        """Testa a deteccao de regressao de throughput e de memoria em relacao ao baseline"""
+        baseline = {'analyze_news': {'1000': {'docs_per_second': 1000.0, 'peak_memory_mb': 10.0}}}
+        ok = {'analyze_news': {'1000': {'docs_per_second': 900.0, 'peak_memory_mb': 11.0}}}
+        slow = {'analyze_news': {'1000': {'docs_per_second': 500.0, 'peak_memory_mb': 20.0}}}
+
+        self.assertEqual(compare(ok, baseline, 0.25), [])
+        self.assertEqual(len(compare(slow, baseline, 0.25)), 2)
+        self.assertEqual(compare(slow, {}, 0.25), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from src.domain.entities.news import News
+from src.infrastructure.checkpoints.checkpoint_store import Checkpoint, CheckpointStore
+
+def make_news(article_id, date):
+    return News('t', date, 'd', '', '', 0, False, article_id=article_id)
+
+class TestCheckpointStore(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = CheckpointStore(os.path.join(self.temp_dir.name, 'checkpoints.json'))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_key_ignores_case_and_category_order(self):
+        """Testa que a chave e a mesma para categorias em outra ordem"""
+        self.assertEqual(
+            CheckpointStore.make_key('Trump ', ['World', 'business']),
+            CheckpointStore.make_key('trump', ['business', 'world'])
+        )
+
+    def test_key_separates_jobs_with_the_same_search(self):
+        """Testa que jobs com a mesma busca (e saidas diferentes) tem checkpoints separados"""
+        self.assertNotEqual(CheckpointStore.make_key('trump', ['world'], 'diario'),
+                            CheckpointStore.make_key('trump', ['world'], 'semanal'))
+        self.assertEqual(CheckpointStore.make_key('trump', ['world'], ''), CheckpointStore.make_key('trump', ['world']))
+
+    def test_advance_keeps_newest_date_and_ids_of_that_day(self):
+        """Testa que o high-water mark avanca e so guarda os IDs do ultimo dia"""
+        news_list = [
+            make_news('a', datetime(2024, 2, 1, 10, tzinfo=timezone.utc)),
+            make_news('b', datetime(2024, 2, 2, 8, tzinfo=timezone.utc)),
+            make_news('c', datetime(2024, 2, 2, 9, tzinfo=timezone.utc)),
+        ]
+
+        checkpoint = Checkpoint().advance(news_list)
+
+        self.assertEqual(checkpoint.high_water_mark, datetime(2024, 2, 2, 9, tzinfo=timezone.utc))
+        self.assertEqual(checkpoint.seen_ids, {'b', 'c'})
+
+    def test_save_and_load_round_trip(self):
+        """Testa que o checkpoint e persistido por chave"""
+        checkpoint = Checkpoint(datetime(2024, 2, 2, 9, tzinfo=timezone.utc), {'b', 'c'})
+
+        self.store.save('trump|world', checkpoint)
+
+        self.assertEqual(self.store.load('trump|world'), checkpoint)
+        self.assertIsNone(self.store.load('other|world').high_water_mark)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,215 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+from openpyxl import load_workbook
+from src.domain.entities.news import News
+from src.infrastructure.clients.image_downloader import ImageDownloader
+from src.infrastructure.repositories import sharded_excel_news_writer
+from src.infrastructure.repositories.excel_news_repository import ExcelNewsRepository, ExcelNewsWriter
+
+def make_news(title, day, has_money=False, month=1):
+    return News(title, datetime(2024, month, day), 'Descricao', '', '', 1, has_money)
+
+def make_counted_news(title, day, month=1):
+    return News(title, datetime(2024, month, day), 'Descricao', '', '', 1, False, phrase_counts={'alpha': 7, 'beta': 3})
+
+def read_sheet(path, sheet=None):
+    wb = load_workbook(path)
+    ws = wb[sheet] if sheet else wb.active
+    rows = list(ws.iter_rows(values_only=True))
+    wb.close()
+    return rows
+
+class TestExcelNewsRepository(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.excel_path = os.path.join(self.temp_dir.name, 'results.xlsx')
+        images_dir = os.path.join(self.temp_dir.name, 'images')
+        self.downloader = ImageDownloader(images_dir, max_workers=2)
+        self.repository = ExcelNewsRepository(self.excel_path, images_dir, image_downloader=self.downloader)
+
+    def tearDown(self):
+        self.downloader.close()
+        self.temp_dir.cleanup()
+
+    def _read_rows(self):
+        wb = load_workbook(self.excel_path)
+        rows = list(wb.active.iter_rows(values_only=True))
+        wb.close()
+        return rows
+
+    def test_save_news_accepts_iterator(self):
+        """Testa a escrita em streaming a partir de um gerador de noticias"""
+        self.repository.save_news(make_news(f'Noticia {day}', day) for day in range(1, 4))
+
+        rows = self._read_rows()
+
+        self.assertEqual(rows[0], tuple(ExcelNewsWriter.HEADERS))
+        self.assertEqual([row[0] for row in rows[1:]], ['Noticia 1', 'Noticia 2', 'Noticia 3'])
+        self.assertEqual(rows[1][3], 'Sem imagem')
+
+    def test_workbook_keeps_header_styles_and_widths(self):
+        """Testa que estilos, largura das colunas e cabecalho congelado sao mantidos"""
+        self.repository.save_news([make_news('T' * 300, 1)])
+
+        ws = load_workbook(self.excel_path).active
+
+        self.assertTrue(ws['A1'].font.bold)
+        self.assertEqual(ws['B2'].border.left.style, 'thin')
+        self.assertEqual(ws.column_dimensions['A'].width, ExcelNewsWriter.MAX_COLUMN_WIDTH)
+        self.assertEqual(ws.freeze_panes, 'A2')
+
+    def test_merge_news_puts_new_rows_on_top(self):
+        """Testa que o modo incremental mescla as novas linhas com as existentes"""
+        self.repository.save_news([make_news('Antiga', 1)])
+
+        self.repository.merge_news([make_news('Nova', 2, has_money=True)])
+
+        rows = self._read_rows()
+        self.assertEqual([row[0] for row in rows[1:]], ['Nova', 'Antiga'])
+        self.assertEqual(rows[1][5], 'Sim')
+
+    def test_merge_remaps_rows_when_phrase_columns_change(self):
+        """Testa que o merge casa as colunas das linhas antigas pelo cabecalho quando EXTRA_PHRASES muda"""
+        images_dir = os.path.join(self.temp_dir.name, 'images')
+        ExcelNewsRepository(self.excel_path, images_dir, self.downloader, phrase_columns=['alpha', 'beta']).save_news(
+            [make_counted_news('Antiga', 1)])
+
+        ExcelNewsRepository(self.excel_path, images_dir, self.downloader, phrase_columns=['gamma', 'beta']).merge_news(
+            [make_counted_news('Nova', 2)])
+
+        rows = self._read_rows()
+        self.assertEqual(rows[0][-2:], ('Contagem: gamma', 'Contagem: beta'))
+        self.assertEqual([row[0] for row in rows[1:]], ['Nova', 'Antiga'])
+        self.assertEqual([len(row) for row in rows], [8, 8, 8])
+        self.assertEqual(rows[2][-2:], (None, 3))
+
+class TestShardedExcelOutput(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.excel_path = os.path.join(self.temp_dir.name, 'results.xlsx')
+        images_dir = os.path.join(self.temp_dir.name, 'images')
+        self.downloader = ImageDownloader(images_dir, max_workers=2)
+        self.images_dir = images_dir
+
+    def tearDown(self):
+        self.downloader.close()
+        self.temp_dir.cleanup()
+
+    def _repository(self, shard_by, layout='workbooks', shard_rows=None, processes=1):
+        return ExcelNewsRepository(self.excel_path, self.images_dir, image_downloader=self.downloader, shard_by=shard_by,
+                                   shard_rows=shard_rows, shard_layout=layout, shard_processes=processes)
+
+    def _path(self, name):
+        return os.path.join(self.temp_dir.name, name)
+
+    def test_month_shards_in_parallel_workbooks_with_index(self):
+        """Testa a divisao por mes em workbooks gravados por processos e o indice com links"""
+        news = [make_news('Marco', 2, month=3), make_news('Fevereiro', 5, month=2),
+                make_news('Janeiro B', 9), make_news('Janeiro A', 3)]
+
+        self._repository('month', processes=2).save_news(news)
+
+        index = load_workbook(self.excel_path)['Indice']
+        self.assertEqual([row[:3] for row in index.iter_rows(min_row=2, values_only=True)],
+                         [('2024-03', 'results_2024-03.xlsx', 1), ('2024-02', 'results_2024-02.xlsx', 1),
+                          ('2024-01', 'results_2024-01.xlsx', 2)])
+        self.assertEqual(index['B2'].hyperlink.target, 'results_2024-03.xlsx')
+        self.assertEqual(index['D4'].value, '2024-01-03 00:00:00')
+        january = read_sheet(self._path('results_2024-01.xlsx'))
+        self.assertEqual(january[0], tuple(ExcelNewsWriter.HEADERS))
+        self.assertEqual([row[0] for row in january[1:]], ['Janeiro B', 'Janeiro A'])
+        self.assertFalse([name for name in os.listdir(self.temp_dir.name) if name.startswith('.shards-')])
+
+    def test_month_shards_are_capped_by_rows(self):
+        """Testa que um mes com mais linhas que EXCEL_SHARD_ROWS e dividido em varias partes"""
+        news = [make_news('Fevereiro', 1, month=2)] + [make_news(f'Janeiro {day}', day) for day in range(1, 6)]
+
+        self._repository('month', shard_rows=2).save_news(news)
+
+        index = read_sheet(self.excel_path, 'Indice')
+        self.assertEqual([row[0] for row in index[1:]], ['2024-02', '2024-01', '2024-01_0002', '2024-01_0003'])
+        self.assertEqual([row[0] for row in read_sheet(self._path('results_2024-01_0003.xlsx'))[1:]], ['Janeiro 5'])
+
+    def test_failed_part_publishes_nothing(self):
+        """Testa que uma falha em qualquer parte mantem todas as partes e o indice anteriores, sem temporarios"""
+        repository = self._repository('month')
+        repository.save_news([make_news('Fevereiro', 1, month=2), make_news('Janeiro', 1)])
+        write_workbook = sharded_excel_news_writer._write_workbook
+
+        def fail_on_january(task):
+            if task[1].endswith('2024-01.xlsx'):
+                raise OSError('disco cheio')
+            return write_workbook(task)
+
+        with patch.object(sharded_excel_news_writer, '_write_workbook', side_effect=fail_on_january):
+            with self.assertRaises(OSError):
+                repository.save_news([make_news('Fevereiro nova', 2, month=2), make_news('Janeiro nova', 2)])
+
+        self.assertEqual([row[0] for row in read_sheet(self._path('results_2024-02.xlsx'))[1:]], ['Fevereiro'])
+        self.assertEqual([row[2] for row in read_sheet(self.excel_path, 'Indice')[1:]], [1, 1])
+        self.assertEqual(sorted(os.listdir(self.temp_dir.name)),
+                         ['images', 'results.xlsx', 'results_2024-01.xlsx', 'results_2024-02.xlsx'])
+
+    def test_row_shards_as_sheets(self):
+        """Testa a divisao a cada N linhas em abas do mesmo arquivo, com a aba de indice primeiro"""
+        self._repository('rows', layout='sheets', shard_rows=2).save_news(
+            make_news(f'Noticia {day}', day) for day in range(1, 6))
+
+        wb = load_workbook(self.excel_path)
+        self.assertEqual(wb.sheetnames, ['Indice', '0001', '0002', '0003'])
+        self.assertEqual(wb['Indice']['B2'].hyperlink.location, "'0001'!A1")
+        self.assertEqual([row[0] for row in wb['0003'].iter_rows(min_row=2, values_only=True)], ['Noticia 5'])
+        self.assertEqual(wb['0002'].freeze_panes, 'A2')
+        wb.close()
+
+    def test_month_merge_rewrites_only_touched_workbooks(self):
+        """Testa que o merge mensal so reescreve as partes com noticias novas e atualiza o indice"""
+        repository = self._repository('month')
+        repository.save_news([make_news('Fevereiro', 5, month=2), make_news('Janeiro', 9)])
+        february = self._path('results_2024-02.xlsx')
+        os.utime(february, (1, 1))
+
+        repository.merge_news([make_news('Janeiro nova', 20)])
+
+        self.assertEqual(os.path.getmtime(february), 1)
+        self.assertEqual([row[0] for row in read_sheet(self._path('results_2024-01.xlsx'))[1:]], ['Janeiro nova', 'Janeiro'])
+        index = read_sheet(self.excel_path, 'Indice')
+        self.assertEqual([row[:3] for row in index[1:]], [('2024-02', 'results_2024-02.xlsx', 1),
+                                                          ('2024-01', 'results_2024-01.xlsx', 2)])
+        self.assertEqual(index[2][3:], ('2024-01-09 00:00:00', '2024-01-20 00:00:00'))
+
+    def test_month_merge_remaps_all_parts_when_phrase_columns_change(self):
+        """Testa que, com outras frases adicionais, todas as partes sao reescritas com as colunas atuais"""
+        ExcelNewsRepository(self.excel_path, self.images_dir, image_downloader=self.downloader, shard_by='month',
+                            phrase_columns=['alpha', 'beta']).save_news(
+            [make_counted_news('Fevereiro', 5, month=2), make_counted_news('Janeiro', 9)])
+
+        ExcelNewsRepository(self.excel_path, self.images_dir, image_downloader=self.downloader, shard_by='month',
+                            phrase_columns=['beta']).merge_news([make_counted_news('Janeiro nova', 20)])
+
+        for name, titles in (('results_2024-02.xlsx', ['Fevereiro']), ('results_2024-01.xlsx', ['Janeiro nova', 'Janeiro'])):
+            rows = read_sheet(self._path(name))
+            self.assertEqual(rows[0][-1], 'Contagem: beta')
+            self.assertEqual([row[0] for row in rows[1:]], titles)
+            self.assertEqual({(len(row), row[-1]) for row in rows[1:]}, {(7, 3)})
+
+    def test_row_merge_redistributes_and_converts_single_sheet_output(self):
+        """Testa o merge por linhas sobre uma saida sem divisao: novas primeiro e partes refeitas"""
+        ExcelNewsRepository(self.excel_path, self.images_dir, image_downloader=self.downloader, shard_by='none').save_news(
+            [make_news('Antiga 1', 1), make_news('Antiga 2', 2)])
+
+        self._repository('rows', shard_rows=2).merge_news([make_news('Nova', 3)])
+
+        self.assertEqual([row[0] for row in read_sheet(self._path('results_0001.xlsx'))[1:]], ['Nova', 'Antiga 1'])
+        self.assertEqual([row[0] for row in read_sheet(self._path('results_0002.xlsx'))[1:]], ['Antiga 2'])
+
+        self._repository('rows', shard_rows=5).save_news([make_news('Unica', 4)])
+
+        self.assertFalse(os.path.exists(self._path('results_0002.xlsx')))
+        self.assertEqual([row[1] for row in read_sheet(self.excel_path, 'Indice')[1:]], ['results_0001.xlsx'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import os
+import tempfile
+import unittest
+from src.infrastructure.cache.image_cache import ImageCache
+
+class TestImageCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = ImageCache(os.path.join(self.temp_dir.name, 'cache'), ttl_seconds=60)
+        self.images_dir = os.path.join(self.temp_dir.name, 'images')
+        os.makedirs(self.images_dir)
+
+    def tearDown(self):
+        self.cache.close()
+        self.temp_dir.cleanup()
+
+    def test_filename_is_stable_per_url(self):
+        """Testa que o nome do arquivo depende apenas da URL"""
+        name = ImageCache.filename_for('https://example.com/a/photo.PNG')
+        self.assertEqual(name, ImageCache.filename_for('https://example.com/a/photo.PNG'))
+        self.assertTrue(name.endswith('.png'))
+        self.assertNotEqual(name, ImageCache.filename_for('https://example.com/b/photo.png'))
+
+    def test_identical_payloads_share_one_blob(self):
+        """Testa a deduplicacao de conteudos iguais vindos de URLs diferentes"""
+        first = self.cache.store('https://example.com/1.jpg', [b'same', b'bytes'], etag='"v1"')
+        second = self.cache.store('https://example.com/2.jpg', [b'samebytes'])
+
+        self.assertEqual(first.blob_path, second.blob_path)
+        self.assertEqual(len(os.listdir(self.cache.blobs_dir)), 1)
+
+    def test_lookup_returns_revalidation_metadata(self):
+        """Testa que ETag/Last-Modified viram cabecalhos condicionais"""
+        self.cache.store('https://example.com/1.jpg', [b'data'], etag='"v1"', last_modified='Mon, 01 Jan 2024 00:00:00 GMT')
+
+        cached = self.cache.lookup('https://example.com/1.jpg')
+
+        self.assertTrue(self.cache.is_fresh(cached))
+        self.assertEqual(self.cache.conditional_headers(cached), {
+            'If-None-Match': '"v1"',
+            'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT',
+        })
+        self.assertIsNone(self.cache.lookup('https://example.com/other.jpg'))
+
+    def test_link_materializes_blob_in_images_dir(self):
+        """Testa que a imagem aparece na pasta de destino com o conteudo do cache"""
+        cached = self.cache.store('https://example.com/1.jpg', [b'data'])
+        target = os.path.join(self.images_dir, 'x.jpg')
+
+        self.cache.link(cached, target)
+        self.cache.link(cached, target)
+
+        with open(target, 'rb') as f:
+            self.assertEqual(f.read(), b'data')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import os
+import tempfile
+import threading
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+from src.domain.entities.news import News
+from src.infrastructure.cache.image_cache import ImageCache
+from src.infrastructure.clients.image_downloader import ImageDownloader
+
+class TestImageDownloader(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.downloader = ImageDownloader(self.temp_dir.name, max_workers=2)
+        self.downloader._session = MagicMock()
+
+    def tearDown(self):
+        self.downloader.close()
+        self.temp_dir.cleanup()
+
+    def _mock_response(self, status_code, chunks=(), headers=None):
+        response = MagicMock()
+        response.status_code = status_code
+        response.headers = headers or {}
+        response.iter_content.return_value = iter(chunks)
+        response.__enter__.return_value = response
+        return response
+
+    def test_download_streams_chunks_to_disk(self):
+        """Testa que a imagem e gravada em blocos e o status e o nome do arquivo"""
+        self.downloader._session.get.return_value = self._mock_response(200, [b'abc', b'def'])
+
+        status = self.downloader.download('https://example.com/a.jpg', 'a.jpg')
+
+        self.assertEqual(status, 'a.jpg')
+        with open(os.path.join(self.temp_dir.name, 'a.jpg'), 'rb') as f:
+            self.assertEqual(f.read(), b'abcdef')
+        _, kwargs = self.downloader._session.get.call_args
+        self.assertTrue(kwargs['stream'])
+        self.assertIsNotNone(kwargs['timeout'])
+
+    def test_file_locks_do_not_grow_with_images(self):
+        """Testa que os locks por arquivo sao um conjunto fixo, o mesmo lock para o mesmo nome"""
+        self.downloader._session.get.side_effect = lambda url, **kwargs: self._mock_response(200, [b'x'])
+
+        self.downloader.download_all([(f'https://example.com/{i}.jpg', f'{i}.jpg') for i in range(500)])
+
+        self.assertEqual(len(self.downloader._file_locks), ImageDownloader.LOCK_STRIPES)
+        self.assertIs(self.downloader._lock_for('a.jpg'), self.downloader._lock_for('a.jpg'))
+
+    def test_download_all_keeps_order_and_reports_errors(self):
+        """Testa que os status voltam na ordem pedida, incluindo erros"""
+        responses = {
+            'https://example.com/ok.jpg': self._mock_response(200, [b'x']),
+            'https://example.com/missing.jpg': self._mock_response(404),
+        }
+        self.downloader._session.get.side_effect = lambda url, **kwargs: responses[url]
+
+        statuses = self.downloader.download_all([
+            ('https://example.com/missing.jpg', 'missing.jpg'),
+            ('https://example.com/ok.jpg', 'ok.jpg'),
+            ('', 'empty.jpg'),
+        ])
+
+        self.assertEqual(statuses, ['Erro ao baixar imagem: 404', 'ok.jpg', 'URL não fornecida'])
+
+    def test_resolve_does_not_wait_for_a_slow_image(self):
+        """Testa que uma imagem lenta nao segura as noticias cujas imagens ja terminaram"""
+        release = threading.Event()
+
+        def download(url, filename):
+            if filename == 'lenta.jpg':
+                release.wait(5)
+            return filename
+
+        news = [News(name, datetime(2024, 1, 1), '', name, f'https://example.com/{name}', 0, False)
+                for name in ('lenta.jpg', 'a.jpg', 'b.jpg')]
+        with patch.object(self.downloader, 'download', side_effect=download):
+            resolved = self.downloader.resolve(iter(news))
+            first_two = [next(resolved).title, next(resolved).title]
+            release.set()
+            rest = [item.title for item in resolved]
+
+        self.assertEqual(sorted(first_two), ['a.jpg', 'b.jpg'])
+        self.assertEqual(rest, ['lenta.jpg'])
+
+    def test_download_revalidates_cached_image(self):
+        """Testa que uma imagem expirada no cache e revalidada com GET condicional (304)"""
+        cache = ImageCache(os.path.join(self.temp_dir.name, 'cache'), ttl_seconds=0)
+        self.downloader.image_cache = cache
+        cache.store('https://example.com/a.jpg', [b'cached'], etag='"v1"')
+        self.downloader._session.get.return_value = self._mock_response(304)
+
+        status = self.downloader.download('https://example.com/a.jpg', 'a.jpg')
+
+        self.assertEqual(status, 'a.jpg')
+        _, kwargs = self.downloader._session.get.call_args
+        self.assertEqual(kwargs['headers'], {'If-None-Match': '"v1"'})
+        with open(os.path.join(self.temp_dir.name, 'a.jpg'), 'rb') as f:
+            self.assertEqual(f.read(), b'cached')
+
+    def test_oversized_image_is_reported_without_file(self):
+        """Testa o limite de bytes por imagem: pelo Content-Length e durante o streaming"""
+        self.downloader.max_bytes = 4
+        responses = {
+            'https://example.com/declared.jpg': self._mock_response(200, [b'x'], {'Content-Length': '100'}),
+            'https://example.com/streamed.jpg': self._mock_response(200, [b'abc', b'def']),
+        }
+        self.downloader._session.get.side_effect = lambda url, **kwargs: responses[url]
+
+        statuses = self.downloader.download_all([('https://example.com/declared.jpg', 'declared.jpg'),
+                                                 ('https://example.com/streamed.jpg', 'streamed.jpg')])
+
+        self.assertEqual(statuses, ['Imagem excede o limite de 4 bytes'] * 2)
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+    def test_resumes_partial_download_with_range(self):
+        """Testa que um .part com validador e retomado via Range/If-Range e publicado inteiro"""
+        part_path = os.path.join(self.temp_dir.name, 'a.jpg.part')
+        with open(part_path, 'wb') as f:
+            f.write(b'abc')
+        with open(part_path + '.validator', 'w') as f:
+            f.write('"v1"')
+        self.downloader._session.get.return_value = self._mock_response(
+            206, [b'def'], {'Content-Range': 'bytes 3-5/6', 'Content-Length': '3', 'ETag': '"v1"'})
+
+        status = self.downloader.download('https://example.com/a.jpg', 'a.jpg')
+
+        self.assertEqual(status, 'a.jpg')
+        _, kwargs = self.downloader._session.get.call_args
+        self.assertEqual(kwargs['headers'], {'Range': 'bytes=3-', 'If-Range': '"v1"'})
+        with open(os.path.join(self.temp_dir.name, 'a.jpg'), 'rb') as f:
+            self.assertEqual(f.read(), b'abcdef')
+        self.assertEqual(os.listdir(self.temp_dir.name), ['a.jpg'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import json
+import logging
+import os
+import queue
+import tempfile
+import unittest
+from unittest.mock import patch
+from src.infrastructure.logging.logger import DeferredQueueHandler, JsonLinesFormatter, _configure
+
+class TestLogger(unittest.TestCase):
+    def test_queue_handler_defers_formatting(self):
+        """Testa que o registro vai para a fila sem formatar a mensagem na thread chamadora"""
+        class Lazy:
+            formatted = False
+            def __str__(self):
+                Lazy.formatted = True
+                return 'lazy'
+
+        log_queue = queue.SimpleQueue()
+        handler = DeferredQueueHandler(log_queue)
+        record = logging.LogRecord('teste', logging.DEBUG, __file__, 1, 'valor: %s', (Lazy(),), None)
+
+        handler.emit(record)
+
+        queued = log_queue.get_nowait()
+        self.assertFalse(Lazy.formatted)
+        self.assertEqual(queued.getMessage(), 'valor: lazy')
+
+    def test_json_lines_formatter(self):
+        """Testa que cada registro vira um objeto JSON com nivel e mensagem"""
+        record = logging.LogRecord('teste', logging.INFO, __file__, 1, 'Noticias: %d', (3,), None)
+
+        entry = json.loads(JsonLinesFormatter().format(record))
+
+        self.assertEqual(entry['level'], 'INFO')
+        self.assertEqual(entry['message'], 'Noticias: 3')
+        self.assertEqual(entry['logger'], 'teste')
+
+    def test_default_level_is_info(self):
+        """Testa que, sem LOG_LEVEL, o arquivo de log nao recebe as linhas de depuracao por artigo"""
+        test_logger = logging.getLogger('teste_nivel_padrao')
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch.dict(os.environ, {'LOG_DIR': temp_dir, 'LOG_ASYNC': 'false'}):
+                os.environ.pop('LOG_LEVEL', None)
+                _configure(test_logger)
+            try:
+                self.assertEqual(test_logger.level, logging.INFO)
+            finally:
+                for handler in list(test_logger.handlers):
+                    test_logger.removeHandler(handler)
+                    handler.close()
+
+if __name__ == '__main__':
+    unittest.main()
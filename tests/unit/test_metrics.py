@@ -0,0 +1,85 @@
+import json
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from src.infrastructure.metrics.metrics import Histogram, MetricsRegistry, submit_in_context
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.registry = MetricsRegistry()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_histogram_buckets_and_quantiles(self):
+        """Testa a distribuicao nos buckets e a estimativa de quantis"""
+        histogram = Histogram(buckets=(0.1, 1.0))
+        for value in (0.05, 0.05, 0.5, 3.0):
+            histogram.observe(value)
+
+        self.assertEqual(histogram.counts, [2, 1, 1])
+        self.assertEqual(histogram.quantile(0.5), 0.1)
+        self.assertEqual(histogram.quantile(0.99), 3.0)
+
+    def test_scopes_split_parallel_jobs(self):
+        """Testa escopos por job em threads paralelas, inclusive nas tarefas submetidas com o contexto"""
+        def job(name, requests):
+            with self.registry.scope() as scope:
+                with ThreadPoolExecutor(max_workers=2) as pool:
+                    futures = [submit_in_context(pool, self.registry.increment, 'api_requests_total') for _ in range(requests)]
+                    for future in futures:
+                        future.result()
+                self.registry.add_stage_time(name, 1.0)
+            return scope.snapshot()
+
+        with ThreadPoolExecutor(max_workers=2) as jobs:
+            first, second = jobs.map(job, ['a', 'b'], [3, 5])
+
+        self.assertEqual((first['counters'], first['stage_seconds']), ({'api_requests_total': 3}, {'a': 1.0}))
+        self.assertEqual((second['counters'], second['stage_seconds']), ({'api_requests_total': 5}, {'b': 1.0}))
+        self.assertEqual(self.registry.snapshot()['counters'], {'api_requests_total': 8})
+
+    def test_counters_and_stages(self):
+        """Testa contadores e o tempo acumulado por etapa"""
+        self.registry.increment('api_requests_total')
+        self.registry.increment('api_bytes_downloaded_total', 512)
+        self.registry.add_stage_time('analysis', 0.25)
+        with self.registry.stage('analysis'):
+            pass
+
+        snapshot = self.registry.snapshot()
+
+        self.assertEqual(snapshot['counters'], {'api_bytes_downloaded_total': 512, 'api_requests_total': 1})
+        self.assertGreaterEqual(snapshot['stage_seconds']['analysis'], 0.25)
+
+    def test_prometheus_textfile(self):
+        """Testa o formato texto do Prometheus com contadores, etapas e histogramas"""
+        self.registry.increment('api_requests_total', 2)
+        self.registry.add_stage_time('fetch', 1.5)
+        self.registry.observe('api_request_seconds', 0.2)
+
+        text = self.registry.to_prometheus({'run_news_count': 3})
+
+        self.assertIn('news_extractor_run_news_count 3', text)
+        self.assertIn('# TYPE news_extractor_api_requests_total counter', text)
+        self.assertIn('news_extractor_stage_seconds{stage="fetch"} 1.500000', text)
+        self.assertIn('news_extractor_api_request_seconds_bucket{le="0.25"} 1', text)
+        self.assertIn('news_extractor_api_request_seconds_bucket{le="+Inf"} 1', text)
+        self.assertIn('news_extractor_api_request_seconds_count 1', text)
+
+    def test_json_report(self):
+        """Testa o relatorio JSON com os dados da execucao e as metricas"""
+        path = os.path.join(self.temp_dir.name, 'run.metrics.json')
+        self.registry.observe('image_download_seconds', 0.5)
+
+        self.registry.write_json(path, {'news_count': 7})
+
+        with open(path, encoding='utf-8') as f:
+            report = json.load(f)
+        self.assertEqual(report['news_count'], 7)
+        self.assertEqual(report['histograms']['image_download_seconds']['count'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -32,5 +32,29 @@ class TestNewsAnalyzer(unittest.TestCase):
         self.assertEqual(search_count, 0)
         self.assertFalse(has_money)
 
+    def test_analyze_news_ignores_accents_and_punctuation(self):
+        """Testa a normalizacao de acentos e pontuacao na contagem da frase"""
+        search_count, _ = self.analyzer.analyze_news("Educação: educacao!", "EDUCAÇÃO em pauta", "educação")
+
+        self.assertEqual(search_count, 3)
+
+    def test_money_pattern_does_not_cross_title_and_description(self):
+        """Testa que o titulo e a descricao nao formam um valor monetario juntos"""
+        _, has_money = self.analyzer.analyze_news("Preco em $", "11,1 unidades", "preco")
+
+        self.assertFalse(has_money)
+
+    def test_analyze_many_keeps_order(self):
+        """Testa a analise em lote com analisador pre-compilado"""
+        analyzer = NewsAnalyzer.for_phrase("trump")
+
+        results = analyzer.analyze_many([
+            ("Trump fala", "Sem valores"),
+            ("Outro tema", "Custo de 20 dollars"),
+        ])
+
+        self.assertEqual(results, [(1, False), (0, True)])
+        self.assertIs(NewsAnalyzer.for_phrase("trump"), analyzer)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
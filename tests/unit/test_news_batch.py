@@ -0,0 +1,51 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from src.domain.entities.news import News
+from src.domain.entities.news_batch import NewsBatch
+from src.infrastructure.repositories.batch_news_repository import news_to_record
+
+def make_news(index, date, phrase_counts=None):
+    return News(f'Titulo {index}', date, f'Descricao {index}', f'{index}.jpg', f'https://img/{index}.jpg',
+                index, index % 2 == 0, article_id=f'id-{index}', phrase_counts=phrase_counts or {})
+
+class TestNewsBatch(unittest.TestCase):
+    def test_news_is_slotted(self):
+        """Testa que News nao tem __dict__ por instancia e mantem a igualdade por campos"""
+        news = make_news(1, datetime(2024, 1, 1))
+
+        self.assertFalse(hasattr(news, '__dict__'))
+        self.assertEqual(news, make_news(1, datetime(2024, 1, 1)))
+        self.assertNotEqual(news, make_news(2, datetime(2024, 1, 1)))
+
+    def test_rows_round_trip(self):
+        """Testa que as linhas do lote devolvem os mesmos valores, inclusive datas com e sem fuso"""
+        news_list = [
+            make_news(0, datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc), {'casa': 2}),
+            make_news(1, datetime(2024, 1, 2, 8, 0, 0, 123, tzinfo=timezone(timedelta(hours=-3)))),
+            make_news(2, datetime(1965, 5, 17, 23, 59), {'juros': 1})
+        ]
+
+        batch = NewsBatch(news_list)
+
+        self.assertEqual(len(batch), 3)
+        self.assertEqual([row.to_news().as_tuple()[:-1] for row in batch], [news.as_tuple()[:-1] for news in news_list])
+        self.assertEqual(batch[1].date.utcoffset(), timedelta(hours=-3))
+        self.assertIsNone(batch[-1].date.tzinfo)
+        self.assertEqual([row.phrase_counts for row in batch],
+                         [{'casa': 2, 'juros': 0}, {'casa': 0, 'juros': 0}, {'casa': 0, 'juros': 1}])
+
+    def test_row_views_are_compatible_with_consumers(self):
+        """Testa que a visao da linha funciona com os consumidores existentes e aceita o status da imagem"""
+        batch = NewsBatch([make_news(4, datetime(2024, 3, 1, tzinfo=timezone.utc), {'casa': 1})])
+        row = batch[0]
+
+        row.image_filename = 'Sem imagem'
+
+        self.assertEqual(batch.image_filenames[0], 'Sem imagem')
+        self.assertEqual(news_to_record(row), news_to_record(batch.to_news(0)))
+        self.assertTrue(row.has_money)
+        with self.assertRaises(IndexError):
+            batch[1]
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import patch
+from openpyxl import load_workbook
+from src.domain.entities.news import News
+from src.infrastructure.clients.image_downloader import ImageDownloader
+from src.infrastructure.repositories.csv_news_repository import CsvNewsRepository
+from src.infrastructure.repositories.jsonl_news_repository import JsonlNewsRepository
+from src.infrastructure.repositories.multi_format_news_repository import MultiFormatNewsRepository
+from src.infrastructure.repositories.repository_factory import (create_news_repository, output_path_for,
+                                                                parse_output_formats)
+
+try:
+    import pyarrow.parquet as pq
+    from src.infrastructure.repositories.parquet_news_repository import ParquetNewsRepository
+except ImportError:
+    pq = None
+
+def make_news(title, day):
+    return News(title, datetime(2024, 1, day, tzinfo=timezone.utc), 'Descricao', '', '', day, day % 2 == 0,
+                article_id=f'id-{day}', phrase_counts={'biden': day})
+
+class TestOutputRepositories(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.images_dir = os.path.join(self.temp_dir.name, 'images')
+        self.downloader = ImageDownloader(self.images_dir, max_workers=2)
+
+    def tearDown(self):
+        self.downloader.close()
+        self.temp_dir.cleanup()
+
+    def _path(self, name):
+        return os.path.join(self.temp_dir.name, name)
+
+    def test_csv_writes_in_batches_and_merges(self):
+        """Testa o CSV em lotes e a mesclagem incremental"""
+        repository = CsvNewsRepository(self._path('out.csv'), self.images_dir, self.downloader, batch_size=2)
+        repository.save_news(make_news(f'N{day}', day) for day in range(1, 6))
+        repository.merge_news([make_news('Nova', 9)])
+
+        with open(self._path('out.csv'), newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+
+        self.assertEqual([row['title'] for row in rows], ['Nova', 'N1', 'N2', 'N3', 'N4', 'N5'])
+        self.assertEqual(rows[1]['image'], 'Sem imagem')
+
+    def test_csv_merge_remaps_rows_when_columns_change(self):
+        """Testa que o merge do CSV remapeia as linhas antigas quando as frases adicionais mudam"""
+        CsvNewsRepository(self._path('out.csv'), self.images_dir, self.downloader,
+                          phrase_columns=['biden', 'casa branca']).save_news([make_news('Antiga', 2)])
+
+        CsvNewsRepository(self._path('out.csv'), self.images_dir, self.downloader,
+                          phrase_columns=['trump', 'biden']).merge_news([make_news('Nova', 3)])
+
+        with open(self._path('out.csv'), newline='', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            rows = list(reader)
+        self.assertEqual(reader.fieldnames[-2:], ['count:trump', 'count:biden'])
+        self.assertEqual([(row['title'], row['count:trump'], row['count:biden']) for row in rows],
+                         [('Nova', '0', '3'), ('Antiga', '', '2')])
+
+    def test_merge_without_news_keeps_previous_file(self):
+        """Testa que uma mesclagem sem noticias novas nao reescreve a saida nem deixa temporarios"""
+        repository = create_news_repository(['csv', 'jsonl'], self._path('out.xlsx'), self.images_dir, self.downloader)
+        repository.save_news([make_news('N1', 1)])
+        csv_path = self._path('out.csv')
+        os.utime(csv_path, (0, 0))
+
+        repository.merge_news([])
+
+        self.assertEqual(os.path.getmtime(csv_path), 0)
+        self.assertEqual(sorted(os.listdir(self.temp_dir.name)), ['images', 'out.csv', 'out.jsonl'])
+
+    def test_jsonl_writes_one_record_per_line(self):
+        """Testa o JSONL com um registro por linha"""
+        repository = JsonlNewsRepository(self._path('out.jsonl'), self.images_dir, self.downloader)
+        repository.save_news([make_news('N1', 1), make_news('N2', 2)])
+
+        with open(self._path('out.jsonl'), encoding='utf-8') as f:
+            records = [json.loads(line) for line in f]
+
+        self.assertEqual(records[1]['has_money'], True)
+        self.assertEqual(records[0]['date'], '2024-01-01T00:00:00+00:00')
+
+    def test_jsonl_lists_every_configured_phrase(self):
+        """Testa que o JSONL recebe as frases adicionais como os demais formatos"""
+        repository = create_news_repository(['jsonl'], self._path('out.xlsx'), self.images_dir, self.downloader,
+                                            phrase_columns=['biden', 'casa branca'])
+        repository.save_news([make_news('N1', 1)])
+
+        with open(self._path('out.jsonl'), encoding='utf-8') as f:
+            record = json.loads(f.readline())
+
+        self.assertEqual(record['phrase_counts'], {'biden': 1, 'casa branca': 0})
+
+    @unittest.skipIf(pq is None, "pyarrow nao instalado")
+    def test_parquet_writes_one_row_group_per_batch(self):
+        """Testa o Parquet com um row group por lote"""
+        repository = ParquetNewsRepository(self._path('out.parquet'), self.images_dir, self.downloader, batch_size=2)
+        repository.save_news(make_news(f'N{day}', day) for day in range(1, 6))
+        repository.merge_news([make_news('Nova', 9)])
+
+        parquet_file = pq.ParquetFile(self._path('out.parquet'))
+
+        self.assertEqual(parquet_file.num_row_groups, 4)
+        self.assertEqual(parquet_file.read().column('title').to_pylist(), ['Nova', 'N1', 'N2', 'N3', 'N4', 'N5'])
+
+    def test_multi_format_writes_every_format_in_one_pass(self):
+        """Testa que varios formatos sao gravados consumindo o gerador uma unica vez"""
+        repository = create_news_repository(['excel', 'csv', 'jsonl'], self._path('out.xlsx'), self.images_dir, self.downloader)
+        self.assertIsInstance(repository, MultiFormatNewsRepository)
+
+        repository.save_news(make_news(f'N{day}', day) for day in range(1, 4))
+
+        self.assertEqual(load_workbook(self._path('out.xlsx')).active.max_row, 4)
+        with open(self._path('out.csv'), encoding='utf-8') as f:
+            self.assertEqual(len(f.readlines()), 4)
+        with open(self._path('out.jsonl'), encoding='utf-8') as f:
+            self.assertEqual(len(f.readlines()), 3)
+
+    def test_extra_phrases_get_one_column_each(self):
+        """Testa uma coluna de contagem por frase adicional no Excel e no CSV"""
+        repository = create_news_repository(['excel', 'csv'], self._path('out.xlsx'), self.images_dir, self.downloader,
+                                            phrase_columns=['biden', 'casa branca'])
+
+        repository.save_news([make_news('N3', 3)])
+
+        ws = load_workbook(self._path('out.xlsx')).active
+        self.assertEqual([cell.value for cell in ws[1]][-2:], ['Contagem: biden', 'Contagem: casa branca'])
+        self.assertEqual([cell.value for cell in ws[2]][-2:], [3, 0])
+        with open(self._path('out.csv'), newline='', encoding='utf-8') as f:
+            row = next(csv.DictReader(f))
+        self.assertEqual((row['count:biden'], row['count:casa branca']), ('3', '0'))
+
+    def test_parse_output_formats(self):
+        """Testa a leitura da configuracao de formatos"""
+        self.assertEqual(parse_output_formats(None), ['excel'])
+        self.assertEqual(parse_output_formats('Excel, csv'), ['excel', 'csv'])
+        with self.assertRaises(ValueError):
+            parse_output_formats('xml')
+
+    def test_job_outputs_ignore_global_format_paths(self):
+        """Testa que, sem env_paths (modo batch), CSV_PATH nao faz jobs diferentes gravarem no mesmo arquivo"""
+        with patch.dict(os.environ, {'CSV_PATH': 'global.csv'}):
+            self.assertEqual(output_path_for('csv', 'saida/job.xlsx'), 'global.csv')
+            self.assertEqual(output_path_for('csv', 'saida/a.xlsx', env_paths=False), 'saida/a.csv')
+            self.assertEqual(output_path_for('csv', 'saida/b.xlsx', env_paths=False), 'saida/b.csv')
+
+if __name__ == '__main__':
+    unittest.main()
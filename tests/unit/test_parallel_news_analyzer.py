@@ -0,0 +1,49 @@
+import unittest
+from unittest.mock import patch
+from src.domain.services.news_analyzer import NewsAnalyzer
+from src.domain.services.parallel_news_analyzer import ParallelNewsAnalyzer
+from src.infrastructure.processes.process_pool import process_context
+
+def make_texts(size):
+    return [(f"Trump {i} fala sobre a eleição", f"Acordo de US$ {i},50 com Trump" if i % 3 == 0 else f"Noticia {i}")
+            for i in range(size)]
+
+class TestParallelNewsAnalyzer(unittest.TestCase):
+    def setUp(self):
+        self.analyzer = NewsAnalyzer('trump', ['eleicao'])
+
+    def test_chunk_size_follows_corpus_size(self):
+        """Testa o ajuste do tamanho do chunk pelo tamanho do corpus, dentro dos limites"""
+        parallel = ParallelNewsAnalyzer(self.analyzer, max_workers=4)
+
+        self.assertEqual(parallel.chunk_size_for(100), ParallelNewsAnalyzer.MIN_CHUNK_SIZE)
+        self.assertEqual(parallel.chunk_size_for(40000), 2500)
+        self.assertEqual(parallel.chunk_size_for(10 ** 7), ParallelNewsAnalyzer.MAX_CHUNK_SIZE)
+
+    def test_small_inputs_run_in_process(self):
+        """Testa que entradas pequenas nao sobem o pool de processos"""
+        parallel = ParallelNewsAnalyzer(self.analyzer, max_workers=4)
+        with patch('src.domain.services.parallel_news_analyzer.ProcessPoolExecutor') as pool:
+            results = parallel.analyze_many(make_texts(10))
+
+        pool.assert_not_called()
+        self.assertEqual(results, self.analyzer.analyze_many_with_phrases(make_texts(10)))
+
+    def test_parallel_results_keep_order(self):
+        """Testa que a analise em processos devolve o mesmo resultado, na mesma ordem"""
+        texts = make_texts(1200)
+        parallel = ParallelNewsAnalyzer(self.analyzer, max_workers=2, min_parallel_items=0)
+
+        self.assertEqual(parallel.analyze_many(texts), self.analyzer.analyze_many_with_phrases(texts))
+
+    def test_pool_uses_the_given_context(self):
+        """Testa que o pool sobe com o contexto recebido (spawn no extrator: ha threads vivas no processo)"""
+        parallel = ParallelNewsAnalyzer(self.analyzer, max_workers=2, min_parallel_items=0, mp_context=process_context())
+        with patch('src.domain.services.parallel_news_analyzer.ProcessPoolExecutor') as pool:
+            pool.return_value.__enter__.return_value.map.return_value = []
+            parallel.analyze_many(make_texts(10))
+
+        self.assertEqual(pool.call_args.kwargs['mp_context'].get_start_method(), 'spawn')
+
+if __name__ == '__main__':
+    unittest.main()
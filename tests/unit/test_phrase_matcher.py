@@ -0,0 +1,41 @@
+import unittest
+from src.domain.services.news_analyzer import NewsAnalyzer
+from src.domain.services.phrase_matcher import PhraseMatcher
+
+class TestPhraseMatcher(unittest.TestCase):
+    def test_counts_all_phrases_in_one_pass(self):
+        """Testa a contagem de varias frases, incluindo frases que compartilham prefixo e sufixo"""
+        matcher = PhraseMatcher({'he': 'he', 'she': 'she', 'his': 'his', 'hers': 'hers'})
+
+        counts = matcher.count('ushers and his hershey')
+
+        self.assertEqual(counts, {'he': 3, 'she': 2, 'his': 1, 'hers': 2})
+
+    def test_whole_words_only(self):
+        """Testa a opcao de contar apenas palavras inteiras"""
+        patterns = {'casa': 'casa', 'casa branca': 'casa branca'}
+
+        partial = PhraseMatcher(patterns).count('casamento na casa branca')
+        whole = PhraseMatcher(patterns, whole_words=True).count('casamento na casa branca')
+
+        self.assertEqual(partial, {'casa': 2, 'casa branca': 1})
+        self.assertEqual(whole, {'casa': 1, 'casa branca': 1})
+
+    def test_unmatched_and_empty_phrases_count_zero(self):
+        """Testa que frases ausentes ou vazias ficam com contagem zero"""
+        self.assertEqual(PhraseMatcher({'x': 'xyz', 'vazia': ''}).count('abc'), {'x': 0, 'vazia': 0})
+
+    def test_analyzer_counts_extra_phrases_on_normalized_text(self):
+        """Testa as frases adicionais no analisador, com a mesma normalizacao da frase de busca"""
+        analyzer = NewsAnalyzer('trump', ['Casa Branca', 'eleição'])
+
+        search_count, has_money, phrase_counts = analyzer.analyze_with_phrases(
+            'Trump volta à Casa-Branca', 'Eleicao: casa branca reage'
+        )
+
+        self.assertEqual(search_count, 1)
+        self.assertFalse(has_money)
+        self.assertEqual(phrase_counts, {'Casa Branca': 1, 'eleição': 1})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import json
+import threading
+import time
+import unittest
+from datetime import datetime
+import urllib.error
+import urllib.request
+from unittest.mock import MagicMock, patch
+from src.application.use_cases.batch_fetch_news_use_case import BatchJob, JobResult
+from src.application.use_cases.poll_news_use_case import CycleResult, PollNewsUseCase
+from src.infrastructure.health.health_server import HealthServer
+from src.infrastructure.metrics.metrics import metrics
+
+def make_service(results, interval=0.0):
+    batch_use_case = MagicMock()
+    batch_use_case.execute.side_effect = results
+    jobs = [BatchJob('default', 'trump', ['business'], 1, 'saida.xlsx', incremental=True)]
+    return PollNewsUseCase(jobs, batch_use_case, interval), batch_use_case
+
+class TestPollNewsUseCase(unittest.TestCase):
+    def test_runs_cycles_and_accumulates_status(self):
+        """Testa varios ciclos com o mesmo caso de uso e o status acumulado"""
+        cycles = []
+        service, batch_use_case = make_service([[JobResult('default', 'saida.xlsx', news_count=5)],
+                                                [JobResult('default', 'saida.xlsx', news_count=0)]])
+        service.on_cycle = cycles.append
+
+        service.run(max_cycles=2)
+
+        status = service.status()
+        self.assertEqual(batch_use_case.execute.call_count, 2)
+        self.assertEqual([cycle.news_count for cycle in cycles], [5, 0])
+        self.assertEqual((status['cycles'], status['news_count'], status['state']), (2, 5, 'stopped'))
+        self.assertTrue(status['healthy'])
+
+    def test_metrics_cover_only_the_current_cycle(self):
+        """Testa que as metricas globais recomecam a cada ciclo (exportacao e /metrics por ciclo)"""
+        snapshots = []
+
+        def cycle(jobs):
+            metrics.increment('api_requests_total', 2)
+            return [JobResult('default', 'saida.xlsx', news_count=1)]
+
+        service, batch_use_case = make_service([])
+        batch_use_case.execute.side_effect = cycle
+        service.on_cycle = lambda result: snapshots.append(metrics.snapshot()['counters'])
+
+        service.run(max_cycles=2)
+
+        self.assertEqual(snapshots, [{'api_requests_total': 2}, {'api_requests_total': 2}])
+
+    def test_unhealthy_after_consecutive_failures(self):
+        """Testa que so ciclos com erro seguidos deixam o servico unhealthy"""
+        failed = [JobResult('default', 'saida.xlsx', error='HTTP 503')]
+        service, _ = make_service([failed, failed, RuntimeError('sem rede'), failed])
+
+        service.run(max_cycles=3)
+
+        self.assertFalse(service.healthy)
+        self.assertEqual(service.status()['last_cycle']['errors'], ['Job ciclo: sem rede'])
+
+    def test_stop_interrupts_the_wait(self):
+        """Testa que stop() encerra o servico sem esperar o intervalo"""
+        service, _ = make_service([[JobResult('default', 'saida.xlsx')]] * 5, interval=60)
+        thread = threading.Thread(target=service.run)
+        thread.start()
+        while service.status()['state'] != 'idle':
+            time.sleep(0.01)
+
+        service.stop()
+        thread.join(timeout=5)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(service.status()['cycles'], 1)
+
+    def test_cycle_errors_keep_startup_errors(self):
+        """Testa que os erros de cada ciclo se somam aos de inicializacao, sem compartilhar a lista do ciclo"""
+        from main import NewsExtractorFramework
+
+        framework = NewsExtractorFramework(daemon=True)
+        framework._startup_errors = ['Inicializacao: aviso']
+        framework.state['start_time'] = datetime.now()
+        cycle = CycleResult(1, '2024-01-01T00:00:00', jobs=[JobResult('default', 'saida.xlsx', error='HTTP 503')])
+
+        with patch.object(framework, 'export_metrics'):
+            framework._on_cycle(cycle)
+            framework.state['errors'].append('outro')
+            framework._on_cycle(CycleResult(2, '2024-01-01T00:15:00'))
+
+        self.assertEqual(framework.state['errors'], ['Inicializacao: aviso'])
+        self.assertEqual(framework._startup_errors, ['Inicializacao: aviso'])
+
+
+class TestHealthServer(unittest.TestCase):
+    def test_health_and_status_endpoints(self):
+        """Testa o /health (200 ou 503 conforme o status) e o /status em JSON"""
+        status = {'healthy': True, 'state': 'idle', 'cycles': 3}
+        with HealthServer(lambda: dict(status)) as server:
+            with urllib.request.urlopen(server.url + '/health') as response:
+                self.assertEqual(json.loads(response.read())['status'], 'ok')
+            with urllib.request.urlopen(server.url + '/status') as response:
+                payload = json.loads(response.read())
+            status['healthy'] = False
+            with self.assertRaises(urllib.error.HTTPError) as error:
+                urllib.request.urlopen(server.url + '/health')
+            error.exception.close()
+
+        self.assertEqual(payload['cycles'], 3)
+        self.assertIn('counters', payload['metrics'])
+        self.assertEqual(error.exception.code, 503)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+from email.utils import formatdate
+from unittest.mock import patch
+from src.infrastructure.clients.rate_limiter import (QuotaExhaustedError, RateLimiter, parse_quota_headers,
+                                                     parse_retry_after)
+
+class TestRateLimiter(unittest.TestCase):
+    def test_burst_then_fixed_interval(self):
+        """Testa que as primeiras requisicoes da rajada saem sem espera e as seguintes respeitam o intervalo"""
+        limiter = RateLimiter(max_rate=10, burst=3)
+
+        delays = [limiter.reserve() for _ in range(5)]
+
+        self.assertEqual([round(delay, 2) for delay in delays[:3]], [0, 0, 0])
+        self.assertAlmostEqual(delays[3], 0.1, places=2)
+        self.assertAlmostEqual(delays[4], 0.2, places=2)
+
+    def test_unlimited_rate_never_waits(self):
+        """Testa que taxa 0 (intervalo 0 no .env) nao limita"""
+        limiter = RateLimiter(max_rate=0)
+
+        self.assertTrue(all(limiter.reserve() <= 0 for _ in range(100)))
+
+    def test_retry_after_pauses_and_halves_rate(self):
+        """Testa que um 429 pausa todas as requisicoes pelo Retry-After e reduz a taxa"""
+        limiter = RateLimiter(max_rate=10)
+
+        limiter.penalize(5)
+
+        self.assertAlmostEqual(limiter.reserve(), 5, places=1)
+        self.assertEqual(limiter.current_rate, 5)
+
+    def test_success_recovers_rate_up_to_quota(self):
+        """Testa a recuperacao da taxa limitada pela cota informada nos cabecalhos"""
+        limiter = RateLimiter(max_rate=10)
+        limiter.penalize(0)
+        limiter.penalize(0)
+
+        for _ in range(50):
+            limiter.record_success({'X-RateLimit-Limit-Second': '4'})
+
+        self.assertEqual(limiter.current_rate, 4)
+
+    def test_cooldown_doubles_without_retry_after(self):
+        """Testa o cooldown crescente para 429 sem Retry-After e o reset apos um sucesso"""
+        limiter = RateLimiter(max_rate=10)
+
+        self.assertEqual([limiter.penalize() for _ in range(3)], [1, 2, 4])
+        limiter.record_success()
+        self.assertEqual(limiter.penalize(), 1)
+
+    def test_wait_async_does_not_block_other_tasks(self):
+        """Testa a espera assincrona compartilhada entre tarefas"""
+        limiter = RateLimiter(max_rate=20)
+
+        async def run():
+            start = time.monotonic()
+            await asyncio.gather(*(limiter.wait_async() for _ in range(3)))
+            return time.monotonic() - start
+
+        self.assertAlmostEqual(asyncio.run(run()), 0.1, delta=0.05)
+
+    def test_state_file_is_shared_between_instances(self):
+        """Testa que instancias com o mesmo arquivo de estado (processos diferentes) dividem o limite"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            state_path = os.path.join(temp_dir, 'rate.json')
+            first = RateLimiter(max_rate=10, state_path=state_path)
+            second = RateLimiter(max_rate=10, state_path=state_path)
+
+            first.reserve()
+            self.assertAlmostEqual(second.reserve(), 0.1, places=2)
+
+            second.penalize(3)
+            self.assertAlmostEqual(first.reserve(), 3, places=1)
+            self.assertEqual(first.current_rate, 5)
+
+    def test_from_env_returns_one_limiter_per_configuration(self):
+        """Testa que os clientes do mesmo processo recebem o mesmo limitador"""
+        with patch.dict(os.environ, {'API_MIN_REQUEST_INTERVAL': '0.5', 'API_RATE_BURST': '2', 'API_RATE_LIMIT_STATE': ''}):
+            limiter = RateLimiter.from_env()
+            self.assertIs(RateLimiter.from_env(), limiter)
+        self.assertEqual((limiter.max_rate, limiter.burst), (2, 2))
+
+
+class TestRateLimitHeaders(unittest.TestCase):
+    def test_parse_retry_after(self):
+        """Testa Retry-After em segundos e como data HTTP"""
+        now = time.time()
+
+        self.assertEqual(parse_retry_after('7'), 7)
+        self.assertAlmostEqual(parse_retry_after(formatdate(now + 30, usegmt=True), now=now), 30, delta=1)
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after('amanha'))
+
+    def test_parse_quota_headers(self):
+        """Testa o teto de taxa e a pausa quando a cota acaba"""
+        ceiling, pause_until = parse_quota_headers(
+            {'X-RateLimit-Limit-Minute': '10', 'X-RateLimit-Limit-Day': '4000', 'X-RateLimit-Remaining-Minute': '0'},
+            now=1000.0
+        )
+
+        self.assertAlmostEqual(ceiling, 4000 / 86400)
+        self.assertEqual(pause_until, 1060.0)
+
+    def test_daily_quota_waits_for_reset_or_fails(self):
+        """Testa que a cota diaria esgotada pausa ate o reset informado e, sem ele, falha"""
+        _, pause_until = parse_quota_headers(
+            {'X-RateLimit-Remaining-Day': '0', 'X-RateLimit-Reset-Day': '300'}, now=1000.0
+        )
+        self.assertEqual(pause_until, 1300.0)
+
+        with self.assertRaises(QuotaExhaustedError):
+            parse_quota_headers({'X-RateLimit-Remaining-Day': '0'}, now=1000.0)
+        limiter = RateLimiter(max_rate=10)
+        with self.assertRaises(QuotaExhaustedError):
+            limiter.record_success({'X-RateLimit-Remaining-Day': '0'})
+        self.assertEqual(limiter.reserve(), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import tempfile
+import unittest
+from src.infrastructure.cache.response_cache import ResponseCache
+
+class TestResponseCache(unittest.TestCase):
+    URL = 'https://api.example.com/articlesearch.json'
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, 'responses.sqlite')
+        self.cache = ResponseCache(self.db_path, ttl_seconds=60, max_bytes=1024)
+
+    def tearDown(self):
+        self.cache.close()
+        self.temp_dir.cleanup()
+
+    def test_key_ignores_api_key_and_param_order(self):
+        """Testa que a chave nao depende da api-key nem da ordem dos parametros"""
+        self.cache.set(self.URL, {'api-key': 'a', 'q': 'trump', 'page': 0}, b'{"ok": true}')
+
+        self.assertEqual(self.cache.get(self.URL, {'page': 0, 'q': 'trump', 'api-key': 'b'}), {'ok': True})
+        self.assertIsNone(self.cache.get(self.URL, {'page': 1, 'q': 'trump'}))
+        self.assertEqual(self.cache.stats(), {'hits': 1, 'misses': 1})
+
+    def test_entries_expire_after_ttl(self):
+        """Testa o TTL por entrada"""
+        self.cache.set(self.URL, {'page': 0}, b'{}', ttl_seconds=0)
+
+        self.assertIsNone(self.cache.get(self.URL, {'page': 0}))
+
+    def test_persists_between_instances(self):
+        """Testa que as respostas sobrevivem ao fim do processo"""
+        self.cache.set(self.URL, {'page': 0}, b'[1, 2]')
+        self.cache.close()
+
+        self.cache = ResponseCache(self.db_path, ttl_seconds=60, max_bytes=1024)
+
+        self.assertEqual(self.cache.get(self.URL, {'page': 0}), [1, 2])
+
+    def test_evicts_least_recently_used_when_over_size(self):
+        """Testa o descarte LRU quando o cache passa do tamanho maximo"""
+        body = b'"' + b'x' * 400 + b'"'
+        self.cache.set(self.URL, {'page': 0}, body)
+        self.cache.set(self.URL, {'page': 1}, body)
+        self.cache.get(self.URL, {'page': 0})
+        self.cache.set(self.URL, {'page': 2}, body)
+
+        self.assertIsNotNone(self.cache.get(self.URL, {'page': 0}))
+        self.assertIsNone(self.cache.get(self.URL, {'page': 1}))
+        self.assertIsNotNone(self.cache.get(self.URL, {'page': 2}))
+
+if __name__ == '__main__':
+    unittest.main()
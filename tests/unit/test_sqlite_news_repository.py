@@ -0,0 +1,91 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from src.domain.entities.news import News
+from src.domain.services.news_analyzer import NewsAnalyzer
+from src.infrastructure.clients.image_downloader import ImageDownloader
+from src.infrastructure.repositories.repository_factory import create_news_repository
+from src.infrastructure.repositories.sqlite_news_repository import SqliteNewsRepository, SqliteNewsStore
+
+def make_news(title, description, day, article_id=None):
+    return News(title, datetime(2024, 1, day, tzinfo=timezone.utc), description, '', '', 0, False,
+                article_id=f'id-{day}' if article_id is None else article_id)
+
+ARTICLES = [
+    make_news('Eleição nos EUA', 'Trump arrecada US$ 10,5 milhões', 1),
+    make_news('Mercado de ações', 'Investidores reagem ao Fed; trumpete na orquestra', 2),
+    make_news('Clima extremo', 'Ondas de calor batem recordes', 3),
+    make_news('Sem id', 'Trump e Biden debatem', 4, article_id=''),
+]
+
+class TestSqliteNewsRepository(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.images_dir = os.path.join(self.temp_dir.name, 'images')
+        self.downloader = ImageDownloader(self.images_dir, max_workers=2)
+        self.db_path = os.path.join(self.temp_dir.name, 'acervo.sqlite')
+        self.repository = SqliteNewsRepository(self.db_path, self.images_dir, self.downloader, batch_size=2)
+
+    def tearDown(self):
+        self.downloader.close()
+        self.temp_dir.cleanup()
+
+    def test_reanalyze_matches_the_analyzer(self):
+        """Testa que a reanalise local da as mesmas contagens do NewsAnalyzer, mais recentes primeiro"""
+        self.repository.save_news(ARTICLES)
+
+        with self.repository.store() as store:
+            results = store.reanalyze('TRUMP', extra_phrases=['biden'])
+
+        analyzer = NewsAnalyzer('TRUMP', ['biden'])
+        self.assertEqual([news.title for news in results], ['Sem id', 'Mercado de ações', 'Eleição nos EUA'])
+        for news in results:
+            self.assertEqual((news.search_phrase_count, news.has_money, news.phrase_counts),
+                             analyzer.analyze_with_phrases(news.title, news.description))
+        self.assertTrue(results[2].has_money)
+        self.assertEqual(results[0].date, datetime(2024, 1, 4, tzinfo=timezone.utc))
+
+    def test_reanalyze_filters_and_short_phrases(self):
+        """Testa o filtro por periodo, o limite e frases curtas (sem indice trigram)"""
+        self.repository.save_news(ARTICLES)
+
+        with SqliteNewsStore(self.db_path) as store:
+            january_2 = store.reanalyze('trump', since=datetime(2024, 1, 2, tzinfo=timezone.utc),
+                                        until=datetime(2024, 1, 3, tzinfo=timezone.utc))
+            everything = store.reanalyze('calor', only_matches=False, limit=3)
+            short = store.reanalyze('eu')
+
+        self.assertEqual([news.title for news in january_2], ['Mercado de ações'])
+        self.assertEqual([news.search_phrase_count for news in everything], [0, 1, 0])
+        self.assertEqual([news.title for news in short], ['Eleição nos EUA'])
+
+    def test_period_filter_compares_dates_in_utc(self):
+        """Testa o filtro por periodo com datas em fusos diferentes e limites sem fuso (tratados como UTC)"""
+        self.repository.save_news([
+            News('Trump em Nova York', datetime(2024, 1, 2, 1, tzinfo=timezone(timedelta(hours=-5))), '', '', '',
+                 0, False, article_id='ny'),
+            News('Trump em Karachi', datetime(2024, 1, 2, 4, tzinfo=timezone(timedelta(hours=5))), '', '', '',
+                 0, False, article_id='khi'),
+        ])
+
+        with self.repository.store() as store:
+            results = store.reanalyze('trump', since=datetime(2024, 1, 2), until=datetime(2024, 1, 3))
+
+        self.assertEqual([news.title for news in results], ['Trump em Nova York'])
+        self.assertEqual(results[0].date, datetime(2024, 1, 2, 6, tzinfo=timezone.utc))
+
+    def test_store_accumulates_and_updates_changed_articles(self):
+        """Testa que novas execucoes acrescentam ao acervo e atualizam o indice de artigos alterados"""
+        self.repository.save_news(ARTICLES[:2])
+        repository = create_news_repository(['sqlite'], os.path.join(self.temp_dir.name, 'acervo.xlsx'),
+                                            self.images_dir, self.downloader)
+        repository.save_news([make_news('Mercado de ações', 'Petróleo dispara', 2), ARTICLES[2]])
+
+        with self.repository.store() as store:
+            self.assertEqual(store.count(), 3)
+            self.assertEqual([news.title for news in store.reanalyze('petroleo')], ['Mercado de ações'])
+            self.assertEqual(store.reanalyze('trumpete'), [])
+
+if __name__ == '__main__':
+    unittest.main()
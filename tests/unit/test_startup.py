@@ -0,0 +1,61 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Pacotes de I/O que nao devem ser carregados no import do main nem no --check-config
+HEAVY_PACKAGES = {'requests', 'urllib3', 'tenacity', 'openpyxl', 'bs4', 'pyarrow'}
+
+def run_python(args, env=None):
+    """Roda um interpretador novo com -X importtime e devolve (processo, pacotes importados)."""
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', *args],
+        cwd=PROJECT_ROOT, env={**os.environ, 'PYTHONPATH': PROJECT_ROOT, **(env or {})},
+        capture_output=True, text=True, timeout=60
+    )
+    imported = set()
+    for line in process.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            imported.add(line.rsplit('|', 1)[1].strip().split('.')[0])
+    return process, imported
+
+
+class TestStartup(unittest.TestCase):
+    def test_importing_main_skips_io_stack(self):
+        """Testa que importar o main nao carrega requests, openpyxl, tenacity etc."""
+        process, imported = run_python(['-c', 'import main'])
+
+        self.assertEqual(process.returncode, 0, process.stderr[-2000:])
+        self.assertEqual(imported & HEAVY_PACKAGES, set())
+
+    def test_importing_logger_has_no_side_effects(self):
+        """Testa que o import do logger nao cria o diretorio de logs; setup_logger cria"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_dir = os.path.join(temp_dir, 'logs')
+            code = ('from src.infrastructure.logging.logger import logger, setup_logger; import os, sys; '
+                    'assert not logger.handlers and not os.path.exists(sys.argv[1]); '
+                    'setup_logger(); setup_logger(); print(len(logger.handlers), os.path.isdir(sys.argv[1]))')
+            process, _ = run_python(['-c', code, log_dir], env={'LOG_DIR': log_dir, 'LOG_ASYNC': 'true'})
+
+        self.assertEqual(process.returncode, 0, process.stderr[-2000:])
+        self.assertEqual(process.stdout.split(), ['1', 'True'])
+
+    def test_check_config(self):
+        """Testa o --check-config com configuracao valida e invalida, sem carregar o I/O"""
+        # Variaveis do ambiente tem precedencia sobre um .env local
+        valid = {'API_KEY': 'x', 'API_URL': 'http://localhost', 'SEARCH_PHRASE': 'trump', 'CATEGORIES': 'business',
+                 'OUTPUT_FORMATS': 'excel,csv', 'MONTHS_TO_SEARCH': '2', 'JOBS_FILE': ''}
+        ok, imported = run_python(['main.py', '--check-config'], env=valid)
+        invalid, _ = run_python(['main.py', '--check-config'],
+                                env={**valid, 'OUTPUT_FORMATS': 'xml', 'MONTHS_TO_SEARCH': 'dois'})
+
+        self.assertEqual(ok.returncode, 0, ok.stderr[-2000:])
+        self.assertEqual(imported & HEAVY_PACKAGES, set())
+        self.assertEqual(invalid.returncode, 1)
+        self.assertIn('Formatos de saida desconhecidos: xml', invalid.stderr)
+        self.assertIn('MONTHS_TO_SEARCH', invalid.stderr)
+
+if __name__ == '__main__':
+    unittest.main()
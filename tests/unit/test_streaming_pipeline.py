@@ -0,0 +1,121 @@
+import csv
+import os
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import patch
+from src.application.use_cases.fetch_news_use_case import FetchNewsUseCase
+from src.domain.entities.news import News
+from src.infrastructure.checkpoints.checkpoint_store import Checkpoint, CheckpointStore
+from src.infrastructure.clients.news_api_client import NewsAPIClient
+from src.infrastructure.clients.image_downloader import ImageDownloader
+from src.infrastructure.repositories.csv_news_repository import CsvNewsRepository, CsvNewsWriter
+
+def make_news(day):
+    return News(f'Noticia {day}', datetime(2024, 1, day, tzinfo=timezone.utc), 'Descricao', '', '', 1, False,
+                article_id=f'id-{day}')
+
+class TestStreamingPipeline(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.temp_dir.name, 'out.csv')
+        images_dir = os.path.join(self.temp_dir.name, 'images')
+        self.downloader = ImageDownloader(images_dir, max_workers=1)
+        self.repository = CsvNewsRepository(self.csv_path, images_dir, self.downloader, batch_size=2)
+        self.events = []
+
+    def tearDown(self):
+        self.downloader.close()
+        self.temp_dir.cleanup()
+
+    def _news_stream(self, days):
+        for day in days:
+            self.events.append(f'produz {day}')
+            yield make_news(day)
+
+    def _run(self, days, use_case):
+        original_write = CsvNewsWriter.write
+
+        def recording_write(writer, batch):
+            self.events.append(f'grava {len(batch)}')
+            original_write(writer, batch)
+
+        with patch('src.application.use_cases.fetch_news_use_case.NewsAPIClient') as client_class, \
+                patch.object(CsvNewsWriter, 'write', recording_write):
+            client_class.return_value.iter_news.return_value = self._news_stream(days)
+            client_class.return_value.failed_requests = 0
+            return use_case.execute('trump', ['world'], 1, incremental=use_case.checkpoint_store is not None)
+
+    def test_rows_reach_output_while_news_are_produced(self):
+        """Testa que os lotes sao gravados antes de a fonte terminar de produzir noticias"""
+        count = self._run(range(1, 21), FetchNewsUseCase(self.repository))
+
+        self.assertEqual(count, 20)
+        self.assertLess(self.events.index('grava 2'), self.events.index('produz 20'))
+        with open(self.csv_path, encoding='utf-8') as f:
+            self.assertEqual(len(list(csv.DictReader(f))), 20)
+
+    def test_failure_keeps_previous_output(self):
+        """Testa que um erro no meio do streaming descarta a saida parcial"""
+        self.repository.save_news([make_news(1)])
+
+        def failing_stream():
+            yield make_news(2)
+            raise RuntimeError('falha na API')
+
+        with patch('src.application.use_cases.fetch_news_use_case.NewsAPIClient') as client_class:
+            client_class.return_value.iter_news.return_value = failing_stream()
+            with self.assertRaises(RuntimeError):
+                FetchNewsUseCase(self.repository).execute('trump', ['world'], 1)
+
+        with open(self.csv_path, encoding='utf-8') as f:
+            self.assertEqual([row['title'] for row in csv.DictReader(f)], ['Noticia 1'])
+        self.assertEqual([name for name in os.listdir(self.temp_dir.name) if name.endswith('.tmp')], [])
+
+    def test_incremental_stream_advances_checkpoint(self):
+        """Testa que o modo incremental avanca o checkpoint a partir do streaming"""
+        store = CheckpointStore(os.path.join(self.temp_dir.name, 'checkpoints.json'))
+
+        self._run([3, 4], FetchNewsUseCase(self.repository, store))
+
+        checkpoint = store.load(CheckpointStore.make_key('trump', ['world']))
+        self.assertEqual(checkpoint.high_water_mark, datetime(2024, 1, 4, tzinfo=timezone.utc))
+        self.assertEqual(checkpoint.seen_ids, {'id-4'})
+
+    def test_failed_page_keeps_checkpoint_and_output(self):
+        """Testa que uma pagina perdida (mesmo apos as retentativas) nao avanca o checkpoint"""
+        store = CheckpointStore(os.path.join(self.temp_dir.name, 'checkpoints.json'))
+        previous = Checkpoint(datetime(2024, 1, 1, tzinfo=timezone.utc), {'id-1'})
+        key = CheckpointStore.make_key('trump', ['world'])
+        store.save(key, previous)
+        self.repository.save_news([make_news(1)])
+
+        def fake_page(params, page):
+            if page == 1:
+                raise RuntimeError('cota esgotada')
+            docs = [{'_id': f'p{page}-{i}', 'headline': {'main': f'Trump {page}-{i}'}, 'abstract': '',
+                     'pub_date': f'{datetime.now().year}-01-0{page + 2}T10:00:00+0000'} for i in range(10)]
+            return {'response': {'docs': docs, 'metadata': {'hits': 30}}}
+
+        env = {'API_KEY': 'test_key', 'RESPONSE_CACHE_PATH': '', 'API_MIN_REQUEST_INTERVAL': '0'}
+        with patch.dict(os.environ, env), patch.object(NewsAPIClient, '_fetch_page', side_effect=fake_page):
+            with self.assertRaises(RuntimeError):
+                FetchNewsUseCase(self.repository, store).execute('trump', ['world'], 1, incremental=True)
+
+        self.assertEqual(store.load(key), previous)
+        with open(self.csv_path, encoding='utf-8') as f:
+            self.assertEqual([row['title'] for row in csv.DictReader(f)], ['Noticia 1'])
+
+    def test_checkpoint_scope_keeps_jobs_apart(self):
+        """Testa que o checkpoint de um job nao adianta outro job com a mesma busca"""
+        store = CheckpointStore(os.path.join(self.temp_dir.name, 'checkpoints.json'))
+
+        self._run([3, 4], FetchNewsUseCase(self.repository, store, checkpoint_scope='diario'))
+
+        self.assertEqual(store.load(CheckpointStore.make_key('trump', ['world'], 'diario')).high_water_mark,
+                         datetime(2024, 1, 4, tzinfo=timezone.utc))
+        self.assertIsNone(store.load(CheckpointStore.make_key('trump', ['world'], 'semanal')).high_water_mark)
+        self.assertIsNone(store.load(CheckpointStore.make_key('trump', ['world'])).high_water_mark)
+
+if __name__ == '__main__':
+    unittest.main()